@@ -8,6 +8,7 @@ from .montana import (
     MontanaGWIC,
     MontanaDNRC,
     MontanaStateLibrary,
+    MontanaWarehouse,
     get_montana_clients,
 )
 from .sample_data import (
@@ -17,6 +18,7 @@ from .sample_data import (
     generate_mesonet_stations,
     generate_mesonet_observations,
     get_or_generate,
+    load_sample_data,
     clear_sample_cache,
     generate_sample_dataset,
 )
@@ -31,6 +33,7 @@ __all__ = [
     "MontanaGWIC",
     "MontanaDNRC",
     "MontanaStateLibrary",
+    "MontanaWarehouse",
     "get_montana_clients",
     # Sample Data Generation
     "generate_usgs_sites",
@@ -39,6 +42,7 @@ __all__ = [
     "generate_mesonet_stations",
     "generate_mesonet_observations",
     "get_or_generate",
+    "load_sample_data",
     "clear_sample_cache",
     "generate_sample_dataset",
 ]
@@ -5,11 +5,15 @@ Documentation: https://www.epa.gov/waterdata/water-quality-data-wqp
 Uses the Water Quality Portal (WQP) which aggregates data from EPA, USGS, and states.
 """
 
-import requests
+import numpy as np
 import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
-from io import StringIO
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .http_utils import create_session, is_cached_session, iter_json_items, read_csv_response
 
 
 class EPAWaterQuality:
@@ -30,10 +34,39 @@ class EPAWaterQuality:
         "lead": "Lead",
         "mercury": "Mercury",
     }
+    _CHAR_LOOKUP = {k.lower(): v for k, v in CHARACTERISTICS.items()}
+
+    # Low-cardinality result columns stored as categoricals
+    DTYPE_MAP = {
+        "OrganizationIdentifier": "category",
+        "CharacteristicName": "category",
+        "ResultMeasure/MeasureUnitCode": "category",
+    }
+
+    # Dtypes for results spilled to Parquet chunk by chunk: every other
+    # column is read as text, so a column that is empty in one chunk and
+    # populated in the next keeps a single Parquet type
+    SPILL_DTYPE_MAP = defaultdict(lambda: "string", DTYPE_MAP)
 
-    def __init__(self):
-        """Initialize EPA WQP client."""
-        self.session = requests.Session()
+    # Output types supported by get_results
+    RETURN_TYPES = ("pandas", "arrow", "polars")
+
+    # Supported tabular response formats and their delimiters
+    DELIMITERS = {"csv": ",", "tsv": "\t"}
+
+    # The characteristic code list is effectively static
+    CODES_CACHE_EXPIRE = 7 * 24 * 3600
+
+    def __init__(self, cache_name: Optional[str] = None):
+        """
+        Initialize EPA WQP client.
+
+        Args:
+            cache_name: Path of an on-disk HTTP response cache
+                (e.g. '.geo_toolkit_http_cache'). None disables caching.
+        """
+        self.session = create_session(cache_name)
+        self._characteristics = None
 
     def get_stations(
         self,
@@ -42,6 +75,7 @@ class EPAWaterQuality:
         bbox: Optional[tuple] = None,
         site_type: Optional[str] = None,
         organization: Optional[str] = None,
+        response_format: str = "csv",
     ) -> pd.DataFrame:
         """
         Get monitoring station information.
@@ -52,37 +86,33 @@ class EPAWaterQuality:
             bbox: Bounding box as (west, south, east, north)
             site_type: Site type (e.g., 'Well', 'Stream', 'Lake')
             organization: Organization identifier
+            response_format: 'csv' or 'tsv'. TSV is cheaper to tokenize
+                (single-character delimiter, no quoting), which helps on
+                large downloads.
 
         Returns:
             DataFrame with station information
         """
-        params = {
-            "mimeType": "csv",
-            "zip": "no",
-        }
+        filters = (
+            ("statecode", self._format_state_code(state_code)),
+            ("huc", huc),
+            ("bBox", f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}" if bbox else None),
+            ("siteType", site_type),
+            ("organization", organization),
+        )
+        sep = self._delimiter(response_format)
+        params = {"mimeType": response_format, "zip": "no", **{k: v for k, v in filters if v}}
 
-        if state_code:
-            # WQP uses format 'US:CO' for states
-            if ":" not in state_code:
-                state_code = f"US:{state_code}"
-            params["statecode"] = state_code
-        if huc:
-            params["huc"] = huc
-        if bbox:
-            params["bBox"] = ",".join(map(str, bbox))
-        if site_type:
-            params["siteType"] = site_type
-        if organization:
-            params["organization"] = organization
-
-        response = self.session.get(
+        with self.session.get(
             f"{self.BASE_URL}/data/Station/search",
             params=params,
             timeout=120,
-        )
-        response.raise_for_status()
-
-        return pd.read_csv(StringIO(response.text))
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            # The station list is small; the 'c' engine keeps date columns
+            # as strings, the same as chunked result reads
+            return read_csv_response(response, engine="c", sep=sep)
 
     def get_results(
         self,
@@ -93,7 +123,12 @@ class EPAWaterQuality:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         sample_media: str = "Water",
-    ) -> pd.DataFrame:
+        chunksize: Optional[int] = None,
+        response_format: str = "csv",
+        engine: Optional[str] = None,
+        return_type: str = "pandas",
+        dtype: Optional[dict] = None,
+    ):
         """
         Get water quality measurement results.
 
@@ -105,20 +140,46 @@ class EPAWaterQuality:
             start_date: Start date for results
             end_date: End date for results
             sample_media: Media type ('Water', 'Sediment', etc.)
+            chunksize: If set, return an iterator of DataFrames with at most
+                this many rows each instead of one DataFrame. Keeps memory
+                bounded for very large (e.g. statewide) pulls. The request is
+                sent when iteration starts.
+            response_format: 'csv' or 'tsv' (see get_stations)
+            engine: pd.read_csv engine. Defaults to 'pyarrow', which parses
+                on multiple threads, falling back to 'c' if pyarrow is not
+                installed. Chunked reads always use 'c'. Besides
+                ActivityStartDate (always parsed), pyarrow returns other ISO
+                date/time columns as datetime.date/time objects where 'c'
+                keeps strings.
+            return_type: 'pandas', 'arrow' (pyarrow.Table) or 'polars'
+                (polars.DataFrame). The columnar types are built directly by
+                their multi-threaded CSV readers, skipping the pandas
+                conversion; repeated code columns are dictionary-encoded.
+            dtype: Column dtypes for the pandas reader (default DTYPE_MAP).
+                A defaultdict also sets the dtype of unlisted columns.
 
         Returns:
-            DataFrame with measurement results
+            DataFrame with measurement results (of the requested
+            return_type), or an iterator of DataFrames when chunksize is given
         """
+        sep = self._delimiter(response_format)
+        if return_type not in self.RETURN_TYPES:
+            raise ValueError(
+                f"Unknown return type: {return_type}. "
+                f"Use one of: {', '.join(self.RETURN_TYPES)}"
+            )
+        if chunksize and return_type != "pandas":
+            raise ValueError("chunksize is only supported with return_type='pandas'")
+        if dtype is None:
+            dtype = self.DTYPE_MAP
         params = {
-            "mimeType": "csv",
+            "mimeType": response_format,
             "zip": "no",
             "sampleMedia": sample_media,
         }
 
         if state_code:
-            if ":" not in state_code:
-                state_code = f"US:{state_code}"
-            params["statecode"] = state_code
+            params["statecode"] = self._format_state_code(state_code)
         if huc:
             params["huc"] = huc
         if site_id:
@@ -126,63 +187,259 @@ class EPAWaterQuality:
         if characteristic_name:
             params["characteristicName"] = characteristic_name
         if start_date:
-            params["startDateLo"] = start_date.strftime("%m-%d-%Y")
+            params["startDateLo"] = self._fmt_date(start_date)
         if end_date:
-            params["startDateHi"] = end_date.strftime("%m-%d-%Y")
+            params["startDateHi"] = self._fmt_date(end_date)
+
+        if chunksize:
+            return self._iter_results(params, sep, chunksize, dtype)
+
+        with self._get_results_response(params) as response:
+            response.raise_for_status()
+            if return_type == "arrow":
+                return self._read_arrow(response, sep)
+            if return_type == "polars":
+                return self._read_polars(response, sep)
+            df = read_csv_response(response, engine=engine, sep=sep, dtype=dtype)
+
+        return self._parse_result_dates(df)
+
+    def _read_arrow(self, response, sep: str):
+        """Parse a streamed CSV response into a pyarrow.Table."""
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        response.raw.decode_content = True
+        return pacsv.read_csv(
+            response.raw,
+            parse_options=pacsv.ParseOptions(delimiter=sep),
+            convert_options=pacsv.ConvertOptions(
+                column_types={col: pa.dictionary(pa.int32(), pa.string()) for col in self.DTYPE_MAP},
+            ),
+        )
 
-        response = self.session.get(
+    def _read_polars(self, response, sep: str):
+        """Parse a streamed CSV response into a polars.DataFrame."""
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError("return_type='polars' requires polars: conda install polars")
+
+        response.raw.decode_content = True
+        return pl.read_csv(
+            response.raw,
+            separator=sep,
+            try_parse_dates=True,
+            schema_overrides={col: pl.Categorical for col in self.DTYPE_MAP},
+        )
+
+    def _iter_results(
+        self,
+        params: dict,
+        sep: str,
+        chunksize: int,
+        dtype: dict,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield result chunks parsed incrementally from one streamed response."""
+        with self._get_results_response(params) as response:
+            response.raise_for_status()
+            with read_csv_response(response, sep=sep, dtype=dtype, chunksize=chunksize) as reader:
+                for chunk in reader:
+                    yield self._parse_result_dates(chunk)
+
+    def _get_results_response(self, params: dict):
+        """Issue a streamed Result/search request."""
+        return self.session.get(
             f"{self.BASE_URL}/data/Result/search",
             params=params,
             timeout=300,  # WQP can be slow
+            stream=True,
         )
-        response.raise_for_status()
 
-        df = pd.read_csv(StringIO(response.text))
-
-        # Parse dates if present
+    @staticmethod
+    def _parse_result_dates(df: pd.DataFrame) -> pd.DataFrame:
+        """Parse ActivityStartDate as datetime if present."""
         if "ActivityStartDate" in df.columns:
-            df["ActivityStartDate"] = pd.to_datetime(df["ActivityStartDate"], errors="coerce")
-
+            df["ActivityStartDate"] = pd.to_datetime(
+                df["ActivityStartDate"], format="%Y-%m-%d", errors="coerce", cache=True
+            )
         return df
 
+    @classmethod
+    def _delimiter(cls, response_format: str) -> str:
+        """Return the column delimiter for a response format."""
+        if response_format not in cls.DELIMITERS:
+            raise ValueError(
+                f"Unknown response format: {response_format}. "
+                f"Use one of: {', '.join(cls.DELIMITERS)}"
+            )
+        return cls.DELIMITERS[response_format]
+
+    @staticmethod
+    def _fmt_date(d: datetime) -> str:
+        """Format a date as WQP's MM-DD-YYYY without going through strftime."""
+        return f"{d.month:02d}-{d.day:02d}-{d.year:04d}"
+
+    @staticmethod
+    def _format_state_code(state_code: Optional[str]) -> Optional[str]:
+        """Convert a state code to WQP's 'US:CO' form."""
+        if state_code and ":" not in state_code:
+            return f"US:{state_code}"
+        return state_code
+
     def get_colorado_basin_results(
         self,
         characteristic: str = "ph",
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> pd.DataFrame:
+        output_dir: Optional[Path] = None,
+        chunksize: int = 200_000,
+        return_type: str = "pandas",
+    ):
         """
         Get water quality data for Colorado River Basin.
 
         Args:
-            characteristic: Key from CHARACTERISTICS dict or full name
+            characteristic: Key from CHARACTERISTICS dict (case-insensitive) or full name
             start_date: Start date
             end_date: End date
+            output_dir: If set, stream each basin's results to
+                '<output_dir>/<basin>.parquet' chunk by chunk instead of
+                building the combined DataFrame in memory. Columns outside
+                DTYPE_MAP are stored as strings (ActivityStartDate as a
+                timestamp) so every chunk shares one schema.
+            chunksize: Rows per chunk when writing to output_dir
+            return_type: 'pandas' or 'arrow'. With 'arrow' the two basin
+                tables are combined without copying their data and the
+                basin column is dictionary-encoded.
 
         Returns:
-            DataFrame with results
+            DataFrame (or pyarrow.Table) with results, or a lazy
+            pyarrow.dataset.Dataset over the written Parquet files when
+            output_dir is given (use .to_table(filter=...) for pushdown, or
+            .to_table().to_pandas())
         """
-        char_name = self.CHARACTERISTICS.get(characteristic, characteristic)
+        if return_type not in ("pandas", "arrow"):
+            raise ValueError(f"Unknown return type: {return_type}. Use 'pandas' or 'arrow'")
+
+        char_name = self._CHAR_LOOKUP.get(characteristic.lower(), characteristic)
+
+        # Upper (HUC 14) and lower (HUC 15) Colorado regions are independent,
+        # so fetch them concurrently; wall time becomes the slower of the two.
+        basins = {"upper_colorado": "14", "lower_colorado": "15"}
+        query = {
+            "characteristic_name": char_name,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
 
-        # Upper Colorado HUC region
-        upper = self.get_results(
-            huc="14",
-            characteristic_name=char_name,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        upper["basin"] = "upper_colorado"
-
-        # Lower Colorado HUC region
-        lower = self.get_results(
-            huc="15",
-            characteristic_name=char_name,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        lower["basin"] = "lower_colorado"
+        if output_dir is not None:
+            import pyarrow.dataset as ds
+
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=len(basins)) as executor:
+                futures = [
+                    executor.submit(
+                        self._write_results_parquet,
+                        output_dir / f"{basin}.parquet",
+                        basin,
+                        chunksize,
+                        huc=huc,
+                        **query,
+                    )
+                    for basin, huc in basins.items()
+                ]
+                paths = [f.result() for f in futures]
+
+            return ds.dataset([str(p) for p in paths if p is not None], format="parquet")
+
+        with ThreadPoolExecutor(max_workers=len(basins)) as executor:
+            futures = {
+                basin: executor.submit(
+                    self.get_results,
+                    huc=huc,
+                    return_type=return_type,
+                    **query,
+                )
+                for basin, huc in basins.items()
+            }
+            results = {basin: future.result() for basin, future in futures.items()}
+
+        if return_type == "arrow":
+            return self._concat_basin_tables(results)
+
+        frames = []
+        for basin, df in results.items():
+            df["basin"] = basin
+            frames.append(df)
+
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _concat_basin_tables(tables: dict):
+        """
+        Concatenate per-basin pyarrow Tables and add a dictionary-encoded basin column.
+
+        concat_tables only chains the existing column chunks, so no row data
+        is copied.
+        """
+        import pyarrow as pa
 
-        return pd.concat([upper, lower], ignore_index=True)
+        basin_names = pa.array(list(tables), pa.string())
+        labelled = []
+        for code, table in enumerate(tables.values()):
+            basin = pa.DictionaryArray.from_arrays(
+                pa.array(np.full(table.num_rows, code, dtype=np.int8)),
+                basin_names,
+            )
+            labelled.append(table.append_column("basin", basin))
+
+        return pa.concat_tables(labelled, promote_options="permissive")
+
+    def _write_results_parquet(
+        self,
+        path: Path,
+        basin: str,
+        chunksize: int,
+        **query,
+    ) -> Optional[Path]:
+        """
+        Stream chunked results for one basin into a single Parquet file.
+
+        Returns:
+            Path to the written file, or None if the query returned no rows
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for chunk in self.get_results(chunksize=chunksize, dtype=self.SPILL_DTYPE_MAP, **query):
+                chunk["basin"] = basin
+                if writer is None:
+                    schema = pa.Table.from_pandas(chunk, preserve_index=False).schema
+                    # Later chunks may have more categories than fit in the
+                    # narrow index type inferred from the first one, and a
+                    # code column that is empty in the first chunk has no
+                    # value type to infer
+                    schema = pa.schema(
+                        [
+                            pa.field(f.name, pa.dictionary(pa.int32(), pa.string()))
+                            if pa.types.is_dictionary(f.type) else f
+                            for f in schema
+                        ],
+                        metadata=schema.metadata,
+                    )
+                    writer = pq.ParquetWriter(path, schema)
+                writer.write_table(
+                    pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+                )
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return path if writer is not None else None
 
     def search_characteristics(self, keyword: str) -> list[str]:
         """
@@ -194,19 +451,44 @@ class EPAWaterQuality:
         Returns:
             List of matching characteristic names
         """
-        # Get list of all characteristics from WQP
-        response = self.session.get(
-            f"{self.BASE_URL}/Codes/characteristicname",
-            params={"mimeType": "json"},
-        )
-        response.raise_for_status()
+        keyword_lower = keyword.lower()
+        return [name for lowered, name in self._all_characteristics() if keyword_lower in lowered]
 
-        data = response.json()
-        all_chars = [item.get("value", "") for item in data.get("codes", [])]
+    def _all_characteristics(self) -> tuple[tuple[str, str], ...]:
+        """
+        Get the WQP characteristic code list as (lowercased, name) pairs.
 
-        # Filter by keyword
-        keyword_lower = keyword.lower()
-        return [c for c in all_chars if keyword_lower in c.lower()]
+        The list is effectively static, so it is downloaded once per client
+        and reused by every search.
+        """
+        if self._characteristics is None:
+            cache_kwargs = {}
+            if is_cached_session(self.session):
+                cache_kwargs["expire_after"] = self.CODES_CACHE_EXPIRE
+
+            with self.session.get(
+                f"{self.BASE_URL}/Codes/characteristicname",
+                params={"mimeType": "json"},
+                stream=True,
+                **cache_kwargs,
+            ) as response:
+                response.raise_for_status()
+                self._characteristics = tuple(
+                    (name.lower(), name) for name in self._iter_code_values(response)
+                )
+
+        return self._characteristics
+
+    @staticmethod
+    def _iter_code_values(response) -> Iterator[str]:
+        """
+        Iterate the 'value' of each entry in a WQP code list response.
+
+        With ijson installed the body is parsed incrementally from the
+        socket, so only the names (not the full list of code dicts) are
+        ever held in memory.
+        """
+        return iter_json_items(response, "codes.item.value")
 
 
 # Example usage
@@ -7,9 +7,22 @@ Use this as a template for adding new data sources.
 
 import requests
 import pandas as pd
-from typing import Optional, Any
-from urllib.parse import urljoin
-import time
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Iterator, Optional, Any
+from urllib.parse import urlencode, urljoin, urlsplit
+import math
+import warnings
+
+from .http_utils import RateLimiter, create_session, parse_json, read_csv_response
+
+
+@lru_cache(maxsize=256)
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Join an endpoint onto a base URL (cached; clients hit the same few endpoints)."""
+    return urljoin(base_url + "/", endpoint.lstrip("/"))
 
 
 class RESTClient:
@@ -23,6 +36,8 @@ class RESTClient:
         api_key_prefix: str = "Bearer",
         default_headers: Optional[dict] = None,
         rate_limit_delay: float = 0.0,
+        rate_limit_burst: int = 1,
+        cache_name: Optional[str] = None,
     ):
         """
         Initialize REST client.
@@ -34,12 +49,14 @@ class RESTClient:
             api_key_prefix: Prefix for API key value (e.g., 'Bearer', 'Api-Key')
             default_headers: Additional headers to include in all requests
             rate_limit_delay: Seconds to wait between requests
+            rate_limit_burst: Requests allowed back to back before rate_limit_delay applies
+            cache_name: Path of an on-disk HTTP response cache (None disables caching)
         """
         self.base_url = base_url.rstrip("/")
         self.rate_limit_delay = rate_limit_delay
-        self._last_request_time = 0
+        self._rate_limiter = RateLimiter(rate_limit_delay, burst=rate_limit_burst)
 
-        self.session = requests.Session()
+        self.session = create_session(cache_name)
 
         # Set up headers
         headers = {"Accept": "application/json"}
@@ -72,11 +89,11 @@ class RESTClient:
         """
         self._respect_rate_limit()
 
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        url = _join_url(self.base_url, endpoint)
         response = self.session.get(url, params=params, **kwargs)
         response.raise_for_status()
 
-        return response.json()
+        return parse_json(response)
 
     def get_dataframe(
         self,
@@ -115,6 +132,7 @@ class RESTClient:
         max_pages: Optional[int] = None,
         total_key: Optional[str] = None,
         next_url_key: Optional[str] = None,
+        max_workers: int = 8,
     ) -> pd.DataFrame:
         """
         Get paginated data from API.
@@ -123,6 +141,10 @@ class RESTClient:
         1. Page number based (page_param)
         2. Next URL based (next_url_key)
 
+        For page number based pagination with total_key, the page count is
+        known after the first response and the remaining pages are fetched
+        concurrently.
+
         Args:
             endpoint: API endpoint
             params: Query parameters
@@ -133,16 +155,21 @@ class RESTClient:
             max_pages: Maximum pages to retrieve (None for all)
             total_key: Key containing total count (for page-based)
             next_url_key: Key containing next page URL
+            max_workers: Maximum concurrent requests once the page count is known
 
         Returns:
             DataFrame with all paginated results
         """
-        params = params or {}
+        params = dict(params or {})
         params[limit_param] = limit
 
-        all_data = []
+        # Each page is converted to a columnar table as it arrives, so the
+        # JSON records never accumulate as one large list of dicts
+        tables = []
+        n_rows = 0
         page = 1
         next_url = None
+        fetch_page = self._page_fetcher(endpoint, params, page_param)
 
         while True:
             if max_pages and page > max_pages:
@@ -152,32 +179,143 @@ class RESTClient:
                 # Use next URL directly
                 response = self.session.get(next_url)
                 response.raise_for_status()
-                data = response.json()
+                data = parse_json(response)
             else:
-                params[page_param] = page
-                data = self.get(endpoint, params)
+                data = fetch_page(page)
 
             results = data.get(data_key, [])
             if not results:
                 break
 
-            all_data.extend(results)
+            tables.append(self._records_to_table(results))
+            n_rows += len(results)
 
             # Check for more pages
             if next_url_key and data.get(next_url_key):
                 next_url = data[next_url_key]
             elif total_key:
                 total = data.get(total_key, 0)
-                if len(all_data) >= total:
+                if n_rows >= total:
+                    break
+                if page == 1:
+                    # Page count is now known; size pages by what the server
+                    # actually returned in case it caps below `limit`
+                    n_pages = math.ceil(total / len(results))
+                    if max_pages:
+                        n_pages = min(n_pages, max_pages)
+                    for page_results in self._get_pages(
+                        fetch_page, range(2, n_pages + 1), data_key, max_workers
+                    ):
+                        if page_results:
+                            tables.append(self._records_to_table(page_results))
                     break
                 page += 1
             else:
-                # No pagination info, assume we got everything
+                # No pagination info: a short page normally means we got everything
                 if len(results) < limit:
-                    break
+                    if page != 1 or next_url_key or (max_pages and max_pages < 2):
+                        break
+                    # ...but a short first page may instead be a server-side
+                    # cap on page size. Probe page 2 to tell the two apart.
+                    try:
+                        probe = fetch_page(2).get(data_key, [])
+                    except requests.HTTPError:
+                        # Some servers answer an out-of-range page with 4xx
+                        probe = []
+                    if not probe or probe[0] == results[0]:
+                        # No more data, or the server ignores the page parameter
+                        break
+                    warnings.warn(
+                        f"Server returned {len(results)} rows for {limit_param}={limit}; "
+                        f"paginating with a page size of {len(results)}"
+                    )
+                    limit = len(results)
+                    tables.append(self._records_to_table(probe))
+                    n_rows += len(probe)
+                    if len(probe) < limit:
+                        break
+                    page = 2
                 page += 1
 
-        return pd.DataFrame(all_data)
+        return self._tables_to_dataframe(tables)
+
+    @staticmethod
+    def _records_to_table(records: list[dict]):
+        """
+        Convert a page of JSON records to an Arrow table (DataFrame if types are mixed).
+
+        Columns are the union of the records' keys, like pd.DataFrame(records);
+        from_pylist alone would only take the first record's keys. Pages of
+        scalars or lists are left to pandas.
+        """
+        if not all(isinstance(record, dict) for record in records):
+            return pd.DataFrame(records)
+
+        columns = dict.fromkeys(chain.from_iterable(records))
+        try:
+            if len(columns) == len(records[0]):
+                return pa.Table.from_pylist(records)
+            return pa.Table.from_pydict(
+                {col: [record.get(col) for record in records] for col in columns}
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            return pd.DataFrame(records)
+
+    @staticmethod
+    def _tables_to_dataframe(tables: list) -> pd.DataFrame:
+        """Combine per-page tables into a single DataFrame."""
+        if not tables:
+            return pd.DataFrame()
+
+        if all(isinstance(t, pa.Table) for t in tables):
+            try:
+                table = pa.concat_tables(tables, promote_options="permissive")
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+            else:
+                # Release Arrow buffers column by column while converting
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+
+        return pd.concat(
+            [t.to_pandas() if isinstance(t, pa.Table) else t for t in tables],
+            ignore_index=True,
+        )
+
+    def _page_fetcher(self, endpoint: str, params: dict, page_param: str):
+        """
+        Build a function that fetches one page of an endpoint by page number.
+
+        The request (URL, headers, auth and the constant part of the query
+        string) is prepared once; each page only appends its page number.
+        """
+        fixed_params = {k: v for k, v in params.items() if k != page_param}
+        template = self.session.prepare_request(
+            requests.Request("GET", _join_url(self.base_url, endpoint), params=fixed_params)
+        )
+        separator = "&" if urlsplit(template.url).query else "?"
+        settings = self.session.merge_environment_settings(template.url, {}, None, None, None)
+
+        def fetch(page: int) -> dict:
+            self._respect_rate_limit()
+            request = template.copy()
+            request.url = f"{template.url}{separator}{urlencode({page_param: page})}"
+            response = self.session.send(request, **settings)
+            response.raise_for_status()
+            return parse_json(response)
+
+        return fetch
+
+    @staticmethod
+    def _get_pages(fetch_page, pages: range, data_key: str, max_workers: int) -> list[list]:
+        """Fetch the given page numbers concurrently, returning results in page order."""
+        if not pages:
+            return []
+
+        def fetch(page: int) -> list:
+            return fetch_page(page).get(data_key, [])
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+            return list(executor.map(fetch, pages))
 
     def post(
         self,
@@ -200,19 +338,15 @@ class RESTClient:
         """
         self._respect_rate_limit()
 
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        url = _join_url(self.base_url, endpoint)
         response = self.session.post(url, json=json, data=data, **kwargs)
         response.raise_for_status()
 
-        return response.json()
+        return parse_json(response)
 
     def _respect_rate_limit(self):
         """Wait if needed to respect rate limit."""
-        if self.rate_limit_delay > 0:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.rate_limit_delay:
-                time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        self._rate_limiter.acquire()
 
 
 class CSVEndpointClient(RESTClient):
@@ -230,19 +364,37 @@ class CSVEndpointClient(RESTClient):
         Args:
             endpoint: API endpoint
             params: Query parameters
-            **read_csv_kwargs: Arguments passed to pd.read_csv
+            **read_csv_kwargs: Arguments passed to pd.read_csv. The engine
+                defaults to 'pyarrow' (multi-threaded) when installed and
+                the options allow it. With
+                chunksize or iterator, an iterator of DataFrames is returned
+                instead and the request is sent when iteration starts.
 
         Returns:
-            DataFrame from CSV response
+            DataFrame from CSV response, or an iterator of DataFrames when
+            chunksize or iterator is given
         """
-        self._respect_rate_limit()
+        url = _join_url(self.base_url, endpoint)
+        if read_csv_kwargs.get("chunksize") or read_csv_kwargs.get("iterator"):
+            return self._iter_csv(url, params, read_csv_kwargs)
 
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
+        self._respect_rate_limit()
+        with self.session.get(url, params=params, stream=True) as response:
+            response.raise_for_status()
+            return read_csv_response(response, **read_csv_kwargs)
 
-        from io import StringIO
-        return pd.read_csv(StringIO(response.text), **read_csv_kwargs)
+    def _iter_csv(
+        self,
+        url: str,
+        params: Optional[dict],
+        read_csv_kwargs: dict,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield CSV chunks parsed incrementally while the streamed response stays open."""
+        self._respect_rate_limit()
+        with self.session.get(url, params=params, stream=True) as response:
+            response.raise_for_status()
+            with read_csv_response(response, **read_csv_kwargs) as reader:
+                yield from reader
 
 
 # Example: Creating a client for a hypothetical state water API
@@ -0,0 +1,303 @@
+"""
+HTTP Session Utilities
+
+Shared helpers for building the requests sessions used by the API clients
+and decoding their responses.
+"""
+
+import json
+import threading
+import time
+import pandas as pd
+import requests
+from io import BytesIO, TextIOWrapper
+from requests.adapters import HTTPAdapter
+from typing import Any, Iterator, Optional
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Default lifetime of cached responses, in seconds
+DEFAULT_CACHE_EXPIRE = 3600
+
+# Connections kept open per host; sized for the threaded fetchers
+DEFAULT_POOL_SIZE = 32
+
+# Transient gateway errors worth retrying
+RETRY_STATUSES = (502, 503, 504)
+
+# pd.read_csv options the pyarrow engine rejects
+_PYARROW_UNSUPPORTED_CSV_KWARGS = frozenset({
+    "chunksize", "iterator", "nrows", "skipfooter", "comment", "thousands",
+    "float_precision", "memory_map", "dialect", "quoting", "lineterminator",
+    "converters", "dayfirst", "skipinitialspace", "low_memory",
+})
+
+
+def create_session(
+    cache_name: Optional[str] = None,
+    expire_after: int = DEFAULT_CACHE_EXPIRE,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retries: int = 3,
+    urls_expire_after: Optional[dict] = None,
+    retry_statuses: tuple = RETRY_STATUSES,
+) -> requests.Session:
+    """
+    Create a requests session, optionally backed by an on-disk HTTP cache.
+
+    The session keeps up to `pool_size` keep-alive connections per host, so
+    concurrent workers do not wait on each other for a connection, and
+    retries transient gateway errors with jittered exponential backoff
+    (honoring Retry-After on 429 and 503 responses). It accepts
+    Brotli and zstd compressed responses when the decoders are installed.
+
+    With a cache, repeated GETs with identical parameters are answered from
+    a local SQLite file (or a Redis server, for a redis:// cache name)
+    instead of the network. Cache-Control and ETag headers from the server
+    are honored.
+
+    Args:
+        cache_name: Path of the SQLite cache file, or a redis:// URL
+            (None disables caching)
+        expire_after: Default lifetime of cached responses in seconds
+        pool_size: Maximum pooled connections per host
+        retries: Retries for connection errors and retry_statuses responses
+        urls_expire_after: Lifetimes in seconds for specific URL patterns,
+            e.g. {"example.com/api/stations": 86400}, overriding expire_after
+        retry_statuses: HTTP statuses to retry (default 502, 503, 504);
+            add 429 for APIs that throttle with it
+
+    Returns:
+        requests.Session (a requests_cache.CachedSession when caching)
+    """
+    if cache_name is None:
+        session = requests.Session()
+    else:
+        session = _create_cached_session(cache_name, expire_after, urls_expire_after)
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.3,
+            # Spread out retries from concurrent workers that failed together
+            backoff_jitter=0.3,
+            status_forcelist=retry_statuses,
+            raise_on_status=False,  # let raise_for_status() report the final error
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # Advertise every encoding urllib3 can decode here: gzip and deflate,
+    # plus br and zstd when brotli / backports.zstd are installed
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+def _create_cached_session(
+    cache_name: str,
+    expire_after: int,
+    urls_expire_after: Optional[dict] = None,
+) -> requests.Session:
+    """Create a requests_cache.CachedSession backed by SQLite or Redis."""
+    try:
+        import requests_cache
+    except ImportError:
+        raise ImportError(
+            "HTTP caching requires requests-cache: conda install requests-cache"
+        )
+
+    if cache_name.startswith(("redis://", "rediss://")):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("Redis caching requires redis-py: conda install redis-py")
+        backend = requests_cache.RedisCache(connection=redis.Redis.from_url(cache_name))
+    else:
+        backend = "sqlite"
+
+    return requests_cache.CachedSession(
+        cache_name=cache_name,
+        backend=backend,
+        expire_after=expire_after,
+        urls_expire_after=urls_expire_after,
+        cache_control=True,
+        allowable_methods=("GET",),
+    )
+
+
+def is_cached_session(session: requests.Session) -> bool:
+    """Return True if the session stores responses in an HTTP cache."""
+    return hasattr(session, "cache")
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket for spacing out requests.
+
+    Allows bursts of up to `burst` requests, then one request every
+    `min_interval` seconds. Each caller reserves its slot under a lock and
+    sleeps outside it, so concurrent workers wait only for their own slot
+    instead of queueing behind each other's sleeps.
+    """
+
+    def __init__(self, min_interval: float = 0.0, burst: int = 1):
+        """
+        Initialize rate limiter.
+
+        Args:
+            min_interval: Seconds between requests once the burst is spent
+                (0 disables limiting)
+            burst: Number of requests allowed back to back
+        """
+        self.min_interval = min_interval
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        if self.min_interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            wait = slot - (self.burst - 1) * self.min_interval - now
+            self._next_slot = slot + self.min_interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body.
+
+    Uses orjson when installed, which parses the raw bytes directly and is
+    several times faster than the standard library on large payloads.
+
+    Args:
+        response: Response whose body is JSON
+
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def iter_json_items(response: requests.Response, prefix: str) -> Iterator[Any]:
+    """
+    Iterate the values at a path in a JSON response body.
+
+    With ijson installed, a streamed (stream=True) body is parsed
+    incrementally from the socket, so neither the raw body nor the full
+    decoded document is held in memory at once. Without ijson the body is
+    decoded with parse_json and walked.
+
+    Args:
+        response: Response whose body is JSON
+        prefix: ijson path, e.g. 'features.item' for each element of the
+            top-level 'features' list
+
+    Returns:
+        Iterator over the matching values
+    """
+    try:
+        import ijson
+    except ImportError:
+        return _walk_json(parse_json(response), prefix.split("."))
+
+    if getattr(response, "from_cache", False) or response.raw is None:
+        # Body already in memory (e.g. replayed from the HTTP cache, whose raw
+        # stream does not support ijson's read(0) probe)
+        return ijson.items(BytesIO(response.content), prefix, use_float=True)
+
+    response.raw.decode_content = True
+    return ijson.items(response.raw, prefix, use_float=True)
+
+
+def _walk_json(value: Any, keys: list[str]) -> Iterator[Any]:
+    """Yield the values at an ijson-style path in a decoded JSON document."""
+    if not keys:
+        yield value
+        return
+
+    key, rest = keys[0], keys[1:]
+    if key == "item":
+        if isinstance(value, list):
+            for item in value:
+                yield from _walk_json(item, rest)
+    elif isinstance(value, dict) and key in value:
+        yield from _walk_json(value[key], rest)
+
+
+def default_csv_engine() -> str:
+    """Return 'pyarrow' (multi-threaded parser) if installed, else 'c'."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "c"
+    return "pyarrow"
+
+
+def read_csv_response(
+    response: requests.Response,
+    engine: Optional[str] = None,
+    **read_csv_kwargs,
+):
+    """
+    Parse a streamed (stream=True) CSV response with pandas.
+
+    The raw socket stream is handed to pd.read_csv, so the body is never
+    buffered as a Python string. Content-Encoding (gzip) is decoded on the
+    fly.
+
+    Note that the pyarrow engine infers ISO date and time columns, returning
+    them as datetime.date / datetime.time objects, where the 'c' engine
+    leaves them as strings.
+
+    Args:
+        response: Response requested with stream=True
+        engine: pd.read_csv engine (default: 'pyarrow' if installed, else 'c').
+            Without an explicit engine, options the pyarrow engine does not
+            support (nrows, skipfooter, a callable skiprows, ...) leave the
+            choice to pandas ('c', or 'python' where 'c' cannot handle them).
+            Chunked reads always use 'c'.
+        **read_csv_kwargs: Arguments passed to pd.read_csv
+
+    Returns:
+        DataFrame, or a TextFileReader when chunksize is given
+    """
+    response.raw.decode_content = True
+    source = response.raw
+
+    if read_csv_kwargs.get("chunksize"):
+        engine = "c"
+    elif engine is None:
+        if _pyarrow_unsupported(read_csv_kwargs):
+            # pandas may pick the python engine, which needs a text stream;
+            # keep urllib3 from closing the raw stream under the wrapper at EOF
+            source.auto_close = False
+            source = TextIOWrapper(source, encoding=read_csv_kwargs.pop("encoding", None) or "utf-8")
+        else:
+            engine = default_csv_engine()
+
+    return pd.read_csv(source, engine=engine, **read_csv_kwargs)
+
+
+def _pyarrow_unsupported(read_csv_kwargs: dict) -> bool:
+    """Return True if pd.read_csv options rule out the pyarrow engine."""
+    if _PYARROW_UNSUPPORTED_CSV_KWARGS.intersection(read_csv_kwargs):
+        return True
+    skiprows = read_csv_kwargs.get("skiprows")
+    return skiprows is not None and not isinstance(skiprows, int)
@@ -17,14 +17,245 @@ Data sources for Montana climate, water, and groundwater information:
 """
 
 import requests
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import wraps
+from pathlib import Path
 from typing import Optional, Union
-from io import StringIO
+from io import BytesIO, StringIO
+import hashlib
+import inspect
+import json
+import time
 import warnings
 
+from .http_utils import create_session, is_cached_session, iter_json_items, parse_json
 
-class MontanaMesonet:
+# Cache lifetimes (seconds) for the optional on-disk HTTP cache
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+class _MontanaClient:
+    """
+    Base for the Montana clients: session setup and HTTP cache management.
+
+    Sessions keep a pool of keep-alive connections (see create_session).
+    Clients can be used as context managers to close it when done.
+
+    Caching is enabled by passing a cache name. Responses then expire after
+    CACHE_EXPIRE seconds, except URLs matching a pattern in
+    CACHE_EXPIRE_URLS, which use their own lifetime (e.g. slowly changing
+    station catalogs are kept longer than the latest observations).
+
+    With a cache_dir, the DataFrames returned by the query methods are also
+    saved as Parquet files and reloaded on repeat calls, which skips both
+    the request and the JSON decoding.
+    """
+
+    CACHE_EXPIRE = 6 * HOUR
+    CACHE_EXPIRE_URLS: dict = {}
+
+    def __init__(
+        self,
+        cache_name: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            cache_name: Path of an on-disk HTTP response cache, or a redis://
+                URL (None disables caching)
+            cache_dir: Directory for Parquet copies of returned DataFrames
+                (None disables them)
+        """
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
+        self.session = create_session(
+            cache_name,
+            expire_after=self.CACHE_EXPIRE,
+            urls_expire_after=self.CACHE_EXPIRE_URLS or None,
+        )
+
+    def close(self):
+        """Close the session and release its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def clear_cache(self):
+        """Remove all cached responses and this client's cached Parquet files."""
+        if is_cached_session(self.session):
+            self.session.cache.clear()
+
+        if self.cache_dir is not None:
+            for name in dir(type(self)):
+                if getattr(getattr(type(self), name), "parquet_cached", False):
+                    for path in self.cache_dir.glob(f"{name}_*.parquet"):
+                        path.unlink()
+
+    def cache_info(self) -> dict:
+        """
+        Describe the HTTP cache.
+
+        Returns:
+            Dict with 'enabled', 'backend' and 'responses' (number of cached
+            responses); only 'enabled' if caching is disabled
+        """
+        if not is_cached_session(self.session):
+            return {"enabled": False}
+
+        return {
+            "enabled": True,
+            "backend": type(self.session.cache).__name__,
+            "responses": len(self.session.cache.responses),
+        }
+
+
+def _fmt(d: Union[date, datetime]) -> str:
+    """Format a date or datetime as YYYY-MM-DD."""
+    return (d.date() if isinstance(d, datetime) else d).isoformat()
+
+
+def _url_pattern(url: str) -> str:
+    """Strip the scheme from a URL for use as a cache expiration pattern."""
+    return url.split("://", 1)[-1]
+
+
+# ArcGIS field types gathered straight into float64 arrays
+_ARCGIS_FLOAT_TYPES = frozenset({"esriFieldTypeDouble", "esriFieldTypeSingle"})
+
+
+def _arcgis_features_to_df(features: list, fields: Optional[list] = None) -> pd.DataFrame:
+    """
+    Build a DataFrame from ArcGIS JSON features, one column at a time.
+
+    Each attribute is gathered into its own column (a float64 array for
+    double fields) instead of building a dict per row for pandas to pivot.
+    Point geometries become longitude/latitude columns; other geometry
+    (polygon rings, line paths) is dropped.
+
+    Args:
+        features: The 'features' list of an ArcGIS query response
+        fields: The layer's field definitions ('fields' of the layer
+            metadata), used for column types and for the columns of an
+            empty result
+
+    Returns:
+        DataFrame with one row per feature
+    """
+    fields = fields or []
+    float_fields = {f["name"] for f in fields if f.get("type") in _ARCGIS_FLOAT_TYPES}
+
+    attributes = [feature.get("attributes") or {} for feature in features]
+    names = list(attributes[0]) if attributes else [f["name"] for f in fields]
+
+    columns = {}
+    for name in names:
+        values = [attrs.get(name) for attrs in attributes]
+        columns[name] = np.array(values, dtype=np.float64) if name in float_fields else values
+
+    geometries = [feature.get("geometry") or {} for feature in features]
+    if any("x" in geometry for geometry in geometries):
+        columns["longitude"] = np.array([g.get("x") for g in geometries], dtype=np.float64)
+        columns["latitude"] = np.array([g.get("y") for g in geometries], dtype=np.float64)
+
+    return pd.DataFrame(columns)
+
+
+# Coordinates keep full float64 precision when other floats are downcast
+_COORDINATE_COLUMNS = frozenset({"latitude", "longitude"})
+
+
+def _optimize_dtypes(df: pd.DataFrame, categorical_cols: tuple = ()) -> pd.DataFrame:
+    """
+    Shrink a DataFrame's int64/float64/object columns to compact dtypes.
+
+    Integers and floats are downcast to the smallest type that holds them
+    (coordinates stay float64) and the given low-cardinality string columns
+    become categoricals.
+
+    Args:
+        df: DataFrame to convert
+        categorical_cols: Columns to store as category (missing ones are skipped)
+
+    Returns:
+        The DataFrame with converted columns
+    """
+    for col in df.select_dtypes("integer"):
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes("float"):
+        if col not in _COORDINATE_COLUMNS:
+            df[col] = pd.to_numeric(df[col], downcast="float")
+    for col in categorical_cols:
+        if col in df:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _parquet_cached(ttl: Optional[int] = None):
+    """
+    Cache a client method's DataFrame results as Parquet files.
+
+    When the client has a cache_dir, each call's result is written to
+    '{cache_dir}/{method}_{key}.parquet' (zstd-compressed), where key hashes
+    the call's arguments, and repeated calls within `ttl` seconds are read
+    back from that file instead of hitting the network. Empty results (which
+    the ArcGIS methods also return on errors) are not cached.
+
+    Args:
+        ttl: Lifetime of cached files in seconds (default: the client's
+            CACHE_EXPIRE)
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.cache_dir is None:
+                return method(self, *args, **kwargs)
+
+            call = signature.bind(self, *args, **kwargs)
+            call.apply_defaults()
+            arguments = dict(list(call.arguments.items())[1:])
+            key = hashlib.md5(
+                json.dumps(arguments, sort_keys=True, default=str).encode()
+            ).hexdigest()[:8]
+            path = self.cache_dir / f"{method.__name__}_{key}.parquet"
+
+            lifetime = ttl if ttl is not None else self.CACHE_EXPIRE
+            if path.exists() and time.time() - path.stat().st_mtime < lifetime:
+                return _read_cached_parquet(path)
+
+            df = method(self, *args, **kwargs)
+            if not df.empty:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+            return df
+
+        wrapper.parquet_cached = True
+        return wrapper
+
+    return decorator
+
+
+def _read_cached_parquet(path: Path) -> pd.DataFrame:
+    """Read a cached result, restoring GeoDataFrames written as GeoParquet."""
+    import pyarrow.parquet as pq
+
+    if b"geo" in (pq.read_schema(path).metadata or {}):
+        import geopandas as gpd
+        return gpd.read_parquet(path)
+    return pd.read_parquet(path, engine="pyarrow")
+
+
+class MontanaMesonet(_MontanaClient):
     """
     Client for Montana Mesonet API (Montana Climate Office).
 
@@ -72,11 +303,52 @@ class MontanaMesonet:
         "hydromet": "Hydrological/snow monitoring stations",
     }
 
-    def __init__(self):
-        """Initialize Montana Mesonet client."""
-        self.session = requests.Session()
+    # Stations per observation request; longer station lists are split into
+    # batches that are fetched concurrently
+    STATION_BATCH_SIZE = 25
+
+    # Supported values of the API's `type` parameter. CSV is the default:
+    # it is about half the size of JSON and parses much faster.
+    RESPONSE_FORMATS = ("csv", "json")
+
+    # Seconds a fetched station list is reused by get_stations and
+    # search_stations_by_county
+    STATIONS_TTL = HOUR
+
+    # Station lists change rarely; latest observations update every 5 minutes
+    CACHE_EXPIRE_URLS = {
+        _url_pattern(f"{BASE_URL}/stations/"): DAY,
+        _url_pattern(f"{BASE_URL}/latest/"): 4 * 60,
+    }
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        cache_name: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize Montana Mesonet client.
+
+        Args:
+            max_workers: Maximum concurrent requests when fetching many stations
+            cache_name: Path of an on-disk HTTP response cache, or a redis://
+                URL (None disables caching)
+            cache_dir: Directory for Parquet copies of returned DataFrames
+                (None disables them)
+        """
+        super().__init__(cache_name, cache_dir)
         self.session.headers.update({"Accept": "application/json"})
+        self.max_workers = max_workers
+        # Station lists by active_only flag, as (fetch time, DataFrame)
+        self._stations = {}
+
+    def clear_cache(self):
+        """Remove all cached responses, Parquet files and station lists."""
+        super().clear_cache()
+        self._stations.clear()
 
+    @_parquet_cached(ttl=DAY)
     def get_stations(
         self,
         active_only: bool = True,
@@ -92,30 +364,46 @@ class MontanaMesonet:
         Returns:
             DataFrame or GeoDataFrame with station information
         """
-        params = {"type": "json"}
-        if active_only:
-            params["active"] = "true"
-
-        response = self.session.get(f"{self.BASE_URL}/stations/", params=params)
-        response.raise_for_status()
-
-        df = pd.DataFrame(response.json())
+        # Shallow copy: callers' changes do not leak into the cached list
+        df = self._stations_cached(active_only).copy(deep=False)
 
         if as_geodataframe:
             import geopandas as gpd
-            from shapely.geometry import Point
 
-            geometry = [
-                Point(row["longitude"], row["latitude"])
-                for _, row in df.iterrows()
-            ]
+            geometry = gpd.points_from_xy(df["longitude"], df["latitude"], crs="EPSG:4326")
+            # Stations without coordinates get a missing geometry, not POINT (NaN NaN)
+            geometry[df[["longitude", "latitude"]].isna().any(axis=1).to_numpy()] = None
             return gpd.GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
 
         return df
 
+    def _stations_cached(self, active_only: bool) -> pd.DataFrame:
+        """Return the station list, fetching it at most once per STATIONS_TTL."""
+        key = bool(active_only)
+        cached = self._stations.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.STATIONS_TTL:
+            return cached[1]
+
+        df = self._fetch_stations(active_only)
+        self._stations[key] = (time.monotonic(), df)
+        return df
+
+    def _fetch_stations(self, active_only: bool) -> pd.DataFrame:
+        """Request the station list from the API."""
+        params = {"type": "json"}
+        if active_only:
+            params["active"] = "true"
+
+        response = self.session.get(f"{self.BASE_URL}/stations/", params=params)
+        response.raise_for_status()
+
+        return _optimize_dtypes(pd.DataFrame(parse_json(response)), ("county", "network"))
+
+    @_parquet_cached(ttl=4 * 60)
     def get_latest(
         self,
         stations: Optional[list[str]] = None,
+        response_format: str = "csv",
     ) -> pd.DataFrame:
         """
         Get latest observations from all or selected stations.
@@ -124,25 +412,29 @@ class MontanaMesonet:
 
         Args:
             stations: List of station identifiers (all if None)
+            response_format: 'csv' or 'json' response from the API
 
         Returns:
             DataFrame with latest observations
         """
-        params = {"type": "json"}
+        self._check_format(response_format)
+        params = {"type": response_format}
         if stations:
             params["stations"] = ",".join(stations)
 
         response = self.session.get(f"{self.BASE_URL}/latest/", params=params)
         response.raise_for_status()
 
-        return pd.DataFrame(response.json())
+        return _optimize_dtypes(self._read_response(response, response_format), ("station",))
 
+    @_parquet_cached()
     def get_hourly_observations(
         self,
         stations: list[str],
         start_date: datetime,
         end_date: Optional[datetime] = None,
         elements: Optional[list[str]] = None,
+        response_format: str = "csv",
     ) -> pd.DataFrame:
         """
         Get hourly aggregated observations.
@@ -152,40 +444,24 @@ class MontanaMesonet:
             start_date: Start date
             end_date: End date (defaults to current time)
             elements: Specific elements to retrieve (all if None)
+            response_format: 'csv' or 'json' response from the API
 
         Returns:
             DataFrame with hourly observations
         """
-        params = {
-            "type": "json",
-            "stations": ",".join(stations),
-            "start_time": start_date.strftime("%Y-%m-%d"),
-        }
-
-        if end_date:
-            params["end_time"] = end_date.strftime("%Y-%m-%d")
-        if elements:
-            params["elements"] = ",".join(elements)
-
-        response = self.session.get(
-            f"{self.BASE_URL}/observations/hourly/",
-            params=params,
+        return self._fetch_obs(
+            "observations/hourly/", stations, start_date, end_date, elements,
+            date_col="datetime", response_format=response_format,
         )
-        response.raise_for_status()
-
-        df = pd.DataFrame(response.json())
-
-        if not df.empty and "datetime" in df.columns:
-            df["datetime"] = pd.to_datetime(df["datetime"])
-
-        return df
 
+    @_parquet_cached()
     def get_daily_observations(
         self,
         stations: list[str],
         start_date: datetime,
         end_date: Optional[datetime] = None,
         elements: Optional[list[str]] = None,
+        response_format: str = "csv",
     ) -> pd.DataFrame:
         """
         Get daily aggregated observations (min, max, mean).
@@ -195,40 +471,24 @@ class MontanaMesonet:
             start_date: Start date
             end_date: End date (defaults to current day)
             elements: Specific elements to retrieve
+            response_format: 'csv' or 'json' response from the API
 
         Returns:
             DataFrame with daily observations
         """
-        params = {
-            "type": "json",
-            "stations": ",".join(stations),
-            "start_time": start_date.strftime("%Y-%m-%d"),
-        }
-
-        if end_date:
-            params["end_time"] = end_date.strftime("%Y-%m-%d")
-        if elements:
-            params["elements"] = ",".join(elements)
-
-        response = self.session.get(
-            f"{self.BASE_URL}/observations/daily/",
-            params=params,
+        return self._fetch_obs(
+            "observations/daily/", stations, start_date, end_date, elements,
+            date_col="date", response_format=response_format,
         )
-        response.raise_for_status()
-
-        df = pd.DataFrame(response.json())
-
-        if not df.empty and "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"])
-
-        return df
 
+    @_parquet_cached()
     def get_derived_metrics(
         self,
         stations: list[str],
         start_date: datetime,
         end_date: Optional[datetime] = None,
         elements: Optional[list[str]] = None,
+        response_format: str = "csv",
     ) -> pd.DataFrame:
         """
         Get derived agricultural metrics (ETo, GDD, etc.).
@@ -238,59 +498,287 @@ class MontanaMesonet:
             start_date: Start date
             end_date: End date
             elements: Metrics to retrieve (default: all available)
+            response_format: 'csv' or 'json' response from the API
 
         Returns:
             DataFrame with derived metrics
         """
+        return self._fetch_obs(
+            "derived/daily/", stations, start_date, end_date, elements,
+            date_col="date", response_format=response_format,
+        )
+
+    def _fetch_obs(
+        self,
+        endpoint: str,
+        stations: list[str],
+        start_date: datetime,
+        end_date: Optional[datetime],
+        elements: Optional[list[str]],
+        date_col: str,
+        response_format: str = "csv",
+    ) -> pd.DataFrame:
+        """
+        Fetch an observation endpoint for a list of stations.
+
+        Stations are requested in batches of STATION_BATCH_SIZE, and the
+        batches are fetched concurrently so the wait for many stations is
+        roughly that of a single request.
+
+        Args:
+            endpoint: Endpoint path relative to BASE_URL
+            stations: Station identifiers
+            start_date: Start date
+            end_date: End date (None for the endpoint's default)
+            elements: Elements to retrieve (None for all)
+            date_col: Name of the timestamp column to parse
+            response_format: 'csv' or 'json' response from the API
+
+        Returns:
+            DataFrame with the observations of all stations
+        """
+        self._check_format(response_format)
         params = {
-            "type": "json",
-            "stations": ",".join(stations),
-            "start_time": start_date.strftime("%Y-%m-%d"),
+            "type": response_format,
+            "start_time": _fmt(start_date),
         }
 
         if end_date:
-            params["end_time"] = end_date.strftime("%Y-%m-%d")
+            params["end_time"] = _fmt(end_date)
         if elements:
             params["elements"] = ",".join(elements)
 
-        response = self.session.get(
-            f"{self.BASE_URL}/derived/daily/",
-            params=params,
-        )
-        response.raise_for_status()
+        size = self.STATION_BATCH_SIZE
+        batches = [stations[i:i + size] for i in range(0, len(stations), size)] or [stations]
+
+        def fetch(batch: list[str]) -> pd.DataFrame:
+            response = self.session.get(
+                f"{self.BASE_URL}/{endpoint}",
+                params={**params, "stations": ",".join(batch)},
+            )
+            response.raise_for_status()
+            return self._read_response(response, response_format)
+
+        if len(batches) == 1:
+            df = fetch(batches[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                df = pd.concat(executor.map(fetch, batches), ignore_index=True)
+
+        if (
+            not df.empty
+            and date_col in df.columns
+            and not pd.api.types.is_datetime64_any_dtype(df[date_col])
+        ):
+            df[date_col] = pd.to_datetime(df[date_col], format="ISO8601", cache=True)
+
+        return _optimize_dtypes(df, ("station",))
+
+    @classmethod
+    def _check_format(cls, response_format: str):
+        """Raise ValueError for an unsupported response format."""
+        if response_format not in cls.RESPONSE_FORMATS:
+            raise ValueError(
+                f"Unknown response format: {response_format}. "
+                f"Use one of: {', '.join(cls.RESPONSE_FORMATS)}"
+            )
 
-        df = pd.DataFrame(response.json())
+    @staticmethod
+    def _read_response(response: requests.Response, response_format: str) -> pd.DataFrame:
+        """
+        Parse a Mesonet response body into a DataFrame.
 
-        if not df.empty and "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"])
+        CSV bodies are read with pyarrow's multi-threaded parser, which also
+        infers timestamp and date columns.
+        """
+        if response_format == "json":
+            return pd.DataFrame(parse_json(response))
 
-        return df
+        import pyarrow.csv as pacsv
+
+        if not response.content.strip():
+            return pd.DataFrame()
+        table = pacsv.read_csv(BytesIO(response.content))
+        return table.to_pandas(date_as_object=False)
 
     def search_stations_by_county(
         self,
         county: str,
         active_only: bool = True,
+        prefix: bool = False,
     ) -> pd.DataFrame:
         """
         Find stations in a specific Montana county.
 
         Args:
-            county: County name (e.g., 'Gallatin', 'Yellowstone')
+            county: County name (e.g., 'Gallatin', 'Yellowstone'), case-insensitive
             active_only: Only return active stations
+            prefix: Match counties starting with `county` instead of the exact name
 
         Returns:
             DataFrame with matching stations
         """
         stations = self.get_stations(active_only=active_only)
 
-        # Filter by county (case-insensitive)
-        county_lower = county.lower()
-        mask = stations["county"].str.lower().str.contains(county_lower, na=False)
+        # Compare against the handful of distinct county names rather than
+        # every row, then select rows by category
+        counties = stations["county"].astype("category")
+        names = counties.cat.categories.str.casefold()
+        target = county.strip().casefold()
+        matches = names.str.startswith(target) if prefix else names == target
+        mask = counties.isin(counties.cat.categories[matches])
 
         return stations[mask]
 
 
-class MontanaGWIC:
+class _ArcGISClient(_MontanaClient):
+    """
+    Base for clients backed by ArcGIS REST feature services.
+
+    ArcGIS layers cap each query at the layer's maxRecordCount. Queries are
+    therefore sized with returnCountOnly first and, when the result spans
+    several pages, the pages are requested concurrently with resultOffset.
+    """
+
+    # Page size used when a layer does not report maxRecordCount
+    DEFAULT_PAGE_SIZE = 1000
+
+    # Queries for more features than this are parsed incrementally from
+    # the socket rather than buffered and decoded in one piece
+    STREAM_THRESHOLD = 5000
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        cache_name: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize ArcGIS client.
+
+        Args:
+            max_workers: Maximum concurrent page requests per query
+            cache_name: Path of an on-disk HTTP response cache, or a redis://
+                URL (None disables caching)
+            cache_dir: Directory for Parquet copies of returned DataFrames
+                (None disables them)
+        """
+        super().__init__(cache_name, cache_dir)
+        self.max_workers = max_workers
+        self._layer_info = {}
+
+    def _get_layer_info(self, layer_url: str) -> dict:
+        """
+        Get a layer's metadata (maxRecordCount, pagination support, fields).
+
+        Fetched once per layer and kept on the instance. Returns an empty
+        dict if the metadata is unavailable.
+        """
+        if layer_url not in self._layer_info:
+            try:
+                response = self.session.get(layer_url, params={"f": "json"}, timeout=60)
+                response.raise_for_status()
+                self._layer_info[layer_url] = parse_json(response)
+            except (requests.exceptions.RequestException, ValueError):
+                return {}
+        return self._layer_info[layer_url]
+
+    def _query_page(self, url: str, params: dict) -> Optional[list]:
+        """Run a single query, returning its features (None if none were returned)."""
+        stream = int(params.get("resultRecordCount", 0)) > self.STREAM_THRESHOLD
+        response = self.session.get(url, params=params, timeout=60, stream=stream)
+        response.raise_for_status()
+
+        if stream:
+            with response:
+                return list(iter_json_items(response, "features.item"))
+        return parse_json(response).get("features")
+
+    def _query_features(
+        self,
+        url: str,
+        params: dict,
+        max_records: Optional[int] = None,
+    ) -> Optional[list]:
+        """
+        Run a layer query and return all matching features.
+
+        Args:
+            url: Layer query URL (ending in /query)
+            params: Query parameters (where, outFields, geometry, ...)
+            max_records: Maximum features to return (None for all)
+
+        Returns:
+            List of feature dicts, or None if the service returned no features
+        """
+        response = self.session.get(
+            url, params={**params, "returnCountOnly": "true"}, timeout=60
+        )
+        response.raise_for_status()
+        count = parse_json(response).get("count")
+
+        if count is None:
+            # Service did not report a count; fall back to a single query
+            if max_records is not None:
+                params = {**params, "resultRecordCount": max_records}
+            return self._query_page(url, params)
+
+        if max_records is not None:
+            count = min(count, max_records)
+        if count == 0:
+            return []
+
+        info = self._get_layer_info(url.rsplit("/query", 1)[0])
+        page_size = info.get("maxRecordCount") or self.DEFAULT_PAGE_SIZE
+        paginates = info.get("advancedQueryCapabilities", {}).get("supportsPagination", True)
+
+        if count <= page_size or not paginates:
+            features = self._query_page(url, {**params, "resultRecordCount": count})
+            if features is not None and len(features) < count:
+                warnings.warn(
+                    f"Service returned {len(features)} of {count} matching features "
+                    "and does not support paging"
+                )
+            return features
+
+        def fetch(offset: int) -> list:
+            page_params = {
+                **params,
+                "resultOffset": offset,
+                "resultRecordCount": min(page_size, count - offset),
+            }
+            return self._query_page(url, page_params) or []
+
+        offsets = range(0, count, page_size)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(offsets))) as executor:
+            pages = list(executor.map(fetch, offsets))
+
+        return [feature for page in pages for feature in page]
+
+    def _query_dataframe(
+        self,
+        url: str,
+        params: dict,
+        max_records: Optional[int] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Run a layer query and build a DataFrame from the features.
+
+        Column types come from the layer's field definitions (fetched once
+        per layer).
+
+        Returns:
+            DataFrame, or None if the service returned no features
+        """
+        features = self._query_features(url, params, max_records)
+        if features is None:
+            return None
+
+        fields = self._get_layer_info(url.rsplit("/query", 1)[0]).get("fields")
+        return _arcgis_features_to_df(features, fields)
+
+
+class MontanaGWIC(_ArcGISClient):
     """
     Client for Montana Ground Water Information Center (GWIC).
 
@@ -313,16 +801,38 @@ class MontanaGWIC:
         "monitoring_wells": "Monitoring_Wells/FeatureServer/0",
     }
 
-    def __init__(self):
-        """Initialize GWIC client."""
-        self.session = requests.Session()
+    # The monitoring network changes rarely
+    CACHE_EXPIRE_URLS = {
+        _url_pattern(f"{ARCGIS_BASE}/Statewide_Monitoring_Network/"): DAY,
+    }
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        cache_name: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize GWIC client.
 
+        Args:
+            max_workers: Maximum concurrent page requests per query
+            cache_name: Path of an on-disk HTTP response cache, or a redis://
+                URL (None disables caching)
+            cache_dir: Directory for Parquet copies of returned DataFrames
+                (None disables them)
+        """
+        super().__init__(max_workers=max_workers, cache_name=cache_name, cache_dir=cache_dir)
+        self._counties = None
+
+    @_parquet_cached()
     def get_wells_from_arcgis(
         self,
         bbox: Optional[tuple] = None,
         county: Optional[str] = None,
         where_clause: str = "1=1",
-        max_records: int = 2000,
+        max_records: Optional[int] = None,
+        local_county_filter: bool = False,
     ) -> pd.DataFrame:
         """
         Query GWIC wells from ArcGIS Feature Service.
@@ -331,18 +841,25 @@ class MontanaGWIC:
             bbox: Bounding box as (xmin, ymin, xmax, ymax) in WGS84
             county: Filter by county name
             where_clause: SQL WHERE clause for filtering
-            max_records: Maximum records to return
+            max_records: Maximum records to return (None for all)
+            local_county_filter: Filter by county against the cached county
+                boundaries (see get_wells_by_county) instead of on the server
 
         Returns:
             DataFrame with well information
         """
+        if county and local_county_filter and not bbox:
+            wells = self.get_wells_by_county([county], where_clause, max_records)
+            if wells is not None:
+                return wells
+
         # Build query parameters
         params = {
             "where": where_clause,
             "outFields": "*",
             "returnGeometry": "true",
+            "outSR": "4326",
             "f": "json",
-            "resultRecordCount": max_records,
         }
 
         if county:
@@ -358,20 +875,10 @@ class MontanaGWIC:
         url = f"{self.ARCGIS_BASE}/GWIC_Wells/FeatureServer/0/query"
 
         try:
-            response = self.session.get(url, params=params, timeout=60)
-            response.raise_for_status()
-            data = response.json()
-
-            if "features" in data:
-                records = [f["attributes"] for f in data["features"]]
+            df = self._query_dataframe(url, params, max_records)
 
-                # Add geometry
-                for i, feature in enumerate(data["features"]):
-                    if "geometry" in feature:
-                        records[i]["longitude"] = feature["geometry"].get("x")
-                        records[i]["latitude"] = feature["geometry"].get("y")
-
-                return pd.DataFrame(records)
+            if df is not None:
+                return _optimize_dtypes(df, ("COUNTY",))
             else:
                 warnings.warn("No features returned from GWIC ArcGIS service")
                 return pd.DataFrame()
@@ -380,6 +887,77 @@ class MontanaGWIC:
             warnings.warn(f"Could not query GWIC ArcGIS service: {e}")
             return pd.DataFrame()
 
+    def get_wells_by_county(
+        self,
+        counties: list[str],
+        where_clause: str = "1=1",
+        max_records: Optional[int] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get wells in one or more counties with a single query.
+
+        Wells are queried by the bounding box of the requested counties and
+        assigned to counties locally with a spatial join against the county
+        boundaries from the Montana State Library (downloaded once, and kept
+        as GeoParquet when the client has a cache_dir). Looping over counties
+        then costs one well query instead of one per county.
+
+        Args:
+            counties: County names (case-insensitive)
+            where_clause: SQL WHERE clause for filtering
+            max_records: Maximum wells to return (None for all). The cap
+                applies to the wells inside the counties, after the spatial
+                join, so the bounding-box query itself is not capped.
+
+        Returns:
+            DataFrame with well information and a county_name column, or
+            None if the county boundaries are unavailable
+        """
+        name_col = MontanaStateLibrary.COUNTY_NAME_COLUMN
+        try:
+            boundaries = self._load_counties()
+            county_names = boundaries[name_col].str.casefold()
+        except Exception as e:
+            # Missing geopandas, a failed download, an unreadable shapefile
+            # or a renamed name field: callers fall back to the server filter
+            warnings.warn(f"Could not load Montana county boundaries: {e}")
+            return None
+
+        import geopandas as gpd
+
+        wanted = {county.casefold() for county in counties}
+        selected = boundaries.loc[
+            county_names.isin(wanted), [name_col, "geometry"]
+        ].rename(columns={name_col: "county_name"})
+        if selected.empty:
+            warnings.warn(f"Unknown Montana counties: {', '.join(counties)}")
+            return pd.DataFrame()
+
+        wells = self.get_wells_from_arcgis(
+            bbox=tuple(selected.total_bounds),
+            where_clause=where_clause,
+        )
+        if wells.empty:
+            return wells
+
+        points = gpd.GeoDataFrame(
+            wells,
+            geometry=gpd.points_from_xy(wells["longitude"], wells["latitude"]),
+            crs="EPSG:4326",
+        )
+        joined = gpd.sjoin(points, selected, how="inner", predicate="within")
+        if max_records is not None:
+            joined = joined.iloc[:max_records]
+        return pd.DataFrame(joined.drop(columns=["geometry", "index_right"]))
+
+    def _load_counties(self) -> "geopandas.GeoDataFrame":
+        """Load the county boundaries once per client."""
+        if self._counties is None:
+            with MontanaStateLibrary(cache_dir=self.cache_dir) as library:
+                self._counties = library.get_counties()
+        return self._counties
+
+    @_parquet_cached(ttl=DAY)
     def get_monitoring_network_wells(self) -> pd.DataFrame:
         """
         Get statewide groundwater monitoring network wells.
@@ -399,20 +977,10 @@ class MontanaGWIC:
         }
 
         try:
-            response = self.session.get(url, params=params, timeout=60)
-            response.raise_for_status()
-            data = response.json()
-
-            if "features" in data:
-                records = []
-                for feature in data["features"]:
-                    record = feature["attributes"]
-                    if "geometry" in feature:
-                        record["longitude"] = feature["geometry"].get("x")
-                        record["latitude"] = feature["geometry"].get("y")
-                    records.append(record)
-
-                return pd.DataFrame(records)
+            df = self._query_dataframe(url, params)
+
+            if df is not None:
+                return _optimize_dtypes(df, ("COUNTY",))
             return pd.DataFrame()
 
         except requests.exceptions.RequestException as e:
@@ -433,7 +1001,7 @@ class MontanaGWIC:
         return f"https://mbmggwic.mtech.edu/sqlserver/v11/reports/SiteSummary.asp?gwicid={gwic_id}"
 
 
-class MontanaDNRC:
+class MontanaDNRC(_ArcGISClient):
     """
     Client for Montana DNRC (Department of Natural Resources and Conservation).
 
@@ -449,10 +1017,30 @@ class MontanaDNRC:
     # ArcGIS REST service base
     ARCGIS_BASE = "https://gis.dnrc.mt.gov/arcgis/rest/services"
 
-    def __init__(self):
-        """Initialize DNRC client."""
-        self.session = requests.Session()
+    # The stream gage catalog changes rarely
+    CACHE_EXPIRE_URLS = {
+        _url_pattern(f"{ARCGIS_BASE}/WRD/DNRC_Stream_Gages/"): DAY,
+    }
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        cache_name: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize DNRC client.
 
+        Args:
+            max_workers: Maximum concurrent page requests per query
+            cache_name: Path of an on-disk HTTP response cache, or a redis://
+                URL (None disables caching)
+            cache_dir: Directory for Parquet copies of returned DataFrames
+                (None disables them)
+        """
+        super().__init__(max_workers=max_workers, cache_name=cache_name, cache_dir=cache_dir)
+
+    @_parquet_cached(ttl=DAY)
     def get_stream_gages(
         self,
         bbox: Optional[tuple] = None,
@@ -466,7 +1054,7 @@ class MontanaDNRC:
             active_only: Only return active gages
 
         Returns:
-            DataFrame with gage information
+            DataFrame with gage information and a boolean is_active column
         """
         # DNRC Stream Gages feature service
         url = f"{self.ARCGIS_BASE}/WRD/DNRC_Stream_Gages/MapServer/0/query"
@@ -485,42 +1073,52 @@ class MontanaDNRC:
             params["inSR"] = "4326"
 
         try:
-            response = self.session.get(url, params=params, timeout=60)
-            response.raise_for_status()
-            data = response.json()
+            df = self._query_dataframe(url, params)
 
-            if "features" in data:
-                records = []
-                for feature in data["features"]:
-                    record = feature["attributes"]
-                    if "geometry" in feature:
-                        record["longitude"] = feature["geometry"].get("x")
-                        record["latitude"] = feature["geometry"].get("y")
-                    records.append(record)
-
-                df = pd.DataFrame(records)
+            if df is not None:
+                df = self._add_active_flag(df)
 
                 # Filter for active gages if requested
-                if active_only and not df.empty:
-                    # Check for common active status column names
-                    status_cols = [c for c in df.columns if 'status' in c.lower() or 'active' in c.lower()]
-                    if status_cols:
-                        status_col = status_cols[0]
-                        # Filter for active status (common values: 'Active', 'active', 'A', 1, True)
-                        active_mask = df[status_col].astype(str).str.lower().isin(['active', 'a', '1', 'true', 'yes'])
-                        df = df[active_mask]
-
-                return df
+                if active_only:
+                    df = df[df["is_active"]]
+
+                return _optimize_dtypes(df)
             return pd.DataFrame()
 
         except requests.exceptions.RequestException as e:
             warnings.warn(f"Could not query DNRC stream gages: {e}")
             return pd.DataFrame()
 
+    # Status values that mark a gage as active
+    ACTIVE_STATUSES = frozenset({"active", "a", "1", "true", "yes"})
+
+    @classmethod
+    def _add_active_flag(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add a boolean is_active column derived from the gage status column.
+
+        The first column whose name contains 'status' or 'active' is stored
+        as a category, so the status values are normalized once per distinct
+        value rather than per row. Without such a column every gage counts
+        as active.
+        """
+        status_cols = [c for c in df.columns if "status" in c.lower() or "active" in c.lower()]
+        if not status_cols:
+            df["is_active"] = True
+            return df
+
+        status = df[status_cols[0]].astype("category")
+        df[status_cols[0]] = status
+        is_active = status.cat.categories.astype(str).str.casefold().isin(cls.ACTIVE_STATUSES)
+        df["is_active"] = status.isin(status.cat.categories[is_active]).to_numpy()
+        return df
+
+    @_parquet_cached()
     def get_water_rights_pou(
         self,
         bbox: Optional[tuple] = None,
         county: Optional[str] = None,
+        max_records: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         Get Places of Use (POU) from water rights database.
@@ -528,6 +1126,7 @@ class MontanaDNRC:
         Args:
             bbox: Bounding box
             county: Filter by county
+            max_records: Maximum records to return (None for all)
 
         Returns:
             DataFrame with water rights POU data
@@ -539,7 +1138,6 @@ class MontanaDNRC:
             "outFields": "*",
             "returnGeometry": "true",
             "f": "json",
-            "resultRecordCount": 2000,
         }
 
         if county:
@@ -552,13 +1150,10 @@ class MontanaDNRC:
             params["inSR"] = "4326"
 
         try:
-            response = self.session.get(url, params=params, timeout=60)
-            response.raise_for_status()
-            data = response.json()
+            df = self._query_dataframe(url, params, max_records)
 
-            if "features" in data:
-                records = [f["attributes"] for f in data["features"]]
-                return pd.DataFrame(records)
+            if df is not None:
+                return _optimize_dtypes(df, ("COUNTY",))
             return pd.DataFrame()
 
         except requests.exceptions.RequestException as e:
@@ -584,7 +1179,7 @@ class MontanaDNRC:
         return "https://wrqs.dnrc.mt.gov/"
 
 
-class MontanaStateLibrary:
+class MontanaStateLibrary(_MontanaClient):
     """
     Client for Montana State Library GIS datasets.
 
@@ -605,9 +1200,27 @@ class MontanaStateLibrary:
         "climate": "/Data/Spatial/MSDI/Climate/",
     }
 
-    def __init__(self):
-        """Initialize Montana State Library client."""
-        self.session = requests.Session()
+    # Dataset downloads change rarely
+    CACHE_EXPIRE = DAY
+
+    # County name column of the counties dataset
+    COUNTY_NAME_COLUMN = "NAME"
+
+    def __init__(
+        self,
+        cache_name: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize Montana State Library client.
+
+        Args:
+            cache_name: Path of an on-disk HTTP response cache, or a redis://
+                URL (None disables caching)
+            cache_dir: Directory for Parquet copies of returned DataFrames
+                (None disables them)
+        """
+        super().__init__(cache_name, cache_dir)
 
     def list_datasets(self, category: str) -> list[str]:
         """
@@ -627,74 +1240,224 @@ class MontanaStateLibrary:
         # or web scraping of the data catalog
         return list(self.DATASETS.keys())
 
+    @_parquet_cached(ttl=365 * DAY)
+    def get_counties(self) -> "geopandas.GeoDataFrame":
+        """
+        Get Montana county boundaries.
+
+        With a cache_dir the boundaries are kept as GeoParquet, so the
+        shapefile is only downloaded once.
+
+        Returns:
+            GeoDataFrame of county polygons in WGS84 (EPSG:4326)
+        """
+        import geopandas as gpd
+
+        response = self.session.get(
+            f"{self.DOWNLOAD_BASE}{self.DATASETS['counties']}", timeout=120
+        )
+        response.raise_for_status()
+
+        return gpd.read_file(BytesIO(response.content)).to_crs("EPSG:4326")
+
     @staticmethod
     def get_data_catalog_url() -> str:
         """Get URL for the Montana State Library data catalog."""
         return "https://mslservices.mt.gov/geographic_information/data/datalist/"
 
 
+class MontanaWarehouse:
+    """
+    SQL over the Parquet files the Montana clients write to their cache_dir.
+
+    Each cached dataset is exposed as a DuckDB view (stations, wells,
+    stream_gages, ...) that scans the Parquet files directly, so joins and
+    filters are pushed down to the files and only the selected columns and
+    rows are read, rather than loading every dataset into pandas first.
+
+    Views cover every cached call of a method; results of different calls
+    (e.g. active and all stations) appear together. Geometry columns of
+    GeoParquet files are WKB blobs; load DuckDB's spatial extension to use
+    spatial functions on them.
+
+    Example:
+        >>> clients = get_montana_clients(cache_dir="~/.cache/montana", prewarm=True)
+        >>> with MontanaWarehouse("~/.cache/montana") as warehouse:
+        ...     warehouse.query("SELECT county, count(*) FROM stations GROUP BY county")
+    """
+
+    # View name -> client method whose cached results it reads
+    VIEWS = {
+        "stations": "get_stations",
+        "latest": "get_latest",
+        "hourly_observations": "get_hourly_observations",
+        "daily_observations": "get_daily_observations",
+        "derived_metrics": "get_derived_metrics",
+        "wells": "get_wells_from_arcgis",
+        "monitoring_wells": "get_monitoring_network_wells",
+        "stream_gages": "get_stream_gages",
+        "water_rights_pou": "get_water_rights_pou",
+        "counties": "get_counties",
+    }
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize warehouse.
+
+        Args:
+            cache_dir: The cache_dir the clients were created with
+        """
+        try:
+            import duckdb
+        except ImportError:
+            raise ImportError("MontanaWarehouse requires duckdb: conda install python-duckdb")
+
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.con = duckdb.connect()
+        self.views = self.refresh()
+
+    def refresh(self) -> list[str]:
+        """
+        Create a view for each dataset with cached files in cache_dir.
+
+        Call again after the clients have cached new datasets.
+
+        Returns:
+            Names of the available views
+        """
+        views = []
+        for view, method in self.VIEWS.items():
+            if not any(self.cache_dir.glob(f"{method}_*.parquet")):
+                continue
+            pattern = str(self.cache_dir / f"{method}_*.parquet").replace("'", "''")
+            self.con.execute(
+                f"CREATE OR REPLACE VIEW {view} AS "
+                f"SELECT * FROM read_parquet('{pattern}', union_by_name = true)"
+            )
+            views.append(view)
+        self.views = views
+        return views
+
+    def query(self, sql: str, params: Optional[list] = None) -> pd.DataFrame:
+        """
+        Run a SQL query against the views.
+
+        Args:
+            sql: SQL query (use ? placeholders for params)
+            params: Query parameters
+
+        Returns:
+            DataFrame with the query result
+        """
+        return self.con.execute(sql, params).df()
+
+    def close(self):
+        """Close the DuckDB connection."""
+        self.con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 # Convenience function for all Montana data
-def get_montana_clients() -> dict:
+def get_montana_clients(
+    cache_name: Optional[str] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    prewarm: bool = False,
+) -> dict:
     """
     Get all Montana data clients.
 
+    Clients are constructed concurrently. With prewarm, the slowly changing
+    catalogs (Mesonet stations, DNRC stream gages, GWIC monitoring wells)
+    are also fetched concurrently up front, so that later calls are served
+    from the caches.
+
+    Args:
+        cache_name: HTTP response cache shared by all clients (None disables
+            caching)
+        cache_dir: Directory for Parquet copies of returned DataFrames
+            shared by all clients (None disables them)
+        prewarm: Fetch the station, gage and monitoring well catalogs now
+
     Returns:
         Dict with initialized clients for each data source
     """
-    return {
-        "mesonet": MontanaMesonet(),
-        "gwic": MontanaGWIC(),
-        "dnrc": MontanaDNRC(),
-        "state_library": MontanaStateLibrary(),
+    constructors = {
+        "mesonet": MontanaMesonet,
+        "gwic": MontanaGWIC,
+        "dnrc": MontanaDNRC,
+        "state_library": MontanaStateLibrary,
     }
 
+    with ThreadPoolExecutor(max_workers=len(constructors)) as executor:
+        futures = {
+            name: executor.submit(cls, cache_name=cache_name, cache_dir=cache_dir)
+            for name, cls in constructors.items()
+        }
+        clients = {name: future.result() for name, future in futures.items()}
+
+    if prewarm:
+        catalogs = [
+            clients["mesonet"].get_stations,
+            clients["dnrc"].get_stream_gages,
+            clients["gwic"].get_monitoring_network_wells,
+        ]
+        with ThreadPoolExecutor(max_workers=len(catalogs)) as executor:
+            futures = [executor.submit(fetch) for fetch in catalogs]
+        for future in futures:
+            if future.exception() is not None:
+                warnings.warn(f"Could not prewarm Montana catalog: {future.exception()}")
+
+    return clients
+
 
 # Example usage
 if __name__ == "__main__":
     print("=== Montana Mesonet ===")
-    mesonet = MontanaMesonet()
-
-    # Get stations
-    stations = mesonet.get_stations()
-    print(f"Found {len(stations)} Mesonet stations")
-
-    # Get latest data
-    latest = mesonet.get_latest()
-    print(f"Latest observations from {len(latest)} stations")
-
-    # Get stations in Gallatin County
-    gallatin = mesonet.search_stations_by_county("Gallatin")
-    print(f"Found {len(gallatin)} stations in Gallatin County")
-
-    if not gallatin.empty:
-        # Get daily data for first station
-        station_id = gallatin.iloc[0]["station"]
-        daily = mesonet.get_daily_observations(
-            stations=[station_id],
-            start_date=datetime.now() - timedelta(days=7),
-            elements=["air_temp", "ppt"],
-        )
-        print(f"Retrieved {len(daily)} daily observations for {station_id}")
+    with MontanaMesonet() as mesonet:
+        # Get stations
+        stations = mesonet.get_stations()
+        print(f"Found {len(stations)} Mesonet stations")
+
+        # Get latest data
+        latest = mesonet.get_latest()
+        print(f"Latest observations from {len(latest)} stations")
+
+        # Get stations in Gallatin County
+        gallatin = mesonet.search_stations_by_county("Gallatin")
+        print(f"Found {len(gallatin)} stations in Gallatin County")
+
+        if not gallatin.empty:
+            # Get daily data for first station
+            station_id = gallatin.iloc[0]["station"]
+            daily = mesonet.get_daily_observations(
+                stations=[station_id],
+                start_date=datetime.now() - timedelta(days=7),
+                elements=["air_temp", "ppt"],
+            )
+            print(f"Retrieved {len(daily)} daily observations for {station_id}")
 
     print("\n=== Montana GWIC ===")
-    gwic = MontanaGWIC()
-
-    # Try to get monitoring network wells
-    monitoring = gwic.get_monitoring_network_wells()
-    if not monitoring.empty:
-        print(f"Found {len(monitoring)} monitoring network wells")
-    else:
-        print("Could not retrieve monitoring wells (service may require direct access)")
+    with MontanaGWIC() as gwic:
+        # Try to get monitoring network wells
+        monitoring = gwic.get_monitoring_network_wells()
+        if not monitoring.empty:
+            print(f"Found {len(monitoring)} monitoring network wells")
+        else:
+            print("Could not retrieve monitoring wells (service may require direct access)")
 
     print("\n=== Montana DNRC ===")
-    dnrc = MontanaDNRC()
-
-    # Get stream gages
-    gages = dnrc.get_stream_gages()
-    if not gages.empty:
-        print(f"Found {len(gages)} DNRC stream gages")
-    else:
-        print("Could not retrieve stream gages (check ArcGIS service availability)")
+    with MontanaDNRC() as dnrc:
+        # Get stream gages
+        gages = dnrc.get_stream_gages()
+        if not gages.empty:
+            print(f"Found {len(gages)} DNRC stream gages")
+        else:
+            print("Could not retrieve stream gages (check ArcGIS service availability)")
 
     print("\n=== Data Source URLs ===")
     print(f"Mesonet Dashboard: https://mesonet.climate.umt.edu/dash/")
@@ -7,12 +7,15 @@ Provides access to historical climate and weather data.
 Note: Requires a free API token from https://www.ncdc.noaa.gov/cdo-web/token
 """
 
-import requests
 import pandas as pd
-from datetime import datetime
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Union
 import os
 
+from .http_utils import RETRY_STATUSES, RateLimiter, create_session, is_cached_session, parse_json
+
 
 class NOAAClimate:
     """Client for NOAA Climate Data Online (CDO) API."""
@@ -41,13 +44,43 @@ class NOAAClimate:
         "wind_avg": "AWND",         # Average wind speed (tenths of m/s)
     }
 
-    def __init__(self, api_token: Optional[str] = None):
+    # Compact dtypes for /data results; station and data type IDs repeat
+    # across every page
+    DATA_DTYPES = {
+        "value": "float32",
+        "station": "category",
+        "datatype": "category",
+        "attributes": "string",
+    }
+
+    # Maximum records per request allowed by the CDO API
+    PAGE_SIZE = 1000
+
+    # Days per date window; get_data splits longer ranges so the server
+    # rarely has to scan past a deep offset
+    WINDOW_DAYS = 31
+
+    # CDO API quota: requests per second per token
+    REQUESTS_PER_SECOND = 5
+
+    # Longest date range fetched for a whole state without a station filter
+    MAX_UNFILTERED_DAYS = 366
+
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        max_workers: int = 8,
+        cache_name: Optional[str] = None,
+    ):
         """
         Initialize NOAA client.
 
         Args:
             api_token: NOAA CDO API token. If not provided, looks for
                       NOAA_API_TOKEN environment variable.
+            max_workers: Maximum concurrent requests per query
+            cache_name: Path of an on-disk HTTP response cache, or a redis://
+                URL (None disables caching)
         """
         self.api_token = api_token or os.environ.get("NOAA_API_TOKEN")
         if not self.api_token:
@@ -57,13 +90,33 @@ class NOAAClimate:
                 "Then set NOAA_API_TOKEN environment variable or pass to constructor."
             )
 
-        self.session = requests.Session()
+        self.max_workers = max_workers
+        # Pooled keep-alive connections sized for the concurrent page
+        # fetches, with compressed responses. Throttled (429) responses
+        # are retried too, honoring Retry-After.
+        self.session = create_session(
+            cache_name, retries=8, retry_statuses=(429, 500, *RETRY_STATUSES)
+        )
+
+        # Shared by all worker threads so together they stay under the quota.
+        # Requests are evenly spaced with no burst: a bucket refilling at the
+        # quota rate would let the burst plus the refill through in one second.
+        self._rate_limiter = RateLimiter(1 / self.REQUESTS_PER_SECOND)
         self.session.headers.update({"token": self.api_token})
 
+        # Dataset, location and station lists change rarely, so each distinct
+        # query is fetched once per client
+        self._metadata = {}
+
+    def clear_cache(self):
+        """Remove memoized metadata and, if enabled, all cached HTTP responses."""
+        self._metadata.clear()
+        if is_cached_session(self.session):
+            self.session.cache.clear()
+
     def get_datasets(self) -> pd.DataFrame:
         """Get list of available datasets."""
-        response = self._get("/datasets", {"limit": 100})
-        return pd.DataFrame(response.get("results", []))
+        return self._get_metadata("/datasets", {"limit": self.PAGE_SIZE})
 
     def get_locations(
         self,
@@ -83,11 +136,10 @@ class NOAAClimate:
         params = {
             "datasetid": dataset_id,
             "locationcategoryid": location_category,
-            "limit": 1000,
+            "limit": self.PAGE_SIZE,
         }
 
-        response = self._get("/locations", params)
-        return pd.DataFrame(response.get("results", []))
+        return self._get_metadata("/locations", params)
 
     def get_stations(
         self,
@@ -110,7 +162,7 @@ class NOAAClimate:
         """
         params = {
             "datasetid": dataset_id,
-            "limit": 1000,
+            "limit": self.PAGE_SIZE,
         }
 
         if location_id:
@@ -121,15 +173,14 @@ class NOAAClimate:
         if data_type_id:
             params["datatypeid"] = data_type_id
 
-        response = self._get("/stations", params)
-        return pd.DataFrame(response.get("results", []))
+        return self._get_metadata("/stations", params)
 
     def get_data(
         self,
         dataset_id: str = "GHCND",
         data_type_ids: Optional[list[str]] = None,
         location_id: Optional[str] = None,
-        station_id: Optional[str] = None,
+        station_id: Optional[Union[str, list[str]]] = None,
         start_date: datetime = None,
         end_date: datetime = None,
         units: str = "metric",
@@ -141,7 +192,7 @@ class NOAAClimate:
             dataset_id: Dataset ID
             data_type_ids: List of data types to retrieve
             location_id: Location filter
-            station_id: Station filter
+            station_id: Station ID or list of station IDs to filter by
             start_date: Start date (required)
             end_date: End date (required)
             units: 'metric' or 'standard'
@@ -149,15 +200,65 @@ class NOAAClimate:
         Returns:
             DataFrame with weather data
         """
+        pages = list(self.get_data_iter(
+            dataset_id=dataset_id,
+            data_type_ids=data_type_ids,
+            location_id=location_id,
+            station_id=station_id,
+            start_date=start_date,
+            end_date=end_date,
+            units=units,
+        ))
+        if not pages:
+            return pd.DataFrame()
+
+        # Pages carry their own categories; recombine them after concatenating
+        df = pd.concat(pages, ignore_index=True)
+        return df.astype({
+            col: dtype for col, dtype in self.DATA_DTYPES.items() if col in df.columns
+        })
+
+    def get_data_iter(
+        self,
+        dataset_id: str = "GHCND",
+        data_type_ids: Optional[list[str]] = None,
+        location_id: Optional[str] = None,
+        station_id: Optional[Union[str, list[str]]] = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        units: str = "metric",
+        page_size: int = PAGE_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate climate/weather data one page at a time, in date order.
+
+        Pages are requested only as the iteration advances (with up to
+        max_workers requests in flight), so a caller that stops early, e.g.
+        with itertools.islice(client.get_data_iter(...), k) when only k
+        pages are needed, avoids fetching the rest of the range.
+
+        Args:
+            dataset_id: Dataset ID
+            data_type_ids: List of data types to retrieve
+            location_id: Location filter
+            station_id: Station ID or list of station IDs to filter by
+            start_date: Start date (required)
+            end_date: End date (required)
+            units: 'metric' or 'standard'
+            page_size: Records per request (at most 1000)
+
+        Yields:
+            DataFrame with one page of weather data
+        """
         if not start_date or not end_date:
             raise ValueError("start_date and end_date are required")
 
+        page_size = min(page_size, self.PAGE_SIZE)
         params = {
             "datasetid": dataset_id,
-            "startdate": start_date.strftime("%Y-%m-%d"),
-            "enddate": end_date.strftime("%Y-%m-%d"),
             "units": units,
-            "limit": 1000,
+            "limit": page_size,
+            "offset": 0,
         }
 
         if data_type_ids:
@@ -167,46 +268,83 @@ class NOAAClimate:
         if station_id:
             params["stationid"] = station_id
 
-        # Paginate through all results
-        all_results = []
-        offset = 0
-
-        while True:
-            params["offset"] = offset
-            response = self._get("/data", params)
-            results = response.get("results", [])
-
-            if not results:
-                break
-
-            all_results.extend(results)
-
-            metadata = response.get("metadata", {}).get("resultset", {})
-            total = metadata.get("count", 0)
-
-            if len(all_results) >= total:
-                break
-
-            offset += 1000
-
-        df = pd.DataFrame(all_results)
-
-        if not df.empty and "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"])
-
-        return df
+        # Offset paging costs the server work proportional to the offset, so
+        # the range is split into short date windows whose first pages are
+        # prefetched concurrently. Offsets are only used inside a window
+        # holding more than one page.
+        windows = iter([
+            {
+                **params,
+                "startdate": window_start.strftime("%Y-%m-%d"),
+                "enddate": window_end.strftime("%Y-%m-%d"),
+            }
+            for window_start, window_end in self._date_windows(start_date, end_date)
+        ])
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            first_pages = deque()
+
+            def prefetch_window():
+                window = next(windows, None)
+                if window is not None:
+                    first_pages.append((window, executor.submit(self._get, "/data", window)))
+
+            for _ in range(self.max_workers):
+                prefetch_window()
+
+            while first_pages:
+                window, future = first_pages.popleft()
+                response = future.result()
+                prefetch_window()
+
+                total = response.get("metadata", {}).get("resultset", {}).get("count", 0)
+                extra_pages = [
+                    executor.submit(self._get, "/data", {**window, "offset": offset})
+                    for offset in range(page_size, total, page_size)
+                ]
+
+                yield from self._page_frame(response)
+                for extra in extra_pages:
+                    yield from self._page_frame(extra.result())
+        finally:
+            # Do not fetch pages the caller will never consume
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _page_frame(self, response: dict) -> Iterator[pd.DataFrame]:
+        """Yield a /data page as a DataFrame with compact dtypes (nothing if empty)."""
+        df = pd.DataFrame(response.get("results", []))
+        if df.empty:
+            return
+
+        df = df.astype({
+            col: dtype for col, dtype in self.DATA_DTYPES.items() if col in df.columns
+        })
+        if "date" in df.columns:
+            # NOAA always returns ISO timestamps; an explicit format avoids
+            # per-value format inference
+            df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%dT%H:%M:%S", cache=True)
+        yield df
 
     def get_colorado_basin_precipitation(
         self,
         start_date: datetime,
         end_date: datetime,
+        station_ids: Optional[dict[str, list[str]]] = None,
     ) -> pd.DataFrame:
         """
         Get precipitation data for Colorado River Basin states.
 
+        Statewide daily data is large, so ranges longer than a year require
+        a station list for every state; the station filter is applied
+        server-side and cuts the number of pages per state.
+
         Args:
             start_date: Start date
             end_date: End date
+            station_ids: Optional mapping of state name to the GHCND station
+                IDs to fetch for that state (e.g. {"Colorado": ["GHCND:USC00050848"]}).
+                States not in the mapping are fetched for all stations.
 
         Returns:
             DataFrame with precipitation data
@@ -222,17 +360,36 @@ class NOAAClimate:
             "FIPS:56": "Wyoming",
         }
 
+        station_ids = station_ids or {}
+        unfiltered = [name for name in basin_states.values() if not station_ids.get(name)]
+        if unfiltered and (end_date - start_date).days > self.MAX_UNFILTERED_DAYS:
+            raise ValueError(
+                f"Date range longer than {self.MAX_UNFILTERED_DAYS} days requires "
+                f"station_ids for: {', '.join(unfiltered)}"
+            )
+
+        def fetch_state(fips: str) -> pd.DataFrame:
+            return self.get_data(
+                dataset_id="GHCND",
+                data_type_ids=["PRCP", "SNOW"],
+                location_id=fips,
+                station_id=station_ids.get(basin_states[fips]),
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+        # Each state paginates independently, so fetch them concurrently;
+        # wall time becomes that of the slowest state rather than the sum.
+        with ThreadPoolExecutor(max_workers=len(basin_states)) as executor:
+            futures = {
+                fips: executor.submit(fetch_state, fips) for fips in basin_states
+            }
+
         all_data = []
 
         for fips, state_name in basin_states.items():
             try:
-                data = self.get_data(
-                    dataset_id="GHCND",
-                    data_type_ids=["PRCP", "SNOW"],
-                    location_id=fips,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
+                data = futures[fips].result()
                 if not data.empty:
                     data["state"] = state_name
                     all_data.append(data)
@@ -243,15 +400,35 @@ class NOAAClimate:
             return pd.concat(all_data, ignore_index=True)
         return pd.DataFrame()
 
+    def _get_metadata(self, endpoint: str, params: dict) -> pd.DataFrame:
+        """Return the results of a metadata query, fetching it at most once."""
+        key = (endpoint, tuple(sorted(params.items())))
+        if key not in self._metadata:
+            response = self._get(endpoint, params)
+            self._metadata[key] = pd.DataFrame(response.get("results", []))
+        # Shallow copy: callers' changes do not leak into the memoized frame
+        return self._metadata[key].copy(deep=False)
+
+    def _date_windows(self, start_date: datetime, end_date: datetime) -> list[tuple]:
+        """Split an inclusive date range into consecutive windows of WINDOW_DAYS days."""
+        windows = []
+        window_start = start_date
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=self.WINDOW_DAYS - 1), end_date)
+            windows.append((window_start, window_end))
+            window_start = window_end + timedelta(days=1)
+        return windows
+
     def _get(self, endpoint: str, params: dict) -> dict:
         """Make GET request to NOAA API."""
+        self._rate_limiter.acquire()
         response = self.session.get(
             f"{self.BASE_URL}{endpoint}",
             params=params,
             timeout=60,
         )
         response.raise_for_status()
-        return response.json()
+        return parse_json(response)
 
 
 # Example usage
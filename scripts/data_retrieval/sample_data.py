@@ -8,22 +8,62 @@ from USGS, EPA, Montana Mesonet, and other sources.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Callable, Any
+import functools
 import hashlib
 import json
+import pickle
 
 
 # Default sample data directory
 SAMPLE_DATA_DIR = Path(__file__).parent.parent.parent / "data" / "sample"
 
 
+# Water body name components for synthetic USGS site names
+_WATER_NAMES = np.array([
+    "Big", "Little", "North", "South", "East", "West", "Clear", "Muddy",
+    "Blue", "Black", "Red", "Green", "White", "Sandy", "Rocky", "Bear",
+    "Deer", "Eagle", "Elk", "Beaver", "Cottonwood", "Willow", "Pine",
+])
+_WATER_TYPES = np.array(["Creek", "River", "Brook", "Run", "Fork", "Branch", "Wash", "Gulch"])
+_LOCATIONS = np.array(["at Bridge", "near Town", "below Dam", "at Gage", "at Highway",
+                       "above Confluence", "below Reservoir", "at State Line"])
+
+# Montana county names, and the 4-letter codes used in Mesonet station IDs
+_COUNTIES = np.array([
+    "Gallatin", "Yellowstone", "Missoula", "Cascade", "Lewis and Clark",
+    "Flathead", "Ravalli", "Silver Bow", "Lake", "Lincoln",
+    "Park", "Carbon", "Stillwater", "Big Horn", "Rosebud",
+])
+_COUNTY_CODES = np.char.lower(_COUNTIES.astype("<U4"))
+
+# Mesonet station name prefixes
+_PREFIXES = np.array(["ace", "agr", "hyd", "met"])
+
+# Low-cardinality string columns stored as categoricals in the sample cache,
+# which forces Parquet dictionary encoding
+_CATEGORICAL_COLUMNS = (
+    "agency_cd", "site_tp_cd", "coord_datum_cd", "alt_datum_cd", "state_cd",
+    "unit", "parameter_name", "parameter_code",
+    "MonitoringLocationTypeName", "CharacteristicName",
+    "ResultMeasure/MeasureUnitCode", "ResultStatusIdentifier",
+    "county", "network",
+)
+
+
 def _ensure_sample_dir():
     """Ensure the sample data directory exists."""
     SAMPLE_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _concat(*parts) -> np.ndarray:
+    """Concatenate string arrays (or scalars) element-wise."""
+    return functools.reduce(np.char.add, parts)
+
+
 def generate_usgs_sites(
     n_sites: int = 50,
     state: str = "CO",
@@ -42,7 +82,7 @@ def generate_usgs_sites(
     Returns:
         DataFrame with USGS-style site information
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # State-specific coordinate ranges
     state_bounds = {
@@ -55,43 +95,28 @@ def generate_usgs_sites(
 
     bounds = state_bounds.get(state, {"lat": (35.0, 45.0), "lon": (-115.0, -105.0)})
 
-    # Water body name components
-    water_names = [
-        "Big", "Little", "North", "South", "East", "West", "Clear", "Muddy",
-        "Blue", "Black", "Red", "Green", "White", "Sandy", "Rocky", "Bear",
-        "Deer", "Eagle", "Elk", "Beaver", "Cottonwood", "Willow", "Pine",
-    ]
-    water_types = ["Creek", "River", "Brook", "Run", "Fork", "Branch", "Wash", "Gulch"]
-    locations = ["at Bridge", "near Town", "below Dam", "at Gage", "at Highway",
-                 "above Confluence", "below Reservoir", "at State Line"]
-
-    sites = []
-    for i in range(n_sites):
-        site_no = f"{np.random.randint(1, 99):02d}{np.random.randint(100000, 999999)}"
-
-        name_parts = [
-            np.random.choice(water_names),
-            np.random.choice(water_types),
-            np.random.choice(locations),
-        ]
-        site_name = " ".join(name_parts) + f", {state}"
-
-        sites.append({
-            "agency_cd": "USGS",
-            "site_no": site_no,
-            "station_nm": site_name.upper(),
-            "site_tp_cd": np.random.choice(["ST", "GW", "SP", "AT"], p=[0.6, 0.25, 0.1, 0.05]),
-            "dec_lat_va": np.random.uniform(*bounds["lat"]),
-            "dec_long_va": np.random.uniform(*bounds["lon"]),
-            "coord_datum_cd": "NAD83",
-            "alt_va": np.random.uniform(1000, 10000),
-            "alt_datum_cd": "NAVD88",
-            "huc_cd": f"14{np.random.randint(10000, 99999):05d}",
-            "state_cd": state,
-            "county_cd": f"{np.random.randint(1, 125):03d}",
-        })
-
-    return pd.DataFrame(sites)
+    # Each column is drawn in one call rather than row by row
+    site_no = rng.integers(1, 99, n_sites) * 1_000_000 + rng.integers(100000, 999999, n_sites)
+    site_names = _concat(
+        _WATER_NAMES[rng.integers(0, len(_WATER_NAMES), n_sites)], " ",
+        _WATER_TYPES[rng.integers(0, len(_WATER_TYPES), n_sites)], " ",
+        _LOCATIONS[rng.integers(0, len(_LOCATIONS), n_sites)], f", {state}",
+    )
+
+    return pd.DataFrame({
+        "agency_cd": "USGS",
+        "site_no": np.char.zfill(site_no.astype(str), 8),
+        "station_nm": np.char.upper(site_names),
+        "site_tp_cd": rng.choice(["ST", "GW", "SP", "AT"], n_sites, p=[0.6, 0.25, 0.1, 0.05]),
+        "dec_lat_va": rng.uniform(*bounds["lat"], n_sites),
+        "dec_long_va": rng.uniform(*bounds["lon"], n_sites),
+        "coord_datum_cd": "NAD83",
+        "alt_va": rng.uniform(1000, 10000, n_sites),
+        "alt_datum_cd": "NAVD88",
+        "huc_cd": np.char.add("14", rng.integers(10000, 99999, n_sites).astype(str)),
+        "state_cd": state,
+        "county_cd": np.char.zfill(rng.integers(1, 125, n_sites).astype(str), 3),
+    })
 
 
 def generate_groundwater_levels(
@@ -116,7 +141,7 @@ def generate_groundwater_levels(
     Returns:
         DataFrame with groundwater level data
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     if start_date is None:
         start_date = datetime.now() - timedelta(days=365)
@@ -124,43 +149,38 @@ def generate_groundwater_levels(
         end_date = datetime.now()
 
     # Generate site IDs
-    site_ids = [f"GW{np.random.randint(100000, 999999)}" for _ in range(n_sites)]
-
-    records = []
-    for _ in range(n_records):
-        site_id = np.random.choice(site_ids)
+    site_ids = np.char.add("GW", rng.integers(100000, 999999, n_sites).astype(str))
 
-        # Random date in range
-        days_range = (end_date - start_date).days
-        measurement_date = start_date + timedelta(days=np.random.randint(0, days_range))
+    # Each record's site and date, drawn for all records at once
+    site_idx = rng.integers(0, n_sites, n_records)
+    days_range = (end_date - start_date).days
+    day_offsets = rng.integers(0, days_range, n_records)
+    dates = pd.Timestamp(start_date) + pd.to_timedelta(day_offsets, unit="D")
 
-        # Base depth with site-specific offset
-        site_idx = site_ids.index(site_id)
-        base_depth = 50 + site_idx * 10  # Different base depths per site
+    # Base depth with site-specific offset
+    base_depth = 50 + site_idx * 10  # Different base depths per site
 
-        # Add seasonal variation (deeper in summer, shallower in winter)
-        day_of_year = measurement_date.timetuple().tm_yday
-        seasonal = 5 * np.sin(2 * np.pi * day_of_year / 365)
+    # Add seasonal variation (deeper in summer, shallower in winter)
+    seasonal = 5 * np.sin(2 * np.pi * dates.dayofyear.to_numpy() / 365)
 
-        # Add some noise and long-term trend
-        noise = np.random.normal(0, 2)
-        trend = 0.01 * (measurement_date - start_date).days  # Slight decline
+    # Add some noise and long-term trend
+    noise = rng.normal(0, 2, n_records)
+    trend = 0.01 * day_offsets  # Slight decline
 
-        depth = base_depth + seasonal + noise + trend
+    depth = base_depth + seasonal + noise + trend
+    site_codes = site_ids[site_idx]
 
-        records.append({
-            "site_code": site_id,
-            "site_name": f"Well {site_id}",
-            "latitude": np.random.uniform(35, 42),
-            "longitude": np.random.uniform(-115, -105),
-            "datetime": measurement_date,
-            "value": round(max(0, depth), 2),  # Depth can't be negative
-            "unit": "ft",
-            "parameter_name": "Depth to water level, feet below land surface",
-            "parameter_code": "72019",
-        })
-
-    return pd.DataFrame(records)
+    return pd.DataFrame({
+        "site_code": site_codes,
+        "site_name": np.char.add("Well ", site_codes),
+        "latitude": rng.uniform(35, 42, n_records),
+        "longitude": rng.uniform(-115, -105, n_records),
+        "datetime": dates,
+        "value": np.maximum(0, depth).round(2),  # Depth can't be negative
+        "unit": "ft",
+        "parameter_name": "Depth to water level, feet below land surface",
+        "parameter_code": "72019",
+    })
 
 
 def generate_water_quality_data(
@@ -188,7 +208,7 @@ def generate_water_quality_data(
     Returns:
         DataFrame with water quality data
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     if start_date is None:
         start_date = datetime.now() - timedelta(days=365)
@@ -210,45 +230,36 @@ def generate_water_quality_data(
         "Phosphorus": (0.1, 0.08, "mg/L"),
         "Arsenic": (5, 3, "ug/L"),
     }
-
-    # Generate site IDs
-    site_ids = [f"WQP-{np.random.randint(10000, 99999)}" for _ in range(n_sites)]
-    site_names = [f"Monitoring Site {i+1}" for i in range(n_sites)]
-    site_coords = [(np.random.uniform(35, 42), np.random.uniform(-115, -105))
-                   for _ in range(n_sites)]
-
-    records = []
-    for _ in range(n_records):
-        site_idx = np.random.randint(0, n_sites)
-        site_id = site_ids[site_idx]
-        site_name = site_names[site_idx]
-        lat, lon = site_coords[site_idx]
-
-        param = np.random.choice(parameters)
-        mean, std, unit = param_dists.get(param, (10, 5, "units"))
-
-        # Random date in range
-        days_range = (end_date - start_date).days
-        measurement_date = start_date + timedelta(days=np.random.randint(0, days_range))
-
-        value = max(0, np.random.normal(mean, std))
-        if param == "pH":
-            value = np.clip(value, 0, 14)
-
-        records.append({
-            "MonitoringLocationIdentifier": site_id,
-            "MonitoringLocationName": site_name,
-            "MonitoringLocationTypeName": np.random.choice(["River/Stream", "Lake", "Well"]),
-            "LatitudeMeasure": lat,
-            "LongitudeMeasure": lon,
-            "ActivityStartDate": measurement_date.strftime("%Y-%m-%d"),
-            "CharacteristicName": param,
-            "ResultMeasureValue": round(value, 3),
-            "ResultMeasure/MeasureUnitCode": unit,
-            "ResultStatusIdentifier": "Final",
-        })
-
-    return pd.DataFrame(records)
+    means, stds, units = zip(*(param_dists.get(p, (10, 5, "units")) for p in parameters))
+
+    # Site attributes, indexed by site number
+    site_ids = np.char.add("WQP-", rng.integers(10000, 99999, n_sites).astype(str))
+    site_names = np.char.add("Monitoring Site ", np.arange(1, n_sites + 1).astype(str))
+    site_lats = rng.uniform(35, 42, n_sites)
+    site_lons = rng.uniform(-115, -105, n_sites)
+
+    # Draw every record's site, parameter, date and value in one call each
+    site_idx = rng.integers(0, n_sites, n_records)
+    param_idx = rng.integers(0, len(parameters), n_records)
+    days_range = (end_date - start_date).days
+    dates = pd.Timestamp(start_date) + pd.to_timedelta(rng.integers(0, days_range, n_records), unit="D")
+
+    values = np.maximum(0, rng.normal(np.take(means, param_idx), np.take(stds, param_idx)))
+    params = np.asarray(parameters)[param_idx]
+    values = np.where(params == "pH", np.clip(values, 0, 14), values)
+
+    return pd.DataFrame({
+        "MonitoringLocationIdentifier": site_ids[site_idx],
+        "MonitoringLocationName": site_names[site_idx],
+        "MonitoringLocationTypeName": rng.choice(["River/Stream", "Lake", "Well"], n_records),
+        "LatitudeMeasure": site_lats[site_idx],
+        "LongitudeMeasure": site_lons[site_idx],
+        "ActivityStartDate": dates.strftime("%Y-%m-%d"),
+        "CharacteristicName": params,
+        "ResultMeasureValue": values.round(3),
+        "ResultMeasure/MeasureUnitCode": np.asarray(units)[param_idx],
+        "ResultStatusIdentifier": "Final",
+    })
 
 
 def generate_mesonet_stations(
@@ -267,36 +278,35 @@ def generate_mesonet_stations(
     Returns:
         DataFrame with Mesonet station information
     """
-    np.random.seed(seed)
-
-    # Montana county names
-    counties = [
-        "Gallatin", "Yellowstone", "Missoula", "Cascade", "Lewis and Clark",
-        "Flathead", "Ravalli", "Silver Bow", "Lake", "Lincoln",
-        "Park", "Carbon", "Stillwater", "Big Horn", "Rosebud",
-    ]
-
-    # Station name prefixes
-    prefixes = ["ace", "agr", "hyd", "met"]
-
-    stations = []
-    for i in range(n_stations):
-        county = np.random.choice(counties)
-        station_id = f"{np.random.choice(prefixes)}{county[:4].lower()}{i:02d}"
-
-        stations.append({
-            "station": station_id,
-            "name": f"{county} Station {i+1}",
-            "county": county,
-            "latitude": np.random.uniform(44.5, 49.0),
-            "longitude": np.random.uniform(-116.0, -104.0),
-            "elevation": np.random.uniform(800, 2500),
-            "network": np.random.choice(["agrinet", "hydromet"], p=[0.7, 0.3]),
-            "active": np.random.choice([True, False], p=[0.9, 0.1]),
-            "date_installed": (datetime.now() - timedelta(days=np.random.randint(365, 3650))).strftime("%Y-%m-%d"),
-        })
-
-    return pd.DataFrame(stations)
+    rng = np.random.default_rng(seed)
+
+    county_idx = rng.integers(0, len(_COUNTIES), n_stations)
+    county = _COUNTIES[county_idx]
+    numbers = np.arange(n_stations)
+
+    station_ids = _concat(
+        _PREFIXES[rng.integers(0, len(_PREFIXES), n_stations)],
+        _COUNTY_CODES[county_idx],
+        np.char.zfill(numbers.astype(str), 2),
+    )
+    installed = pd.Timestamp(datetime.now()) - pd.to_timedelta(
+        rng.integers(365, 3650, n_stations), unit="D"
+    )
+
+    df = pd.DataFrame({
+        "station": station_ids,
+        "name": _concat(county, " Station ", (numbers + 1).astype(str)),
+        "county": county,
+        "latitude": rng.uniform(44.5, 49.0, n_stations),
+        "longitude": rng.uniform(-116.0, -104.0, n_stations),
+        "elevation": rng.uniform(800, 2500, n_stations),
+        "network": rng.choice(["agrinet", "hydromet"], n_stations, p=[0.7, 0.3]),
+        "active": rng.random(n_stations) < 0.9,
+        "date_installed": installed.strftime("%Y-%m-%d"),
+    })
+
+    # Few distinct values, so store as categoricals, like the live client
+    return df.astype({"network": "category", "county": "category", "active": "bool"})
 
 
 def generate_mesonet_observations(
@@ -321,83 +331,98 @@ def generate_mesonet_observations(
     Returns:
         DataFrame with weather observations
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     if start_date is None:
         start_date = datetime.now() - timedelta(days=7)
     if end_date is None:
         end_date = datetime.now()
 
-    active_stations = stations[stations['active'] == True]['station'].tolist()
+    active_stations = stations.loc[stations['active'].astype(bool), 'station'].to_numpy()
 
-    records = []
+    # Index elevations by station for direct lookups
+    elevations = stations.set_index('station')['elevation']
 
     if frequency == "hourly":
-        dates = pd.date_range(start_date, end_date, freq='H')
+        dates = pd.date_range(start_date, end_date, freq='h')
     else:
         dates = pd.date_range(start_date, end_date, freq='D')
 
-    for station in active_stations:
-        station_data = stations[stations['station'] == station].iloc[0]
-        elevation = station_data['elevation']
-
-        # Base temperature varies with elevation
-        base_temp = 15 - (elevation - 1000) * 0.006  # ~6°C per 1000m
-
-        for dt in dates:
-            # Seasonal variation
-            day_of_year = dt.timetuple().tm_yday
-            seasonal = 15 * np.sin(2 * np.pi * (day_of_year - 80) / 365)
-
-            # Diurnal variation (for hourly data)
-            if frequency == "hourly":
-                hour = dt.hour
-                diurnal = 8 * np.sin(2 * np.pi * (hour - 6) / 24)
-            else:
-                diurnal = 0
-
-            # Add noise
-            noise = np.random.normal(0, 2)
-
-            temp = base_temp + seasonal + diurnal + noise
+    # Seasonal, diurnal and solar kernels depend only on the timestamp, so
+    # they are computed once and broadcast across all stations
+    day_of_year = dates.dayofyear.to_numpy()
+    seasonal = 15 * np.sin(2 * np.pi * (day_of_year - 80) / 365)
 
-            record = {
-                "station": station,
-                "datetime" if frequency == "hourly" else "date": dt,
-                "air_temp": round(temp, 1),
-                "relative_humidity": round(np.clip(np.random.normal(60, 20), 10, 100), 1),
-                "wind_speed": round(max(0, np.random.exponential(3)), 1),
-                "wind_direction": np.random.randint(0, 360),
-                "ppt": round(max(0, np.random.exponential(0.1)), 2),
-                "solar_radiation": round(max(0, 500 * max(0, np.sin(2 * np.pi * (dt.hour - 6) / 24)) + np.random.normal(0, 50)), 1) if frequency == "hourly" else None,
-            }
-
-            if frequency == "daily":
-                record["air_temp_max"] = round(temp + np.random.uniform(5, 10), 1)
-                record["air_temp_min"] = round(temp - np.random.uniform(5, 10), 1)
-                del record["solar_radiation"]
+    hour_angle = 2 * np.pi * (dates.hour.to_numpy() - 6) / 24
+    if frequency == "hourly":
+        diurnal = 8 * np.sin(hour_angle)
+    else:
+        diurnal = np.zeros(len(dates))
+    solar = 500 * np.maximum(0, np.sin(hour_angle))
+
+    # Base temperature varies with elevation (~6°C per 1000m)
+    base_temp = 15 - (elevations.loc[active_stations].to_numpy() - 1000) * 0.006
+
+    # One row per station, one column per timestamp; flattened into the
+    # output columns at the end instead of building a dict per record
+    shape = (len(active_stations), len(dates))
+    temps = base_temp[:, None] + (seasonal + diurnal)[None, :]
+
+    # Add noise
+    temps += rng.normal(0, 2, shape)
+
+    time_col = "datetime" if frequency == "hourly" else "date"
+    data = {
+        "station": np.repeat(active_stations, len(dates)),
+        time_col: np.tile(dates.to_numpy(), len(active_stations)),
+        "air_temp": temps.ravel().round(1),
+        "relative_humidity": np.clip(rng.normal(60, 20, shape), 10, 100).ravel().round(1),
+        "wind_speed": rng.exponential(3, shape).ravel().round(1),
+        "wind_direction": rng.integers(0, 360, shape).ravel(),
+        "ppt": rng.exponential(0.1, shape).ravel().round(2),
+    }
 
-            records.append(record)
+    if frequency == "hourly":
+        data["solar_radiation"] = np.maximum(0, solar + rng.normal(0, 50, shape)).ravel().round(1)
+    else:
+        data["air_temp_max"] = (temps + rng.uniform(5, 10, shape)).ravel().round(1)
+        data["air_temp_min"] = (temps - rng.uniform(5, 10, shape)).ravel().round(1)
 
-    return pd.DataFrame(records)
+    return pd.DataFrame(data)
 
 
 def get_or_generate(
     name: str,
     generator_func: Callable[..., pd.DataFrame],
     force_regenerate: bool = False,
+    columns: Optional[list[str]] = None,
+    filters: Optional["pyarrow.compute.Expression"] = None,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """
     Get cached sample data or generate if not exists.
 
-    Caches generated data to parquet files for faster subsequent loads.
+    Caches generated data to zstd-compressed parquet files for faster
+    subsequent loads. Repeated string columns (agency, units, parameter
+    names, ...) are returned as categoricals.
+
+    Each kwargs combination is stored as one part file under
+    SAMPLE_DATA_DIR/<name>/, with a _manifest.json recording the kwargs of
+    every part, so all variants of a dataset can be read together with
+    load_sample_data. Cached parts are read with pyarrow.dataset, so only
+    the requested columns and matching row groups are loaded.
 
     Args:
         name: Name for the cached dataset
         generator_func: Function to generate the data
         force_regenerate: If True, regenerate even if cached version exists
-        **kwargs: Arguments to pass to generator function
+        columns: Columns to return (None for all)
+        filters: pyarrow.compute expression rows must match, e.g.
+            pc.field('state_cd') == 'CO'
+        **kwargs: Arguments to pass to generator function. name,
+            generator_func, force_regenerate, columns and filters are
+            reserved and never reach the generator; wrap a generator that
+            takes one of these so it accepts it under another name.
 
     Returns:
         DataFrame with sample data
@@ -405,26 +430,99 @@ def get_or_generate(
     Example:
         >>> sites = get_or_generate('usgs_sites', generate_usgs_sites, n_sites=100)
     """
-    _ensure_sample_dir()
+    dataset_dir = SAMPLE_DATA_DIR / name
+    dataset_dir.mkdir(parents=True, exist_ok=True)
 
     # Create a hash of the kwargs for cache invalidation
-    kwargs_hash = hashlib.md5(json.dumps(kwargs, sort_keys=True, default=str).encode()).hexdigest()[:8]
-    cache_path = SAMPLE_DATA_DIR / f"{name}_{kwargs_hash}.parquet"
+    kwargs_hash = hashlib.blake2b(_kwargs_key(kwargs), digest_size=4).hexdigest()
+    cache_path = dataset_dir / f"part_{kwargs_hash}.parquet"
 
     if cache_path.exists() and not force_regenerate:
-        return pd.read_parquet(cache_path)
+        return _read_parts(cache_path, columns, filters)
 
     # Generate and cache
     df = generator_func(**kwargs)
-    df.to_parquet(cache_path, index=False)
+    categorical = [col for col in _CATEGORICAL_COLUMNS if col in df.columns]
+    df = df.astype(dict.fromkeys(categorical, "category"))
+    df.to_parquet(
+        cache_path,
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+        row_group_size=65536,
+        index=False,
+    )
+    _update_manifest(dataset_dir, cache_path.name, kwargs)
 
+    if columns is not None or filters is not None:
+        return _read_parts(cache_path, columns, filters)
     return df
 
 
+def _kwargs_key(kwargs: dict) -> bytes:
+    """
+    Serialize generator kwargs for hashing.
+
+    Pickling is C-speed and, unlike str(), covers the full contents of
+    DataFrame arguments. Values that cannot be pickled (lambdas, open
+    handles, ...) fall back to their str() form.
+    """
+    items = sorted(kwargs.items())
+    try:
+        return pickle.dumps(items, protocol=5)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return json.dumps(items, default=str).encode()
+
+
+def load_sample_data(
+    name: str,
+    columns: Optional[list[str]] = None,
+    filters: Optional["pyarrow.compute.Expression"] = None,
+) -> pd.DataFrame:
+    """
+    Load every cached variant of a sample dataset as one DataFrame.
+
+    Reads all part files written by get_or_generate for `name` as a single
+    pyarrow dataset, projecting columns and pushing filters down to the
+    Parquet row groups.
+
+    Args:
+        name: Name of the cached dataset
+        columns: Columns to return (None for all)
+        filters: pyarrow.compute expression rows must match
+
+    Returns:
+        DataFrame with the matching rows of all cached parts (empty if none)
+    """
+    dataset_dir = SAMPLE_DATA_DIR / name
+    if not any(dataset_dir.glob("part_*.parquet")):
+        return pd.DataFrame()
+    return _read_parts(dataset_dir, columns, filters)
+
+
+def _read_parts(path: Path, columns=None, filters=None) -> pd.DataFrame:
+    """Read a part file or directory of parts with column projection and filter pushdown."""
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(str(path), format="parquet")
+    return dataset.to_table(columns=columns, filter=filters).to_pandas()
+
+
+def _update_manifest(dataset_dir: Path, part_name: str, kwargs: dict):
+    """Record the generator kwargs of a part file in the dataset manifest."""
+    manifest_path = dataset_dir / "_manifest.json"
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    manifest[part_name] = {key: str(value) for key, value in sorted(kwargs.items())}
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+
+
 def clear_sample_cache():
     """Clear all cached sample data files."""
     _ensure_sample_dir()
-    for f in SAMPLE_DATA_DIR.glob("*.parquet"):
+    for f in SAMPLE_DATA_DIR.rglob("*.parquet"):
+        f.unlink()
+    for f in SAMPLE_DATA_DIR.glob("*/_manifest.json"):
         f.unlink()
     print(f"Cleared sample data cache at {SAMPLE_DATA_DIR}")
 
@@ -439,23 +537,31 @@ def generate_sample_dataset(
     Returns:
         Dict with DataFrames for each data type
     """
-    np.random.seed(seed)
-
-    usgs_sites = generate_usgs_sites(n_sites=50, state="CO", seed=seed)
-    groundwater = generate_groundwater_levels(n_records=500, seed=seed)
-    water_quality = generate_water_quality_data(n_records=300, seed=seed)
-    mesonet_stations = generate_mesonet_stations(n_stations=30, seed=seed)
-    mesonet_obs = generate_mesonet_observations(
-        mesonet_stations,
-        start_date=datetime.now() - timedelta(days=7),
-        frequency="daily",
-        seed=seed
-    )
+    def generate_mesonet(start_date: datetime) -> tuple[pd.DataFrame, pd.DataFrame]:
+        stations = generate_mesonet_stations(n_stations=30, seed=seed)
+        observations = generate_mesonet_observations(
+            stations,
+            start_date=start_date,
+            frequency="daily",
+            seed=seed
+        )
+        return stations, observations
+
+    # The generators are independent (each seeds its own Generator), so they
+    # run concurrently; NumPy releases the GIL for the bulk array work.
+    # Mesonet observations need the stations, so those two run in sequence.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        usgs_sites = executor.submit(generate_usgs_sites, n_sites=50, state="CO", seed=seed)
+        groundwater = executor.submit(generate_groundwater_levels, n_records=500, seed=seed)
+        water_quality = executor.submit(generate_water_quality_data, n_records=300, seed=seed)
+        mesonet = executor.submit(generate_mesonet, datetime.now() - timedelta(days=7))
+
+    mesonet_stations, mesonet_obs = mesonet.result()
 
     return {
-        "usgs_sites": usgs_sites,
-        "groundwater_levels": groundwater,
-        "water_quality": water_quality,
+        "usgs_sites": usgs_sites.result(),
+        "groundwater_levels": groundwater.result(),
+        "water_quality": water_quality.result(),
         "mesonet_stations": mesonet_stations,
         "mesonet_observations": mesonet_obs,
     }
@@ -8,11 +8,14 @@ Provides access to NWIS (National Water Information System) data including:
 - Water quality measurements
 """
 
-import requests
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
-from io import StringIO
+from typing import Iterable, Optional
+from io import BytesIO
+
+from .http_utils import create_session, iter_json_items
 
 
 class USGSWaterServices:
@@ -37,15 +40,30 @@ class USGSWaterServices:
         "lower_colorado": "15",  # Lower Colorado Region
     }
 
-    def __init__(self, format: str = "json"):
+    # Timeseries fields stored as categories (few distinct values per response)
+    CATEGORICAL_COLUMNS = ("site_code", "site_name", "parameter_code", "parameter_name", "unit")
+
+    # Sites per request in batched retrievals, keeping query strings short
+    SITES_PER_REQUEST = 100
+
+    def __init__(
+        self,
+        format: str = "json",
+        max_workers: int = 8,
+        cache_name: Optional[str] = None,
+    ):
         """
         Initialize USGS client.
 
         Args:
             format: Response format ('json' or 'rdb' for tab-delimited)
+            max_workers: Concurrent requests in batched retrievals
+            cache_name: Path of an on-disk HTTP response cache
+                (e.g. '.geo_toolkit_http_cache'). None disables caching.
         """
         self.format = format
-        self.session = requests.Session()
+        self.max_workers = max_workers
+        self.session = create_session(cache_name, pool_size=max(max_workers, 1))
         self.session.headers.update({
             "Accept": "application/json" if format == "json" else "text/plain"
         })
@@ -90,7 +108,7 @@ class USGSWaterServices:
         response = self.session.get(f"{self.BASE_URL}/site/", params=params)
         response.raise_for_status()
 
-        return self._parse_rdb(response.text)
+        return self._parse_rdb(response.content)
 
     def get_instantaneous_values(
         self,
@@ -127,10 +145,58 @@ class USGSWaterServices:
             if end_date:
                 params["endDT"] = end_date.strftime("%Y-%m-%d")
 
-        response = self.session.get(f"{self.BASE_URL}/iv/", params=params)
-        response.raise_for_status()
+        return self._get_timeseries("iv", params)
+
+    def get_instantaneous_values_batch(
+        self,
+        sites: list[str],
+        parameter_codes: list[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        period: Optional[str] = None,
+        sites_per_request: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Get instantaneous values for many sites and parameters concurrently.
 
-        return self._parse_json_timeseries(response.json())
+        The query is split into one request per parameter code and group of
+        sites, and the requests run on a thread pool over the client's pooled
+        keep-alive connections, so wall time is bounded by the slowest request
+        rather than the sum of all of them.
+
+        Args:
+            sites: List of site numbers
+            parameter_codes: List of parameter codes
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            period: ISO 8601 duration (e.g., 'P7D' for past 7 days)
+            sites_per_request: Sites per request (default SITES_PER_REQUEST)
+
+        Returns:
+            DataFrame with instantaneous values
+        """
+        step = sites_per_request or self.SITES_PER_REQUEST
+        site_groups = [sites[i:i + step] for i in range(0, len(sites), step)]
+        query = {"start_date": start_date, "end_date": end_date, "period": period}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.get_instantaneous_values, group, [code], **query)
+                for code in parameter_codes
+                for group in site_groups
+            ]
+            frames = [f.result() for f in futures]
+
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        result = pd.concat(frames, ignore_index=True)
+
+        # pd.concat only keeps a category dtype when every frame has the same
+        # categories; re-encode the columns that came back as plain strings
+        for col in (*self.CATEGORICAL_COLUMNS, "qualifiers"):
+            result[col] = result[col].astype("category")
+        return result
 
     def get_daily_values(
         self,
@@ -165,10 +231,7 @@ class USGSWaterServices:
         if end_date:
             params["endDT"] = end_date.strftime("%Y-%m-%d")
 
-        response = self.session.get(f"{self.BASE_URL}/dv/", params=params)
-        response.raise_for_status()
-
-        return self._parse_json_timeseries(response.json())
+        return self._get_timeseries("dv", params)
 
     def get_groundwater_levels(
         self,
@@ -206,10 +269,7 @@ class USGSWaterServices:
         if end_date:
             params["endDT"] = end_date.strftime("%Y-%m-%d")
 
-        response = self.session.get(f"{self.BASE_URL}/gwlevels/", params=params)
-        response.raise_for_status()
-
-        return self._parse_json_timeseries(response.json())
+        return self._get_timeseries("gwlevels", params)
 
     def get_colorado_basin_sites(self, basin: str = "upper") -> pd.DataFrame:
         """
@@ -224,61 +284,143 @@ class USGSWaterServices:
         huc = self.COLORADO_BASIN_HUCS.get(f"{basin}_colorado", "14")
         return self.get_sites(huc=huc, site_type="GW")
 
-    def _parse_rdb(self, text: str) -> pd.DataFrame:
-        """Parse USGS RDB (tab-delimited) format."""
-        lines = [line for line in text.split("\n") if not line.startswith("#")]
-        if len(lines) < 2:
+    def _parse_rdb(self, content: bytes) -> pd.DataFrame:
+        """
+        Parse USGS RDB (tab-delimited) format.
+
+        The body is handed to pyarrow's multi-threaded CSV reader as raw
+        bytes. RDB comments only appear as a block at the top of the file, so
+        they are skipped by offset rather than filtered line by line. All
+        columns are read as strings.
+        """
+        # Skip the leading '#' comment block
+        start = 0
+        while content.startswith(b"#", start):
+            newline = content.find(b"\n", start)
+            if newline == -1:
+                return pd.DataFrame()
+            start = newline + 1
+
+        header_end = content.find(b"\n", start)
+        if header_end == -1 or not content[header_end + 1:].strip():
             return pd.DataFrame()
 
-        # Skip the format line (second line after headers)
-        data = "\n".join([lines[0]] + lines[2:])
-        return pd.read_csv(StringIO(data), sep="\t", dtype=str)
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        header = content[start:header_end].rstrip(b"\r")
+        names = header.decode().split("\t")
+        table = pacsv.read_csv(
+            BytesIO(content[header_end + 1:]),
+            # Skip the format line (e.g. '15s\t5s\t...') that follows the header
+            read_options=pacsv.ReadOptions(column_names=names, skip_rows=1),
+            parse_options=pacsv.ParseOptions(delimiter="\t", quote_char=False),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in names},
+                strings_can_be_null=True,
+            ),
+        )
+        return table.to_pandas()
+
+    def _get_timeseries(self, endpoint: str, params: dict) -> pd.DataFrame:
+        """
+        Request a JSON timeseries endpoint and parse it as it streams in.
 
-    def _parse_json_timeseries(self, data: dict) -> pd.DataFrame:
-        """Parse USGS JSON timeseries response."""
-        records = []
+        Each series is decoded from the socket and accumulated as soon as it
+        arrives, so the raw body and the full decoded document are never held
+        in memory at once.
+        """
+        with self.session.get(
+            f"{self.BASE_URL}/{endpoint}/",
+            params=params,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            return self._parse_json_timeseries(
+                iter_json_items(response, "value.timeSeries.item")
+            )
+
+    def _parse_json_timeseries(self, ts_data: Iterable[dict]) -> pd.DataFrame:
+        """Parse the timeSeries entries of a USGS JSON timeseries response."""
+        # Series-level fields are accumulated column-wise, one list per
+        # column, and broadcast to each series' points at the end; the points
+        # themselves go to the DataFrame constructor as-is instead of being
+        # copied into a new dict each
+        series_cols = {
+            "site_code": [],
+            "site_name": [],
+            "latitude": [],
+            "longitude": [],
+            "parameter_code": [],
+            "parameter_name": [],
+            "unit": [],
+        }
+        points = []
+        counts = []
 
-        ts_data = data.get("value", {}).get("timeSeries", [])
+        # Shared fallbacks for missing (or null) fields, instead of a new
+        # empty dict or list per lookup
+        empty = {}
+        no_codes = (empty,)
 
         for series in ts_data:
-            site_code = series.get("sourceInfo", {}).get("siteCode", [{}])[0].get("value")
-            site_name = series.get("sourceInfo", {}).get("siteName")
+            source_info = series.get("sourceInfo") or empty
+            series_cols["site_code"].append((source_info.get("siteCode") or no_codes)[0].get("value"))
+            series_cols["site_name"].append(source_info.get("siteName"))
 
             # Get coordinates
-            geo_location = series.get("sourceInfo", {}).get("geoLocation", {}).get("geogLocation", {})
-            latitude = geo_location.get("latitude")
-            longitude = geo_location.get("longitude")
-
-            variable = series.get("variable", {})
-            param_code = variable.get("variableCode", [{}])[0].get("value")
-            param_name = variable.get("variableName")
-            unit = variable.get("unit", {}).get("unitCode")
-
-            for value_set in series.get("values", []):
-                for point in value_set.get("value", []):
-                    records.append({
-                        "site_code": site_code,
-                        "site_name": site_name,
-                        "latitude": latitude,
-                        "longitude": longitude,
-                        "parameter_code": param_code,
-                        "parameter_name": param_name,
-                        "datetime": point.get("dateTime"),
-                        "value": point.get("value"),
-                        "unit": unit,
-                        "qualifiers": ",".join(point.get("qualifiers", [])),
-                    })
-
-        df = pd.DataFrame(records)
-
-        if not df.empty and "datetime" in df.columns:
-            df["datetime"] = pd.to_datetime(df["datetime"])
-            df["value"] = pd.to_numeric(df["value"], errors="coerce")
-            df["latitude"] = pd.to_numeric(df["latitude"], errors="coerce")
-            df["longitude"] = pd.to_numeric(df["longitude"], errors="coerce")
+            geo_location = (source_info.get("geoLocation") or empty).get("geogLocation") or empty
+            series_cols["latitude"].append(geo_location.get("latitude"))
+            series_cols["longitude"].append(geo_location.get("longitude"))
+
+            variable = series.get("variable") or empty
+            series_cols["parameter_code"].append((variable.get("variableCode") or no_codes)[0].get("value"))
+            series_cols["parameter_name"].append(variable.get("variableName"))
+            series_cols["unit"].append((variable.get("unit") or empty).get("unitCode"))
+
+            n_points = 0
+            for value_set in series.get("values") or ():
+                series_points = value_set.get("value") or ()
+                points.extend(series_points)
+                n_points += len(series_points)
+            counts.append(n_points)
+
+        if not points:
+            return pd.DataFrame()
+
+        # Column types are inferred and coordinates converted once per series,
+        # then the rows are repeated out to one per point. The string fields
+        # repeat for every point, so they are dictionary-encoded as categories.
+        # Numbers are stored as float32, ample for gauge readings and site
+        # coordinates (~1 m), halving their memory and Parquet size. The cast
+        # is explicit so every batch gets the same dtype whatever its values.
+        series_df = pd.DataFrame(series_cols)
+        for col in ("latitude", "longitude"):
+            series_df[col] = pd.to_numeric(series_df[col], errors="coerce").astype(np.float32)
+        for col in self.CATEGORICAL_COLUMNS:
+            series_df[col] = series_df[col].astype("category")
+        df = series_df.take(np.repeat(np.arange(len(counts)), counts)).reset_index(drop=True)
+
+        point_df = pd.DataFrame(points, columns=["dateTime", "value", "qualifiers"])
+        df.insert(6, "datetime", self._parse_datetimes(point_df["dateTime"]))
+        df.insert(7, "value", pd.to_numeric(point_df["value"], errors="coerce").astype(np.float32))
+        # Qualifier lists are joined in one column-level pass; only a handful
+        # of distinct codes occur, so the result is stored as a category
+        df["qualifiers"] = point_df["qualifiers"].str.join(",").fillna("").astype("category")
 
         return df
 
+    @staticmethod
+    def _parse_datetimes(values: pd.Series) -> pd.Series:
+        """
+        Parse USGS ISO 8601 timestamps as UTC (memoized; timestamps repeat across series).
+
+        Always converting to UTC gives every response the same dtype, whatever
+        its sites' offsets or a daylight saving change within the period, so
+        batches concatenate without falling back to object columns.
+        """
+        return pd.to_datetime(values, format="ISO8601", utc=True, cache=True)
+
 
 # Example usage
 if __name__ == "__main__":
@@ -9,24 +9,48 @@ Parquet is a columnar storage format that provides:
 - Support for geospatial data via GeoParquet
 """
 
+import os
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Union
 from datetime import datetime
 
 
+# zstd level used when none is given: noticeably smaller files than snappy
+# at similar read speed
+DEFAULT_ZSTD_LEVEL = 3
+
+# Largest file written per partition by partitioned saves
+MAX_ROWS_PER_FILE = 1_000_000
+
 # Default data directories (relative to project root)
 RAW_DATA_DIR = Path(__file__).parent.parent.parent / "data" / "raw"
 PROCESSED_DATA_DIR = Path(__file__).parent.parent.parent / "data" / "processed"
 
 
+def _ensure_dir(path: Path) -> Path:
+    """
+    Create a directory (and parents) if it does not exist.
+
+    Repeated saves into an existing directory cost a single stat call; a
+    directory removed between saves (e.g. by pipeline cleanup) is recreated.
+    """
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def save_parquet(
     df: pd.DataFrame,
     name: str,
     data_dir: Optional[Path] = None,
     partition_cols: Optional[list[str]] = None,
-    compression: str = "snappy",
+    compression: str = "zstd",
     add_timestamp: bool = False,
+    compression_level: Optional[int] = None,
+    column_encoding: Optional[dict[str, str]] = None,
+    auto_downcast: bool = False,
 ) -> Path:
     """
     Save DataFrame to Parquet format.
@@ -35,37 +59,104 @@ def save_parquet(
         df: DataFrame to save
         name: Base name for the file (without extension)
         data_dir: Directory to save to (default: data/processed)
-        partition_cols: Columns to partition by (creates directory structure)
-        compression: Compression algorithm ('snappy', 'gzip', 'brotli', 'zstd')
+        partition_cols: Columns to partition by (creates a hive-style
+            directory structure, e.g. year=2024/, with files of at most
+            MAX_ROWS_PER_FILE rows; saving again replaces those partitions)
+        compression: Compression algorithm ('zstd', 'snappy', 'gzip', 'brotli')
         add_timestamp: Add timestamp to filename
+        compression_level: Codec compression level (default: DEFAULT_ZSTD_LEVEL
+            for zstd, the codec's own default otherwise)
+        column_encoding: Parquet encodings for specific columns, e.g.
+            {"datetime": "DELTA_BINARY_PACKED", "value": "BYTE_STREAM_SPLIT"};
+            these columns are written without dictionary encoding
+        auto_downcast: Store every float64 column as float32, halving its
+            size. Keeps about 7 significant digits; leave False when full
+            double precision is needed. The stored types depend only on the
+            input dtypes, so repeated saves share one schema.
 
     Returns:
         Path to saved file/directory
+
+    Raises:
+        ValueError: If auto_downcast is set and a float column holds values
+            beyond float32's range
     """
-    data_dir = data_dir or PROCESSED_DATA_DIR
-    data_dir.mkdir(parents=True, exist_ok=True)
+    data_dir = _ensure_dir(data_dir or PROCESSED_DATA_DIR)
 
     if add_timestamp:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         name = f"{name}_{timestamp}"
 
+    if auto_downcast:
+        df = _downcast_floats(df)
+
+    write_options = _write_options(df.columns, compression, compression_level, column_encoding)
+
     if partition_cols:
         # Partitioned dataset (creates directory structure)
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
         output_path = data_dir / name
-        df.to_parquet(
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        ds.write_dataset(
+            table,
             output_path,
-            partition_cols=partition_cols,
-            compression=compression,
-            index=False,
+            format="parquet",
+            partitioning=partition_cols,
+            partitioning_flavor="hive",
+            max_rows_per_file=MAX_ROWS_PER_FILE,
+            max_rows_per_group=MAX_ROWS_PER_FILE,
+            # Replace the partitions being written instead of adding files next
+            # to their previous contents
+            existing_data_behavior="delete_matching",
+            file_options=ds.ParquetFileFormat().make_write_options(**write_options),
         )
     else:
         # Single file
         output_path = data_dir / f"{name}.parquet"
-        df.to_parquet(output_path, compression=compression, index=False)
+        df.to_parquet(output_path, index=False, **write_options)
 
     return output_path
 
 
+def _downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast every float64 column to float32, refusing values that would overflow."""
+    floats = df.select_dtypes(include="float64")
+    if floats.empty:
+        return df
+
+    values = floats.to_numpy()
+    overflow = np.isfinite(values) & (np.abs(values) > np.finfo(np.float32).max)
+    if overflow.any():
+        columns = ", ".join(map(str, floats.columns[overflow.any(axis=0)].unique()))
+        raise ValueError(
+            f"Values out of float32 range in: {columns}. Save with auto_downcast=False."
+        )
+
+    return df.astype(dict.fromkeys(floats.columns, np.float32))
+
+
+def _write_options(
+    columns,
+    compression: str,
+    compression_level: Optional[int] = None,
+    column_encoding: Optional[dict[str, str]] = None,
+) -> dict:
+    """Build pyarrow Parquet writer options for the save functions."""
+    if compression_level is None and compression == "zstd":
+        compression_level = DEFAULT_ZSTD_LEVEL
+
+    options = {"compression": compression}
+    if compression_level is not None:
+        options["compression_level"] = compression_level
+    if column_encoding:
+        # pyarrow rejects explicit encodings on dictionary-encoded columns
+        options["column_encoding"] = column_encoding
+        options["use_dictionary"] = [str(col) for col in columns if col not in column_encoding]
+    return options
+
+
 def load_parquet(
     name: str,
     data_dir: Optional[Path] = None,
@@ -102,8 +193,9 @@ def save_geoparquet(
     gdf: "geopandas.GeoDataFrame",
     name: str,
     data_dir: Optional[Path] = None,
-    compression: str = "snappy",
+    compression: str = "zstd",
     add_timestamp: bool = False,
+    compression_level: Optional[int] = None,
 ) -> Path:
     """
     Save GeoDataFrame to GeoParquet format.
@@ -119,19 +211,20 @@ def save_geoparquet(
         data_dir: Directory to save to
         compression: Compression algorithm
         add_timestamp: Add timestamp to filename
+        compression_level: Codec compression level (default: DEFAULT_ZSTD_LEVEL
+            for zstd, the codec's own default otherwise)
 
     Returns:
         Path to saved file
     """
-    data_dir = data_dir or PROCESSED_DATA_DIR
-    data_dir.mkdir(parents=True, exist_ok=True)
+    data_dir = _ensure_dir(data_dir or PROCESSED_DATA_DIR)
 
     if add_timestamp:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         name = f"{name}_{timestamp}"
 
     output_path = data_dir / f"{name}.parquet"
-    gdf.to_parquet(output_path, compression=compression, index=False)
+    gdf.to_parquet(output_path, index=False, **_write_options(gdf.columns, compression, compression_level))
 
     return output_path
 
@@ -191,21 +284,39 @@ def list_datasets(
         })
 
     # Also check for partitioned datasets (directories)
-    for path in data_dir.iterdir():
-        if path.is_dir() and list(path.glob("**/*.parquet")):
-            # Sum size of all parquet files in directory
-            total_size = sum(f.stat().st_size for f in path.glob("**/*.parquet"))
-            datasets.append({
-                "name": path.name,
-                "path": path,
-                "size_mb": total_size / (1024 * 1024),
-                "modified": datetime.fromtimestamp(path.stat().st_mtime),
-                "partitioned": True,
-            })
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            n_files, total_size = _parquet_tree_size(entry.path)
+            if n_files:
+                datasets.append({
+                    "name": entry.name,
+                    "path": Path(entry.path),
+                    "size_mb": total_size / (1024 * 1024),
+                    "modified": datetime.fromtimestamp(entry.stat().st_mtime),
+                    "partitioned": True,
+                })
 
     return sorted(datasets, key=lambda x: x["modified"], reverse=True)
 
 
+def _parquet_tree_size(path: str) -> tuple[int, int]:
+    """Count and total the size of the .parquet files under a directory in one walk."""
+    n_files = 0
+    total_size = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                sub_files, sub_size = _parquet_tree_size(entry.path)
+                n_files += sub_files
+                total_size += sub_size
+            elif entry.name.endswith(".parquet") and entry.is_file():
+                n_files += 1
+                total_size += entry.stat().st_size
+    return n_files, total_size
+
+
 def parquet_info(
     name: str,
     data_dir: Optional[Path] = None,
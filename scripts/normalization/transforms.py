@@ -2,14 +2,35 @@
 Data Normalization and Transformation Utilities
 
 Common transformations for cleaning and standardizing water/environmental data.
+
+The transforms never modify their input. They return a new DataFrame that
+replaces only the columns they change and shares the rest with the input,
+rather than deep-copying the whole frame first.
 """
 
 import pandas as pd
 import numpy as np
 import re
+import warnings
+from pandas.tseries.api import guess_datetime_format
 from typing import Optional, Union
 
 
+# Patterns used by normalize_column_names, compiled once at import
+_CAMEL_BOUNDARY = re.compile(r'([a-z])([A-Z])')
+_SEPARATORS = re.compile(r'[\s\-\.]+')
+_NON_ALNUM = re.compile(r'[^a-zA-Z0-9_]')
+_UNDERSCORE_RUNS = re.compile(r'_+')
+
+# Date-like words in a column name, as whole words ('sample_date',
+# 'created_at', 'ActivityStartDate' once camelCase is split) rather than
+# substrings, so names like 'width' or 'runtime_minutes' are not matched
+_DATE_COLUMN = re.compile(
+    r'(?:^|[\W_])(?:date|time|timestamp|datetime|dt|created|updated)s?(?:$|[\W_])',
+    re.IGNORECASE,
+)
+
+
 def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardize column names to snake_case.
@@ -27,19 +48,17 @@ def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     def to_snake_case(name: str) -> str:
         # Handle camelCase
-        name = re.sub(r'([a-z])([A-Z])', r'\1_\2', name)
+        name = _CAMEL_BOUNDARY.sub(r'\1_\2', name)
         # Handle spaces and special chars
-        name = re.sub(r'[\s\-\.]+', '_', name)
+        name = _SEPARATORS.sub('_', name)
         # Remove non-alphanumeric
-        name = re.sub(r'[^a-zA-Z0-9_]', '', name)
+        name = _NON_ALNUM.sub('', name)
         # Lowercase and collapse multiple underscores
-        name = re.sub(r'_+', '_', name.lower())
+        name = _UNDERSCORE_RUNS.sub('_', name.lower())
         # Remove leading/trailing underscores
         return name.strip('_')
 
-    df = df.copy()
-    df.columns = [to_snake_case(col) for col in df.columns]
-    return df
+    return df.rename(columns=to_snake_case)
 
 
 def standardize_dates(
@@ -60,23 +79,21 @@ def standardize_dates(
     Returns:
         DataFrame with standardized dates
     """
-    df = df.copy()
+    df = df.copy(deep=False)
 
     # Auto-detect date columns if not specified
     if date_columns is None:
-        date_columns = []
-        date_keywords = ['date', 'time', 'timestamp', 'datetime', 'dt', 'created', 'updated']
-        for col in df.columns:
-            col_lower = col.lower()
-            if any(kw in col_lower for kw in date_keywords):
-                date_columns.append(col)
+        date_columns = [
+            col for col in df.columns
+            if _DATE_COLUMN.search(_CAMEL_BOUNDARY.sub(r'\1_\2', str(col)))
+        ]
 
     for col in date_columns:
         if col not in df.columns:
             continue
 
         # Parse to datetime
-        df[col] = pd.to_datetime(df[col], errors='coerce')
+        df[col] = _parse_dates(df[col])
 
         # Convert timezone if specified
         if timezone and df[col].dt.tz is None:
@@ -91,6 +108,43 @@ def standardize_dates(
     return df
 
 
+def _parse_dates(series: pd.Series) -> pd.Series:
+    """
+    Parse a column to datetime using a format guessed from its first value.
+
+    Parsing with one explicit format (and cached repeated values) is much
+    faster than inferring each value. Values that do not match the guessed
+    format are re-parsed individually with a warning, since they may read
+    day and month in a different order; unparseable values become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    first = series.dropna()
+    fmt = guess_datetime_format(str(first.iloc[0])) if not first.empty else None
+
+    try:
+        parsed = pd.to_datetime(series, errors='coerce', format=fmt or 'mixed', cache=True)
+    except ValueError:
+        # Mixed UTC offsets, e.g. a period spanning a daylight saving change
+        parsed = pd.to_datetime(series, errors='coerce', format=fmt or 'mixed', utc=True, cache=True)
+
+    if fmt is not None:
+        failed = parsed.isna() & series.notna()
+        if failed.any():
+            reparsed = pd.to_datetime(
+                series[failed], errors='coerce', format='mixed', utc=parsed.dt.tz is not None
+            )
+            if reparsed.notna().any():
+                warnings.warn(
+                    f"{reparsed.notna().sum()} values in column {series.name!r} do not match the "
+                    f"format {fmt!r} and were parsed individually; check their day/month order",
+                    stacklevel=3,
+                )
+            parsed[failed] = reparsed
+    return parsed
+
+
 def standardize_coordinates(
     df: pd.DataFrame,
     lat_col: str = 'latitude',
@@ -109,7 +163,7 @@ def standardize_coordinates(
     Returns:
         DataFrame or GeoDataFrame with standardized coordinates
     """
-    df = df.copy()
+    df = df.copy(deep=False)
 
     # Common variations of lat/lon column names
     lat_variations = ['lat', 'latitude', 'y', 'lat_dd', 'dec_lat_va']
@@ -131,62 +185,53 @@ def standardize_coordinates(
     if actual_lon and actual_lon != lon_col:
         df[lon_col] = df[actual_lon]
 
-    # Convert to numeric
-    if lat_col in df.columns:
-        df[lat_col] = pd.to_numeric(df[lat_col], errors='coerce')
-    if lon_col in df.columns:
-        df[lon_col] = pd.to_numeric(df[lon_col], errors='coerce')
-
-    # Validate coordinate ranges
-    if lat_col in df.columns:
-        invalid_lat = (df[lat_col] < -90) | (df[lat_col] > 90)
-        if invalid_lat.any():
-            print(f"Warning: {invalid_lat.sum()} invalid latitude values set to NaN")
-            df.loc[invalid_lat, lat_col] = np.nan
-
-    if lon_col in df.columns:
-        invalid_lon = (df[lon_col] < -180) | (df[lon_col] > 180)
-        if invalid_lon.any():
-            print(f"Warning: {invalid_lon.sum()} invalid longitude values set to NaN")
-            df.loc[invalid_lon, lon_col] = np.nan
+    # Convert to numeric and null out-of-range values, with one range check
+    # (|value| > limit, which also catches infinities) per column
+    for col, limit, label in ((lat_col, 90, 'latitude'), (lon_col, 180, 'longitude')):
+        if col not in df.columns:
+            continue
+        values = pd.to_numeric(df[col], errors='coerce')
+        invalid = np.abs(values.to_numpy(dtype=np.float64, na_value=np.nan)) > limit
+        n_invalid = np.count_nonzero(invalid)
+        if n_invalid:
+            print(f"Warning: {n_invalid} invalid {label} values set to NaN")
+            values = values.mask(invalid)
+        df[col] = values
 
     if create_geometry:
         import geopandas as gpd
-        from shapely.geometry import Point
 
-        # Create geometry only for valid coordinates
-        valid_mask = df[lat_col].notna() & df[lon_col].notna()
-        geometry = [
-            Point(lon, lat) if valid else None
-            for lon, lat, valid in zip(df[lon_col], df[lat_col], valid_mask)
-        ]
+        # Build all points in one vectorized call, then blank out rows with
+        # missing coordinates (None rather than POINT (NaN NaN))
+        geometry = gpd.points_from_xy(df[lon_col], df[lat_col], crs="EPSG:4326")
+        geometry[(df[lat_col].isna() | df[lon_col].isna()).to_numpy()] = None
 
         return gpd.GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
 
     return df
 
 
-# Unit conversion factors
+# Unit conversions as affine (scale, offset) pairs: converted = value * scale + offset
 UNIT_CONVERSIONS = {
     # Length
-    ('feet', 'meters'): 0.3048,
-    ('meters', 'feet'): 3.28084,
-    ('inches', 'mm'): 25.4,
-    ('mm', 'inches'): 0.0393701,
+    ('feet', 'meters'): (0.3048, 0.0),
+    ('meters', 'feet'): (3.28084, 0.0),
+    ('inches', 'mm'): (25.4, 0.0),
+    ('mm', 'inches'): (0.0393701, 0.0),
 
     # Volume flow
-    ('cfs', 'm3/s'): 0.0283168,  # cubic feet/sec to cubic meters/sec
-    ('m3/s', 'cfs'): 35.3147,
-    ('gpm', 'l/min'): 3.78541,   # gallons/min to liters/min
+    ('cfs', 'm3/s'): (0.0283168, 0.0),  # cubic feet/sec to cubic meters/sec
+    ('m3/s', 'cfs'): (35.3147, 0.0),
+    ('gpm', 'l/min'): (3.78541, 0.0),   # gallons/min to liters/min
 
     # Temperature
-    ('fahrenheit', 'celsius'): lambda f: (f - 32) * 5/9,
-    ('celsius', 'fahrenheit'): lambda c: c * 9/5 + 32,
+    ('fahrenheit', 'celsius'): (5/9, -32 * 5/9),
+    ('celsius', 'fahrenheit'): (9/5, 32.0),
 
     # Concentration
-    ('mg/l', 'ug/l'): 1000,
-    ('ug/l', 'mg/l'): 0.001,
-    ('ppm', 'mg/l'): 1.0,  # For dilute aqueous solutions
+    ('mg/l', 'ug/l'): (1000, 0.0),
+    ('ug/l', 'mg/l'): (0.001, 0.0),
+    ('ppm', 'mg/l'): (1.0, 0.0),  # For dilute aqueous solutions
 }
 
 
@@ -210,23 +255,32 @@ def convert_units(
     Returns:
         DataFrame with converted values
     """
-    df = df.copy()
+    df = df.copy(deep=False)
 
     key = (from_unit.lower(), to_unit.lower())
     if key not in UNIT_CONVERSIONS:
         raise ValueError(f"Unknown conversion: {from_unit} to {to_unit}")
 
-    factor = UNIT_CONVERSIONS[key]
+    scale, offset = UNIT_CONVERSIONS[key]
     output_col = new_column or column
 
-    if callable(factor):
-        df[output_col] = df[column].apply(lambda x: factor(x) if pd.notna(x) else np.nan)
-    else:
-        df[output_col] = df[column] * factor
+    # Vectorized; missing values propagate as NaN
+    converted = df[column] * scale
+    if offset:
+        converted += offset
+    df[output_col] = converted
 
     return df
 
 
+# Column-wise fill values for handle_missing_values' numeric_fill options
+_NUMERIC_FILLS = {
+    'mean': lambda numeric: numeric.mean(),
+    'median': lambda numeric: numeric.median(),
+    'zero': lambda numeric: 0,
+}
+
+
 def handle_missing_values(
     df: pd.DataFrame,
     strategy: str = 'drop',
@@ -247,7 +301,7 @@ def handle_missing_values(
     Returns:
         DataFrame with missing values handled
     """
-    df = df.copy()
+    df = df.copy(deep=False)
 
     if columns:
         subset = columns
@@ -261,20 +315,29 @@ def handle_missing_values(
         if fill_value is not None:
             df[subset] = df[subset].fillna(fill_value)
         else:
-            # Fill numeric columns based on numeric_fill strategy
-            numeric_cols = df[subset].select_dtypes(include=[np.number]).columns
-            for col in numeric_cols:
-                if numeric_fill == 'mean':
-                    df[col] = df[col].fillna(df[col].mean())
-                elif numeric_fill == 'median':
-                    df[col] = df[col].fillna(df[col].median())
-                elif numeric_fill == 'zero':
-                    df[col] = df[col].fillna(0)
-
-            # Fill non-numeric with 'Unknown'
-            non_numeric = df[subset].select_dtypes(exclude=[np.number]).columns
-            for col in non_numeric:
-                df[col] = df[col].fillna('Unknown')
+            # Select by position, relabelled with the positions, so duplicate
+            # column names (e.g. after source renames) are kept apart
+            positions = np.flatnonzero(df.columns.isin(subset))
+            selected = df.iloc[:, positions].set_axis(positions, axis=1)
+
+            # Fill numeric columns based on numeric_fill strategy, with the
+            # fill values for all columns computed in one pass
+            numeric = selected.select_dtypes(include=[np.number])
+            fill = _NUMERIC_FILLS.get(numeric_fill)
+            if fill is not None:
+                numeric = numeric.fillna(fill(numeric))
+
+            # Fill non-numeric with 'Unknown'; categoricals only accept
+            # values among their categories
+            non_numeric = selected.select_dtypes(exclude=[np.number])
+            non_numeric = non_numeric.apply(
+                lambda col: col.cat.add_categories('Unknown')
+                if isinstance(col.dtype, pd.CategoricalDtype) and 'Unknown' not in col.cat.categories
+                else col
+            ).fillna('Unknown')
+
+            for position, values in (*numeric.items(), *non_numeric.items()):
+                df.isetitem(position, values)
 
     elif strategy == 'interpolate':
         numeric_cols = df[subset].select_dtypes(include=[np.number]).columns
@@ -283,6 +346,31 @@ def handle_missing_values(
     return df
 
 
+# Column renames applied by normalize_water_data, per source, to the
+# snake_case names produced by normalize_column_names
+SOURCE_RENAMES = {
+    # USGS uses specific column names
+    'usgs': {
+        'site_no': 'site_id',
+        'station_nm': 'site_name',
+        'dec_lat_va': 'latitude',
+        'dec_long_va': 'longitude',
+    },
+    # EPA WQP normalizations
+    'epa': {
+        'monitoringlocationidentifier': 'site_id',
+        'monitoringlocationname': 'site_name',
+        'activitystartdate': 'measurement_date',
+        'resultmeasurevalue': 'value',
+        'resultmeasure_measureunitcode': 'unit',
+    },
+    # NOAA normalizations
+    'noaa': {
+        'date': 'measurement_date',
+    },
+}
+
+
 def normalize_water_data(
     df: pd.DataFrame,
     source: str = 'generic',
@@ -300,8 +388,6 @@ def normalize_water_data(
     Returns:
         Normalized DataFrame
     """
-    df = df.copy()
-
     # Normalize column names
     df = normalize_column_names(df)
 
@@ -311,32 +397,10 @@ def normalize_water_data(
     # Standardize coordinates
     df = standardize_coordinates(df)
 
-    # Source-specific normalizations
-    if source == 'usgs':
-        # USGS uses specific column names
-        rename_map = {
-            'site_no': 'site_id',
-            'station_nm': 'site_name',
-            'dec_lat_va': 'latitude',
-            'dec_long_va': 'longitude',
-        }
-        df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
-
-    elif source == 'epa':
-        # EPA WQP normalizations
-        rename_map = {
-            'monitoringlocationidentifier': 'site_id',
-            'monitoringlocationname': 'site_name',
-            'activitystartdate': 'measurement_date',
-            'resultmeasurevalue': 'value',
-            'resultmeasure_measureunitcode': 'unit',
-        }
-        df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
-
-    elif source == 'noaa':
-        # NOAA normalizations
-        if 'date' in df.columns:
-            df = df.rename(columns={'date': 'measurement_date'})
+    # Source-specific column names (names absent from df are ignored)
+    rename_map = SOURCE_RENAMES.get(source)
+    if rename_map:
+        df = df.rename(columns=rename_map)
 
     # Handle missing values (conservative approach)
     df = handle_missing_values(df, strategy='fill', numeric_fill='median')
@@ -8,6 +8,8 @@ import pandas as pd
 import numpy as np
 import folium
 from folium import plugins
+from functools import reduce
+from itertools import repeat
 import geopandas as gpd
 import matplotlib.pyplot as plt
 from typing import Optional, Union, Tuple, List
@@ -24,6 +26,15 @@ COLORADO_BASIN_BOUNDS = {
     'bounds': [[31.0, -117.5], [42.0, -105.5]],
 }
 
+# Builds one clustered circle marker from a [lat, lon, popup, color, radius] row
+_CLUSTER_MARKER_CALLBACK = """function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: row[4], color: row[3], fill: true, fillOpacity: 0.7,
+    });
+    marker.bindPopup(row[2], {maxWidth: 300});
+    return marker;
+}"""
+
 
 def point_map(
     df: pd.DataFrame,
@@ -38,6 +49,8 @@ def point_map(
     tiles: str = 'OpenStreetMap',
     cluster: bool = False,
     save_path: Optional[Path] = None,
+    max_points: Optional[int] = 20000,
+    bounds: Optional[list[list[float]]] = None,
 ) -> folium.Map:
     """
     Create an interactive point map with Folium.
@@ -55,12 +68,18 @@ def point_map(
         tiles: Base map tiles ('OpenStreetMap', 'CartoDB positron', etc.)
         cluster: Use marker clustering for many points
         save_path: Path to save HTML file
+        max_points: Subsample to about this many markers (stratified by
+            color_col when given); None to keep every point
+        bounds: Only plot points inside [[south, west], [north, east]],
+            e.g. COLORADO_BASIN_BOUNDS['bounds']
 
     Returns:
         Folium Map object
     """
-    # Filter to valid coordinates
+    # Filter to valid coordinates (inside bounds, if given)
     valid_df = df.dropna(subset=[lat_col, lon_col])
+    if bounds is not None:
+        valid_df = _within_bounds(valid_df, lat_col, lon_col, bounds)
 
     if valid_df.empty:
         raise ValueError("No valid coordinates found")
@@ -72,14 +91,6 @@ def point_map(
     # Create map
     m = folium.Map(location=center, zoom_start=zoom, tiles=tiles)
 
-    # Set up clustering if requested
-    if cluster:
-        marker_cluster = plugins.MarkerCluster()
-        m.add_child(marker_cluster)
-        add_to = marker_cluster
-    else:
-        add_to = m
-
     # Default colors
     default_colors = ['blue', 'green', 'red', 'purple', 'orange', 'darkred',
                      'darkblue', 'darkgreen', 'cadetblue', 'pink']
@@ -94,40 +105,63 @@ def point_map(
     if popup_cols is None:
         popup_cols = [col for col in valid_df.columns
                      if col not in [lat_col, lon_col, 'geometry']]
+    popup_cols = [col for col in popup_cols if col in valid_df.columns]
+
+    # Bound the number of markers written to the page
+    valid_df = _sample_points(m, valid_df, max_points, strata_col=color_col)
 
-    # Add markers
-    for idx, row in valid_df.iterrows():
-        lat, lon = row[lat_col], row[lon_col]
-
-        # Build popup content
-        popup_html = "<br>".join([
-            f"<b>{col}:</b> {row[col]}"
-            for col in popup_cols if col in row.index
-        ])
-
-        # Determine color
-        color = 'blue'
-        if color_col and color_map:
-            color = color_map.get(row[color_col], 'blue')
-
-        # Determine radius
-        radius = 6
-        if size_col and pd.notna(row.get(size_col)):
-            # Scale radius between 4 and 20
-            size_val = row[size_col]
-            min_val = valid_df[size_col].min()
-            max_val = valid_df[size_col].max()
-            if max_val > min_val:
-                radius = 4 + 16 * (size_val - min_val) / (max_val - min_val)
-
-        folium.CircleMarker(
-            location=[lat, lon],
-            radius=radius,
-            popup=folium.Popup(popup_html, max_width=300),
-            color=color,
-            fill=True,
-            fillOpacity=0.7,
-        ).add_to(add_to)
+    # Marker colors, looked up once per point
+    if color_col and color_map:
+        colors = [color_map.get(val, 'blue') for val in valid_df[color_col].tolist()]
+    else:
+        colors = repeat('blue')
+
+    # Marker radii, scaled between 4 and 20 over the size column's range
+    # (6 where there is no size value or no range)
+    radii = repeat(6)
+    if size_col:
+        sizes = valid_df[size_col]
+        min_val, max_val = sizes.min(), sizes.max()
+        if max_val > min_val:
+            scaled = 4 + 16 * (sizes.to_numpy(dtype=np.float64, na_value=np.nan) - min_val) / (max_val - min_val)
+            radii = np.where(np.isnan(scaled), 6, scaled).tolist()
+
+    # Popup content, built column by column with vectorized string ops
+    parts = [f"<b>{col}:</b> " + valid_df[col].astype(str).fillna('nan') for col in popup_cols]
+    popups = reduce(lambda a, b: a + "<br>" + b, parts).tolist() if parts else repeat("")
+
+    # Pull each column out once rather than boxing every row into a Series
+    lats = valid_df[lat_col].tolist()
+    lons = valid_df[lon_col].tolist()
+
+    # Add markers as one layer: the browser builds each circle from plain
+    # data instead of Folium rendering a CircleMarker element per point
+    if cluster:
+        plugins.FastMarkerCluster(
+            [list(row) for row in zip(lats, lons, popups, colors, radii)],
+            callback=_CLUSTER_MARKER_CALLBACK,
+        ).add_to(m)
+    else:
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {
+                    "popup": popup_html,
+                    "style": {"color": color, "fillColor": color, "radius": radius},
+                },
+            }
+            for lat, lon, popup_html, color, radius in zip(lats, lons, popups, colors, radii)
+        ]
+        # Without a style_function, Folium applies each feature's
+        # properties.style client-side
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            marker=folium.CircleMarker(fill=True, fill_opacity=0.7),
+            popup=folium.GeoJsonPopup(
+                fields=["popup"], labels=False, localize=False, max_width=300,
+            ),
+        ).add_to(m)
 
     # Add legend if color_col provided
     if color_col and color_map:
@@ -171,7 +205,10 @@ def choropleth_map(
         Folium Map object
     """
     if center is None:
-        center = [gdf.geometry.centroid.y.mean(), gdf.geometry.centroid.x.mean()]
+        # One point per polygon, computed once; representative points are
+        # cheaper than centroids and always fall inside their polygon
+        points = gdf.geometry.representative_point()
+        center = [points.y.mean(), points.x.mean()]
 
     m = folium.Map(location=center, zoom_start=zoom, tiles=tiles)
 
@@ -179,7 +216,8 @@ def choropleth_map(
     gdf_reset = gdf.reset_index()
     index_col = 'index' if 'index' in gdf_reset.columns else gdf_reset.columns[0]
 
-    # Convert to GeoJSON
+    # Convert to GeoJSON once; both layers share the dict (folium uses a
+    # dict as-is, where a GeoDataFrame would be re-serialized per layer)
     geo_json = gdf_reset.__geo_interface__
 
     # Create choropleth
@@ -205,7 +243,7 @@ def choropleth_map(
         )
 
         folium.GeoJson(
-            gdf_reset.__geo_interface__,
+            geo_json,
             style_function=style_function,
             highlight_function=highlight_function,
             tooltip=tooltip,
@@ -231,6 +269,8 @@ def heatmap(
     zoom: int = 6,
     tiles: str = 'CartoDB dark_matter',
     save_path: Optional[Path] = None,
+    max_points: Optional[int] = 20000,
+    bounds: Optional[list[list[float]]] = None,
 ) -> folium.Map:
     """
     Create a heatmap visualization.
@@ -247,25 +287,29 @@ def heatmap(
         zoom: Initial zoom
         tiles: Base map tiles
         save_path: Path to save HTML
+        max_points: Subsample to this many points; None to keep every point
+        bounds: Only plot points inside [[south, west], [north, east]]
 
     Returns:
         Folium Map object
     """
     valid_df = df.dropna(subset=[lat_col, lon_col])
+    if bounds is not None:
+        valid_df = _within_bounds(valid_df, lat_col, lon_col, bounds)
 
     if center is None:
         center = [valid_df[lat_col].mean(), valid_df[lon_col].mean()]
 
     m = folium.Map(location=center, zoom_start=zoom, tiles=tiles)
 
-    # Prepare heatmap data
+    valid_df = _sample_points(m, valid_df, max_points)
+
+    # Prepare heatmap data: [lat, lon(, weight)] rows straight from the
+    # underlying array, skipping points without a weight
     if value_col:
-        heat_data = [[row[lat_col], row[lon_col], row[value_col]]
-                    for _, row in valid_df.iterrows()
-                    if pd.notna(row.get(value_col))]
+        heat_data = valid_df[[lat_col, lon_col, value_col]].dropna().to_numpy().tolist()
     else:
-        heat_data = [[row[lat_col], row[lon_col]]
-                    for _, row in valid_df.iterrows()]
+        heat_data = valid_df[[lat_col, lon_col]].to_numpy().tolist()
 
     plugins.HeatMap(
         heat_data,
@@ -291,6 +335,8 @@ def cluster_map(
     zoom: int = 6,
     tiles: str = 'OpenStreetMap',
     save_path: Optional[Path] = None,
+    max_points: Optional[int] = 20000,
+    bounds: Optional[list[list[float]]] = None,
 ) -> folium.Map:
     """
     Create a map with marker clustering.
@@ -307,6 +353,8 @@ def cluster_map(
         tiles=tiles,
         cluster=True,
         save_path=save_path,
+        max_points=max_points,
+        bounds=bounds,
     )
 
 
@@ -380,6 +428,55 @@ def static_map(
     return fig
 
 
+def _within_bounds(
+    df: pd.DataFrame,
+    lat_col: str,
+    lon_col: str,
+    bounds: list[list[float]],
+) -> pd.DataFrame:
+    """Keep rows whose coordinates fall inside [[south, west], [north, east]]."""
+    (south, west), (north, east) = bounds
+    lats = df[lat_col].to_numpy()
+    lons = df[lon_col].to_numpy()
+    mask = (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+    return df[mask]
+
+
+def _sample_points(
+    m: folium.Map,
+    df: pd.DataFrame,
+    max_points: Optional[int],
+    strata_col: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Deterministically subsample points for a Folium map.
+
+    Rows are drawn with a fixed seed and kept in their original order. With
+    strata_col, each group keeps its share of max_points (at least one row),
+    so the total can exceed max_points by up to the number of groups. The
+    kept/total counts are recorded on the map as ``m._sampled`` and, when
+    sampling happened, as an HTML comment in the page.
+    """
+    total = len(df)
+    if max_points is None or total <= max_points:
+        m._sampled = (total, total)
+        return df
+
+    order = np.random.default_rng(0).permutation(total)
+    if strata_col:
+        codes = pd.factorize(df[strata_col], use_na_sentinel=False)[0][order]
+        quota = np.maximum(np.bincount(codes) * max_points // total, 1)
+        rank = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+        order = order[rank < quota[codes]]
+    else:
+        order = order[:max_points]
+
+    sampled = df.iloc[np.sort(order)]
+    m._sampled = (len(sampled), total)
+    m.get_root().html.add_child(folium.Element(f"<!-- sampled {len(sampled)}/{total} -->"))
+    return sampled
+
+
 def _create_legend(title: str, color_map: dict) -> str:
     """Create HTML legend for Folium map."""
     items = "".join([
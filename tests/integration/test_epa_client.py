@@ -143,8 +143,8 @@ EPA-CO,CO-001,2024-01-15,pH,7.2"""
 
         # Verify date parameters were passed
         params = responses.calls[0].request.params
-        assert 'startDateLo' in params
-        assert 'startDateHi' in params
+        assert params['startDateLo'] == '01-01-2024'
+        assert params['startDateHi'] == '01-31-2024'
 
     @pytest.mark.integration
     @responses.activate
@@ -165,6 +165,99 @@ EPA-CO,CO-001,2024-01-15,7.2"""
 
         assert pd.api.types.is_datetime64_any_dtype(result['ActivityStartDate'])
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_repeated_columns_are_categorical(self):
+        """Stores low-cardinality result columns as categoricals."""
+        csv_response = """OrganizationIdentifier,CharacteristicName,ResultMeasureValue
+EPA-CO,pH,7.2
+EPA-CO,pH,7.3"""
+
+        responses.add(
+            responses.GET,
+            "https://www.waterqualitydata.us/data/Result/search",
+            body=csv_response,
+            status=200,
+        )
+
+        client = EPAWaterQuality()
+        result = client.get_results(state_code="CO")
+
+        assert isinstance(result['CharacteristicName'].dtype, pd.CategoricalDtype)
+        assert isinstance(result['OrganizationIdentifier'].dtype, pd.CategoricalDtype)
+        assert pd.api.types.is_float_dtype(result['ResultMeasureValue'])
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_results_chunked(self):
+        """Yields results in bounded chunks when chunksize is given."""
+        rows = "\n".join(f"CO-{i:03d},2024-01-{i + 1:02d},7.{i}" for i in range(5))
+        csv_response = "MonitoringLocationIdentifier,ActivityStartDate,ResultMeasureValue\n" + rows
+
+        responses.add(
+            responses.GET,
+            "https://www.waterqualitydata.us/data/Result/search",
+            body=csv_response,
+            status=200,
+        )
+
+        client = EPAWaterQuality()
+        chunks = list(client.get_results(state_code="CO", chunksize=2))
+
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        assert all(pd.api.types.is_datetime64_any_dtype(c['ActivityStartDate']) for c in chunks)
+        assert len(responses.calls) == 1
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_results_tsv(self):
+        """Requests and parses tab-separated results."""
+        tsv_response = "MonitoringLocationIdentifier\tCharacteristicName\tResultMeasureValue\nCO-001\tTemperature, water\t12.5"
+
+        responses.add(
+            responses.GET,
+            "https://www.waterqualitydata.us/data/Result/search",
+            body=tsv_response,
+            status=200,
+        )
+
+        client = EPAWaterQuality()
+        result = client.get_results(state_code="CO", response_format="tsv")
+
+        assert responses.calls[0].request.params['mimeType'] == 'tsv'
+        assert result.loc[0, 'CharacteristicName'] == 'Temperature, water'
+        assert result.loc[0, 'ResultMeasureValue'] == 12.5
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_results_as_arrow(self):
+        """Returns a pyarrow Table with dictionary-encoded code columns."""
+        pa = pytest.importorskip("pyarrow")
+        csv_response = """CharacteristicName,ActivityStartDate,ResultMeasureValue
+pH,2024-01-01,7.2
+pH,2024-01-02,7.3"""
+
+        responses.add(
+            responses.GET,
+            "https://www.waterqualitydata.us/data/Result/search",
+            body=csv_response,
+            status=200,
+        )
+
+        client = EPAWaterQuality()
+        table = client.get_results(state_code="CO", return_type="arrow")
+
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 2
+        assert pa.types.is_dictionary(table.schema.field('CharacteristicName').type)
+
+    @pytest.mark.integration
+    def test_rejects_unknown_format(self):
+        """Raises ValueError for unsupported response formats."""
+        client = EPAWaterQuality()
+        with pytest.raises(ValueError):
+            client.get_results(state_code="CO", response_format="xml")
+
 
 class TestEPAWaterQualityColoradoBasin:
     """Tests for Colorado River Basin convenience method."""
@@ -198,6 +291,31 @@ SITE-001,2024-01-01,7.2"""
         # Result should include basin column
         assert 'basin' in result.columns
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_basin_labels_match_huc(self):
+        """Labels each row with the basin of the HUC it was fetched for."""
+        responses.add(
+            responses.GET,
+            "https://www.waterqualitydata.us/data/Result/search",
+            body="MonitoringLocationIdentifier,ResultMeasureValue\nUPPER-001,7.2",
+            status=200,
+            match=[responses.matchers.query_param_matcher({"huc": "14"}, strict_match=False)],
+        )
+        responses.add(
+            responses.GET,
+            "https://www.waterqualitydata.us/data/Result/search",
+            body="MonitoringLocationIdentifier,ResultMeasureValue\nLOWER-001,7.5",
+            status=200,
+            match=[responses.matchers.query_param_matcher({"huc": "15"}, strict_match=False)],
+        )
+
+        client = EPAWaterQuality()
+        result = client.get_colorado_basin_results(characteristic="ph")
+
+        labels = dict(zip(result['MonitoringLocationIdentifier'], result['basin']))
+        assert labels == {'UPPER-001': 'upper_colorado', 'LOWER-001': 'lower_colorado'}
+
     @pytest.mark.integration
     @responses.activate
     def test_characteristic_name_lookup(self):
@@ -225,6 +343,108 @@ SITE-001,7.2"""
         params = responses.calls[0].request.params
         assert params['characteristicName'] == 'Temperature, water'
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_basin_results_as_arrow(self):
+        """Combines basin tables into one Arrow table with a basin column."""
+        pa = pytest.importorskip("pyarrow")
+        for _ in range(2):
+            responses.add(
+                responses.GET,
+                "https://www.waterqualitydata.us/data/Result/search",
+                body="MonitoringLocationIdentifier,ResultMeasureValue\nSITE-001,7.2\nSITE-002,7.4",
+                status=200,
+            )
+
+        client = EPAWaterQuality()
+        table = client.get_colorado_basin_results(characteristic="ph", return_type="arrow")
+
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 4
+        assert pa.types.is_dictionary(table.schema.field('basin').type)
+        assert sorted(set(table.column('basin').to_pylist())) == ['lower_colorado', 'upper_colorado']
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_characteristic_lookup_ignores_case(self):
+        """Resolves shorthand characteristic keys regardless of case."""
+        for _ in range(2):
+            responses.add(
+                responses.GET,
+                "https://www.waterqualitydata.us/data/Result/search",
+                body="MonitoringLocationIdentifier,ResultMeasureValue\nSITE-001,7.2",
+                status=200,
+            )
+
+        client = EPAWaterQuality()
+        client.get_colorado_basin_results(characteristic="PH")
+
+        assert responses.calls[0].request.params['characteristicName'] == 'pH'
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_basin_results_to_parquet(self, temp_data_dir):
+        """Writes one Parquet file per basin and returns a lazy dataset."""
+        csv_response = """MonitoringLocationIdentifier,CharacteristicName,ResultMeasureValue
+SITE-001,pH,7.2
+SITE-002,pH,7.4
+SITE-003,pH,7.1"""
+
+        for _ in range(2):
+            responses.add(
+                responses.GET,
+                "https://www.waterqualitydata.us/data/Result/search",
+                body=csv_response,
+                status=200,
+            )
+
+        client = EPAWaterQuality()
+        dataset = client.get_colorado_basin_results(
+            characteristic="ph",
+            output_dir=temp_data_dir,
+            chunksize=2,
+        )
+
+        assert (temp_data_dir / "upper_colorado.parquet").exists()
+        assert (temp_data_dir / "lower_colorado.parquet").exists()
+        result = dataset.to_table().to_pandas()
+        assert len(result) == 6
+        assert set(result['basin']) == {'upper_colorado', 'lower_colorado'}
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_basin_results_to_parquet_sparse_text_column(self, temp_data_dir):
+        """Keeps one schema when a column is empty in early chunks and text later."""
+        csv_response = """OrganizationIdentifier,MonitoringLocationIdentifier,ResultMeasureValue,Comment
+,SITE-001,7.2,
+,SITE-002,7.4,
+,SITE-003,7.1,
+EPA-CO,SITE-004,ND,note
+EPA-CO,SITE-005,7.3,
+EPA-CO,SITE-006,7.0,second note
+EPA-CO,SITE-007,6.9,"""
+
+        for _ in range(2):
+            responses.add(
+                responses.GET,
+                "https://www.waterqualitydata.us/data/Result/search",
+                body=csv_response,
+                status=200,
+            )
+
+        client = EPAWaterQuality()
+        dataset = client.get_colorado_basin_results(
+            characteristic="ph",
+            output_dir=temp_data_dir,
+            chunksize=3,
+        )
+
+        result = dataset.to_table().to_pandas()
+        assert len(result) == 14
+        assert result['Comment'].dropna().tolist() == ['note', 'second note'] * 2
+        assert result['ResultMeasureValue'].tolist()[:4] == ['7.2', '7.4', '7.1', 'ND']
+        assert set(result['OrganizationIdentifier'].dropna()) == {'EPA-CO'}
+
 
 class TestEPAWaterQualitySearchCharacteristics:
     """Tests for characteristic search method."""
@@ -255,6 +475,42 @@ class TestEPAWaterQualitySearchCharacteristics:
         assert len(result) == 3  # Should find 3 arsenic-related
         assert all("arsenic" in c.lower() for c in result)
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_code_list_fetched_once(self):
+        """Reuses the downloaded code list across searches."""
+        responses.add(
+            responses.GET,
+            "https://www.waterqualitydata.us/Codes/characteristicname",
+            json={"codes": [{"value": "Arsenic"}, {"value": "Iron"}, {"value": "Iron, dissolved"}]},
+            status=200,
+        )
+
+        client = EPAWaterQuality()
+
+        assert client.search_characteristics("ARSENIC") == ["Arsenic"]
+        assert client.search_characteristics("iron") == ["Iron", "Iron, dissolved"]
+        assert len(responses.calls) == 1
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_search_characteristics_cached(self, temp_data_dir):
+        """Serves repeat code list requests from the HTTP cache."""
+        pytest.importorskip("requests_cache")
+        responses.add(
+            responses.GET,
+            "https://www.waterqualitydata.us/Codes/characteristicname",
+            json={"codes": [{"value": "Arsenic"}, {"value": "Iron"}]},
+            status=200,
+        )
+
+        cache_name = str(temp_data_dir / "http_cache")
+        first = EPAWaterQuality(cache_name=cache_name).search_characteristics("arsenic")
+        second = EPAWaterQuality(cache_name=cache_name).search_characteristics("arsenic")
+
+        assert first == second == ["Arsenic"]
+        assert len(responses.calls) == 1
+
 
 class TestEPAWaterQualityErrorHandling:
     """Tests for error handling."""
@@ -273,6 +529,20 @@ class TestEPAWaterQualityErrorHandling:
         with pytest.raises(Exception):
             client.get_stations(state_code="CO")
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_retries_transient_gateway_error(self, mock_epa_csv_response):
+        """Retries a 503 and returns the data from the next attempt."""
+        url = "https://www.waterqualitydata.us/data/Station/search"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, body=mock_epa_csv_response, status=200)
+
+        client = EPAWaterQuality()
+        result = client.get_stations(state_code="CO")
+
+        assert len(responses.calls) == 2
+        assert len(result) == 3
+
     @pytest.mark.integration
     @responses.activate
     def test_handles_empty_response(self):
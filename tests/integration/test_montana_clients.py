@@ -4,16 +4,18 @@ Integration tests for Montana data clients.
 Uses HTTP response mocking to test API client behavior.
 """
 
+import json
 import pytest
 import responses
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from scripts.data_retrieval.montana import (
     MontanaMesonet,
     MontanaGWIC,
     MontanaDNRC,
     MontanaStateLibrary,
+    MontanaWarehouse,
     get_montana_clients,
 )
 
@@ -41,6 +43,25 @@ class TestMontanaMesonetGetStations:
         assert 'longitude' in result.columns
         assert len(result) == 2
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_stations_compact_dtypes(self, mock_mesonet_stations_response):
+        """Downcasts numbers and stores county/network as categories."""
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            json=mock_mesonet_stations_response,
+            status=200,
+        )
+
+        client = MontanaMesonet()
+        result = client.get_stations()
+
+        assert isinstance(result['county'].dtype, pd.CategoricalDtype)
+        assert isinstance(result['network'].dtype, pd.CategoricalDtype)
+        assert result['elevation'].dtype.itemsize < 8
+        assert result['latitude'].dtype == 'float64'
+
     @pytest.mark.integration
     @responses.activate
     def test_get_active_stations_only(self, mock_mesonet_stations_response):
@@ -76,6 +97,106 @@ class TestMontanaMesonetGetStations:
         assert isinstance(result, gpd.GeoDataFrame)
         assert result.crs.to_epsg() == 4326
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_geodataframe_station_without_coordinates(self, mock_mesonet_stations_response):
+        """Stations missing coordinates get a missing geometry."""
+        mock_mesonet_stations_response[1]["latitude"] = None
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            json=mock_mesonet_stations_response,
+            status=200,
+        )
+
+        client = MontanaMesonet()
+        result = client.get_stations(as_geodataframe=True)
+
+        assert result.geometry.iloc[0].x == pytest.approx(-109.4128)
+        assert result.geometry.iloc[0].y == pytest.approx(45.5428)
+        assert result.geometry.isna().tolist() == [False, True]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_stations_cached(self, mock_mesonet_stations_response, temp_data_dir):
+        """Serves repeat station requests from the HTTP cache until cleared."""
+        pytest.importorskip("requests_cache")
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            json=mock_mesonet_stations_response,
+            status=200,
+        )
+
+        client = MontanaMesonet(cache_name=str(temp_data_dir / "http_cache"))
+        client.get_stations()
+        client.get_stations()
+
+        assert len(responses.calls) == 1
+        assert client.cache_info()["responses"] == 1
+
+        client.clear_cache()
+        client.get_stations()
+
+        assert len(responses.calls) == 2
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_stations_parquet_cache(self, mock_mesonet_stations_response, temp_data_dir):
+        """Reloads repeat results from Parquet files in cache_dir."""
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            json=mock_mesonet_stations_response,
+            status=200,
+        )
+
+        client = MontanaMesonet(cache_dir=temp_data_dir)
+        first = client.get_stations()
+        geo = client.get_stations(as_geodataframe=True)
+
+        # A new client reads the results back from disk
+        second = MontanaMesonet(cache_dir=temp_data_dir).get_stations()
+        geo_cached = MontanaMesonet(cache_dir=temp_data_dir).get_stations(as_geodataframe=True)
+
+        import geopandas as gpd
+        assert len(responses.calls) == 1
+        assert len(list(temp_data_dir.glob("get_stations_*.parquet"))) == 2
+        pd.testing.assert_frame_equal(first, second)
+        assert isinstance(geo_cached, gpd.GeoDataFrame)
+        assert geo_cached.geometry.equals(geo.geometry)
+
+        client.clear_cache()
+        assert not list(temp_data_dir.glob("*.parquet"))
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_station_list_reused(self, mock_mesonet_stations_response):
+        """Reuses the fetched station list for county searches."""
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            json=mock_mesonet_stations_response,
+            status=200,
+        )
+
+        client = MontanaMesonet()
+        stations = client.get_stations()
+        stations['county'] = 'changed'
+        gallatin = client.search_stations_by_county("Gallatin")
+        stillwater = client.search_stations_by_county("Stillwater")
+
+        assert len(responses.calls) == 1
+        assert len(gallatin) == len(stillwater) == 1
+
+    @pytest.mark.integration
+    def test_cache_info_without_cache(self):
+        """Reports caching as disabled by default."""
+        client = MontanaMesonet()
+
+        assert client.cache_info() == {"enabled": False}
+        client.clear_cache()
+
 
 class TestMontanaMesonetObservations:
     """Tests for observation retrieval methods."""
@@ -84,15 +205,14 @@ class TestMontanaMesonetObservations:
     @responses.activate
     def test_get_latest(self):
         """Retrieves latest observations."""
-        latest_response = [
-            {"station": "aceabsar", "air_temp": 5.2, "datetime": "2024-01-15T12:00:00Z"},
-            {"station": "aceamste", "air_temp": 3.1, "datetime": "2024-01-15T12:00:00Z"},
-        ]
+        latest_response = """station,air_temp,datetime
+aceabsar,5.2,2024-01-15T12:00:00Z
+aceamste,3.1,2024-01-15T12:00:00Z"""
 
         responses.add(
             responses.GET,
             "https://mesonet.climate.umt.edu/api/v2/latest/",
-            json=latest_response,
+            body=latest_response,
             status=200,
         )
 
@@ -109,7 +229,7 @@ class TestMontanaMesonetObservations:
         responses.add(
             responses.GET,
             "https://mesonet.climate.umt.edu/api/v2/observations/hourly/",
-            json=mock_mesonet_observations_response,
+            body=pd.DataFrame(mock_mesonet_observations_response).to_csv(index=False),
             status=200,
         )
 
@@ -127,15 +247,14 @@ class TestMontanaMesonetObservations:
     @responses.activate
     def test_get_daily_observations(self):
         """Retrieves daily observations."""
-        daily_response = [
-            {"station": "aceabsar", "date": "2024-01-01", "air_temp_max": 10.0, "air_temp_min": -5.0},
-            {"station": "aceabsar", "date": "2024-01-02", "air_temp_max": 12.0, "air_temp_min": -3.0},
-        ]
+        daily_response = """station,date,air_temp_max,air_temp_min
+aceabsar,2024-01-01,10.0,-5.0
+aceabsar,2024-01-02,12.0,-3.0"""
 
         responses.add(
             responses.GET,
             "https://mesonet.climate.umt.edu/api/v2/observations/daily/",
-            json=daily_response,
+            body=daily_response,
             status=200,
         )
 
@@ -143,11 +262,71 @@ class TestMontanaMesonetObservations:
         result = client.get_daily_observations(
             stations=["aceabsar"],
             start_date=datetime(2024, 1, 1),
+            end_date=date(2024, 1, 2),
         )
 
+        assert responses.calls[0].request.params['end_time'] == '2024-01-02'
+
         assert not result.empty
         assert pd.api.types.is_datetime64_any_dtype(result['date'])
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_observations_as_json(self, mock_mesonet_observations_response):
+        """Requests and parses JSON when asked to."""
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/observations/hourly/",
+            json=mock_mesonet_observations_response,
+            status=200,
+        )
+
+        client = MontanaMesonet()
+        result = client.get_hourly_observations(
+            stations=["aceabsar"],
+            start_date=datetime(2024, 1, 1),
+            response_format="json",
+        )
+
+        assert responses.calls[0].request.params['type'] == 'json'
+        assert responses.calls[0].request.params['start_time'] == '2024-01-01'
+        assert len(result) == 2
+        assert pd.api.types.is_datetime64_any_dtype(result['datetime'])
+
+    @pytest.mark.integration
+    def test_rejects_unknown_format(self):
+        """Raises ValueError for unsupported response formats."""
+        client = MontanaMesonet()
+        with pytest.raises(ValueError):
+            client.get_latest(response_format="xml")
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_many_stations_fetched_in_batches(self, mock_mesonet_observations_response):
+        """Long station lists are split into concurrent batched requests."""
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/observations/hourly/",
+            body=pd.DataFrame(mock_mesonet_observations_response).to_csv(index=False),
+            status=200,
+        )
+
+        client = MontanaMesonet()
+        stations = [f"station{i:02d}" for i in range(30)]
+        result = client.get_hourly_observations(
+            stations=stations,
+            start_date=datetime(2024, 1, 1),
+        )
+
+        assert len(responses.calls) == 2
+        requested = sorted(
+            s
+            for call in responses.calls
+            for s in call.request.params['stations'].split(',')
+        )
+        assert requested == stations
+        assert len(result) == 2 * len(mock_mesonet_observations_response)
+
 
 class TestMontanaMesonetSearchByCounty:
     """Tests for county search method."""
@@ -186,6 +365,23 @@ class TestMontanaMesonetSearchByCounty:
 
         assert len(result) == 1
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_search_by_county_prefix(self, mock_mesonet_stations_response):
+        """Matches whole county names unless a prefix search is requested."""
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            json=mock_mesonet_stations_response,
+            status=200,
+        )
+
+        client = MontanaMesonet()
+
+        assert client.search_stations_by_county("Gall").empty
+        result = client.search_stations_by_county("gall", prefix=True)
+        assert result['station'].tolist() == ['aceamste']
+
 
 class TestMontanaGWIC:
     """Tests for Montana GWIC client."""
@@ -221,6 +417,8 @@ class TestMontanaGWIC:
         assert 'GWICID' in result.columns
         assert 'latitude' in result.columns
         assert 'longitude' in result.columns
+        assert result['longitude'].tolist() == [-111.0, -111.1]
+        assert result['latitude'].tolist() == [45.5, 45.6]
 
     @pytest.mark.integration
     @responses.activate
@@ -238,6 +436,224 @@ class TestMontanaGWIC:
         # Should return empty DataFrame, not raise
         assert result.empty
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_wells_pages_through_results(self):
+        """Fetches every page when results exceed the layer's maxRecordCount."""
+        layer_url = "https://services1.arcgis.com/KyHQVZVT08EIH1v8/arcgis/rest/services/GWIC_Wells/FeatureServer/0"
+        query_url = f"{layer_url}/query"
+
+        def page(start, stop):
+            return {
+                "features": [
+                    {"attributes": {"GWICID": str(i)}, "geometry": {"x": -111.0, "y": 45.0}}
+                    for i in range(start, stop)
+                ]
+            }
+
+        responses.add(
+            responses.GET,
+            query_url,
+            json={"count": 5},
+            match=[responses.matchers.query_param_matcher({"returnCountOnly": "true"}, strict_match=False)],
+        )
+        responses.add(responses.GET, layer_url, json={"maxRecordCount": 2})
+        for offset in (0, 2, 4):
+            responses.add(
+                responses.GET,
+                query_url,
+                json=page(offset, min(offset + 2, 5)),
+                match=[responses.matchers.query_param_matcher({"resultOffset": str(offset)}, strict_match=False)],
+            )
+
+        client = MontanaGWIC()
+        result = client.get_wells_from_arcgis()
+
+        assert result['GWICID'].tolist() == ['0', '1', '2', '3', '4']
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_wells_respects_max_records(self):
+        """Caps the number of features requested at max_records."""
+        query_url = "https://services1.arcgis.com/KyHQVZVT08EIH1v8/arcgis/rest/services/GWIC_Wells/FeatureServer/0/query"
+        responses.add(
+            responses.GET,
+            query_url,
+            json={"count": 5000},
+            match=[responses.matchers.query_param_matcher({"returnCountOnly": "true"}, strict_match=False)],
+        )
+        responses.add(
+            responses.GET,
+            query_url.rsplit("/query", 1)[0],
+            json={"maxRecordCount": 2000},
+        )
+        responses.add(
+            responses.GET,
+            query_url,
+            json={"features": [{"attributes": {"GWICID": "1"}}]},
+        )
+
+        client = MontanaGWIC()
+        client.get_wells_from_arcgis(max_records=10)
+
+        assert responses.calls[-1].request.params['resultRecordCount'] == '10'
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_wells_streams_large_results(self):
+        """Parses large single-query results incrementally."""
+        layer_url = "https://services1.arcgis.com/KyHQVZVT08EIH1v8/arcgis/rest/services/GWIC_Wells/FeatureServer/0"
+        n = 6000
+        responses.add(
+            responses.GET,
+            f"{layer_url}/query",
+            json={"count": n},
+            match=[responses.matchers.query_param_matcher({"returnCountOnly": "true"}, strict_match=False)],
+        )
+        responses.add(
+            responses.GET,
+            layer_url,
+            json={"maxRecordCount": 10000, "advancedQueryCapabilities": {"supportsPagination": False}},
+        )
+        responses.add(
+            responses.GET,
+            f"{layer_url}/query",
+            json={
+                "features": [
+                    {"attributes": {"GWICID": str(i)}, "geometry": {"x": -111.5, "y": 45.25}}
+                    for i in range(n)
+                ]
+            },
+        )
+
+        client = MontanaGWIC()
+        result = client.get_wells_from_arcgis()
+
+        assert len(result) == n
+        assert result['longitude'].dtype == float
+        assert result.loc[0, 'latitude'] == 45.25
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_monitoring_wells_use_layer_field_types(self):
+        """Builds columns using the field types from the layer metadata."""
+        layer_url = "https://services1.arcgis.com/KyHQVZVT08EIH1v8/arcgis/rest/services/Statewide_Monitoring_Network/FeatureServer/0"
+        responses.add(
+            responses.GET,
+            f"{layer_url}/query",
+            json={"count": 2},
+            match=[responses.matchers.query_param_matcher({"returnCountOnly": "true"}, strict_match=False)],
+        )
+        responses.add(
+            responses.GET,
+            layer_url,
+            json={
+                "maxRecordCount": 1000,
+                "fields": [
+                    {"name": "GWICID", "type": "esriFieldTypeString"},
+                    {"name": "TOTAL_DEPTH", "type": "esriFieldTypeDouble"},
+                ],
+            },
+        )
+        responses.add(
+            responses.GET,
+            f"{layer_url}/query",
+            json={
+                "features": [
+                    {"attributes": {"GWICID": "1", "TOTAL_DEPTH": 120}, "geometry": {"x": -111.0, "y": 45.0}},
+                    {"attributes": {"GWICID": "2", "TOTAL_DEPTH": None}, "geometry": {"x": -111.2, "y": 45.2}},
+                ]
+            },
+        )
+
+        client = MontanaGWIC()
+        result = client.get_monitoring_network_wells()
+
+        assert list(result.columns) == ['GWICID', 'TOTAL_DEPTH', 'longitude', 'latitude']
+        assert pd.api.types.is_float_dtype(result['TOTAL_DEPTH'])
+        assert result['TOTAL_DEPTH'].isna().tolist() == [False, True]
+        assert result['latitude'].tolist() == [45.0, 45.2]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_wells_by_county_joins_locally(self, temp_data_dir):
+        """Queries wells by county bounds and assigns counties with a spatial join."""
+        import io
+        import zipfile
+        import geopandas as gpd
+        from shapely.geometry import box
+
+        counties = gpd.GeoDataFrame(
+            {"NAME": ["GALLATIN", "PARK"]},
+            geometry=[box(-112.0, 45.0, -111.0, 46.0), box(-111.0, 45.0, -110.0, 46.0)],
+            crs="EPSG:4326",
+        )
+        shp_dir = temp_data_dir / "shp"
+        shp_dir.mkdir()
+        counties.to_file(shp_dir / "MontanaCounties.shp")
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            for path in shp_dir.iterdir():
+                zf.write(path, path.name)
+
+        responses.add(
+            responses.GET,
+            "https://ftpgeoinfo.msl.mt.gov/Data/Spatial/MSDI/AdministrativeBoundaries/MontanaCounties.zip",
+            body=archive.getvalue(),
+        )
+        responses.add(
+            responses.GET,
+            "https://services1.arcgis.com/KyHQVZVT08EIH1v8/arcgis/rest/services/GWIC_Wells/FeatureServer/0/query",
+            json={
+                "features": [
+                    {"attributes": {"GWICID": "1"}, "geometry": {"x": -111.5, "y": 45.5}},
+                    {"attributes": {"GWICID": "2"}, "geometry": {"x": -110.5, "y": 45.5}},
+                    {"attributes": {"GWICID": "3"}, "geometry": {"x": -113.0, "y": 45.5}},
+                ]
+            },
+        )
+
+        client = MontanaGWIC(cache_dir=temp_data_dir / "cache")
+        gallatin = client.get_wells_from_arcgis(county="Gallatin", local_county_filter=True)
+        both = client.get_wells_by_county(["gallatin", "park"])
+
+        assert gallatin['GWICID'].tolist() == ['1']
+        assert sorted(zip(both['GWICID'], both['county_name'])) == [('1', 'GALLATIN'), ('2', 'PARK')]
+        # max_records caps the wells inside the counties, not the bounding-box query
+        assert client.get_wells_by_county(["park"], max_records=1)['GWICID'].tolist() == ['2']
+        query = [c for c in responses.calls if "/query" in c.request.url][-1].request.params
+        assert 'resultRecordCount' not in query
+        query = [c for c in responses.calls if "/query" in c.request.url][-1].request.params
+        assert 'geometry' in query and query['where'] == '1=1'
+        assert list((temp_data_dir / "cache").glob("get_counties_*.parquet"))
+
+        # Boundaries are downloaded once
+        downloads = [c for c in responses.calls if c.request.url.endswith(".zip")]
+        assert len(downloads) == 1
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_unreadable_county_boundaries_fall_back_to_server_filter(self):
+        """A county file that cannot be read falls back to the server-side county filter."""
+        responses.add(
+            responses.GET,
+            "https://ftpgeoinfo.msl.mt.gov/Data/Spatial/MSDI/AdministrativeBoundaries/MontanaCounties.zip",
+            body=b"not a shapefile archive",
+        )
+        responses.add(
+            responses.GET,
+            "https://services1.arcgis.com/KyHQVZVT08EIH1v8/arcgis/rest/services/GWIC_Wells/FeatureServer/0/query",
+            json={"features": [{"attributes": {"GWICID": "1"}, "geometry": {"x": -111.5, "y": 45.5}}]},
+        )
+
+        client = MontanaGWIC()
+        with pytest.warns(UserWarning, match="Could not load Montana county boundaries"):
+            result = client.get_wells_from_arcgis(county="Gallatin", local_county_filter=True)
+
+        assert result['GWICID'].tolist() == ['1']
+        query = [c for c in responses.calls if "/query" in c.request.url][-1].request.params
+        assert query['where'] == "COUNTY = 'GALLATIN'"
+
     @pytest.mark.integration
     def test_get_gwic_url(self):
         """Generates correct GWIC website URL."""
@@ -275,6 +691,32 @@ class TestMontanaDNRC:
         assert not result.empty
         assert 'SITE_ID' in result.columns
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_stream_gages_active_flag(self):
+        """Flags active gages and filters on the flag."""
+        arcgis_response = {
+            "features": [
+                {"attributes": {"SITE_ID": "DNRC001", "STATUS": "Active"}, "geometry": {"x": -110.5, "y": 46.0}},
+                {"attributes": {"SITE_ID": "DNRC002", "STATUS": "Discontinued"}, "geometry": {"x": -110.6, "y": 46.1}},
+                {"attributes": {"SITE_ID": "DNRC003", "STATUS": "A"}, "geometry": {"x": -110.7, "y": 46.2}},
+            ]
+        }
+
+        responses.add(
+            responses.GET,
+            "https://gis.dnrc.mt.gov/arcgis/rest/services/WRD/DNRC_Stream_Gages/MapServer/0/query",
+            json=arcgis_response,
+            status=200,
+        )
+
+        client = MontanaDNRC()
+        all_gages = client.get_stream_gages(active_only=False)
+        active = client.get_stream_gages()
+
+        assert all_gages['is_active'].tolist() == [True, False, True]
+        assert active['SITE_ID'].tolist() == ['DNRC001', 'DNRC003']
+
     @pytest.mark.integration
     @responses.activate
     def test_get_stream_gages_with_bbox(self):
@@ -296,6 +738,32 @@ class TestMontanaDNRC:
         params = responses.calls[0].request.params
         assert 'geometry' in params
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_water_rights_pou_drops_polygon_geometry(self):
+        """Returns POU attributes without polygon rings."""
+        arcgis_response = {
+            "features": [
+                {
+                    "attributes": {"WRNUMBER": "41H 12345 00", "COUNTY": "GALLATIN"},
+                    "geometry": {"rings": [[[-111.0, 45.0], [-111.0, 45.1], [-110.9, 45.0]]]},
+                },
+            ]
+        }
+
+        responses.add(
+            responses.GET,
+            "https://gis.dnrc.mt.gov/arcgis/rest/services/WRD/WaterRights/MapServer/1/query",
+            json=arcgis_response,
+            status=200,
+        )
+
+        client = MontanaDNRC()
+        result = client.get_water_rights_pou(county="Gallatin")
+
+        assert list(result.columns) == ['WRNUMBER', 'COUNTY']
+        assert result.loc[0, 'WRNUMBER'] == '41H 12345 00'
+
     @pytest.mark.integration
     def test_get_stage_url(self):
         """Generates correct StAGE URL."""
@@ -339,3 +807,103 @@ class TestGetMontanaClients:
         assert isinstance(clients['gwic'], MontanaGWIC)
         assert isinstance(clients['dnrc'], MontanaDNRC)
         assert isinstance(clients['state_library'], MontanaStateLibrary)
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_prewarm_fetches_catalogs(self, mock_mesonet_stations_response, temp_data_dir):
+        """Prewarming fetches the catalogs into the shared caches."""
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            json=mock_mesonet_stations_response,
+        )
+        responses.add(
+            responses.GET,
+            "https://gis.dnrc.mt.gov/arcgis/rest/services/WRD/DNRC_Stream_Gages/MapServer/0/query",
+            json={"features": [{"attributes": {"SITE_ID": "DNRC001"}}]},
+        )
+        responses.add(
+            responses.GET,
+            "https://services1.arcgis.com/KyHQVZVT08EIH1v8/arcgis/rest/services/Statewide_Monitoring_Network/FeatureServer/0/query",
+            status=500,
+        )
+
+        with pytest.warns(UserWarning, match="monitoring network"):
+            clients = get_montana_clients(cache_dir=temp_data_dir, prewarm=True)
+
+        cached = sorted(path.name.split("_")[1] for path in temp_data_dir.glob("*.parquet"))
+        assert cached == ["stations", "stream"]
+        assert not clients['mesonet'].get_stations().empty
+        assert len([c for c in responses.calls if "/stations/" in c.request.url]) == 1
+
+
+class TestMontanaClientSessions:
+    """Tests for session setup shared by the clients."""
+
+    @pytest.mark.integration
+    def test_clients_close_as_context_managers(self, mocker):
+        """Closes the session when used as a context manager."""
+        with MontanaDNRC() as client:
+            close = mocker.spy(client.session, "close")
+
+        close.assert_called_once()
+
+    @pytest.mark.integration
+    def test_sessions_use_pooled_adapter(self):
+        """Sessions mount an adapter sized for concurrent requests."""
+        client = MontanaMesonet()
+        adapter = client.session.get_adapter("https://mesonet.climate.umt.edu")
+
+        assert adapter._pool_maxsize >= client.max_workers
+        assert adapter.max_retries.total > 0
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_accepts_brotli_responses(self, mock_mesonet_stations_response):
+        """Advertises Brotli and decodes Brotli-encoded responses."""
+        brotli = pytest.importorskip("brotli")
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            body=brotli.compress(json.dumps(mock_mesonet_stations_response).encode()),
+            headers={"Content-Encoding": "br"},
+            content_type="application/json",
+        )
+
+        client = MontanaMesonet()
+        result = client.get_stations()
+
+        assert "br" in responses.calls[0].request.headers["Accept-Encoding"]
+        assert len(result) == 2
+
+
+class TestMontanaWarehouse:
+    """Tests for SQL access to cached results."""
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_query_cached_stations(self, mock_mesonet_stations_response, temp_data_dir):
+        """Queries cached station results with SQL."""
+        pytest.importorskip("duckdb")
+        responses.add(
+            responses.GET,
+            "https://mesonet.climate.umt.edu/api/v2/stations/",
+            json=mock_mesonet_stations_response,
+            status=200,
+        )
+        MontanaMesonet(cache_dir=temp_data_dir).get_stations()
+
+        with MontanaWarehouse(temp_data_dir) as warehouse:
+            assert warehouse.views == ["stations"]
+            result = warehouse.query(
+                "SELECT station FROM stations WHERE county = ?", ["Gallatin"]
+            )
+
+        assert result['station'].tolist() == ['aceamste']
+
+    @pytest.mark.integration
+    def test_empty_cache_has_no_views(self, temp_data_dir):
+        """Creates no views when nothing is cached."""
+        pytest.importorskip("duckdb")
+        with MontanaWarehouse(temp_data_dir) as warehouse:
+            assert warehouse.views == []
@@ -0,0 +1,275 @@
+"""
+Integration tests for NOAA Climate Data Online client.
+
+Uses HTTP response mocking to test API client behavior.
+"""
+
+import json
+import threading
+import time
+from datetime import date, datetime, timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+import pytest
+import responses
+
+from scripts.data_retrieval import http_utils
+from scripts.data_retrieval.http_utils import RateLimiter
+from scripts.data_retrieval.noaa import NOAAClimate
+
+
+DATA_URL = f"{NOAAClimate.BASE_URL}/data"
+STATIONS = ("GHCND:USC00050848", "GHCND:USC00051294")
+
+
+@pytest.fixture
+def client():
+    """NOAA client with a dummy token and no request throttling."""
+    client = NOAAClimate(api_token="test-token", max_workers=4)
+    client._rate_limiter = RateLimiter(0)
+    return client
+
+
+def _data_callback(delays=None):
+    """
+    Serve one PRCP record per station per day for the requested date window,
+    paged by limit/offset like the CDO /data endpoint.
+
+    delays maps an offset or a window's startdate to seconds to wait first.
+    """
+    def callback(request):
+        query = {k: v[0] for k, v in parse_qs(urlsplit(request.url).query).items()}
+        start = date.fromisoformat(query["startdate"])
+        end = date.fromisoformat(query["enddate"])
+        offset, limit = int(query["offset"]), int(query["limit"])
+        if delays:
+            time.sleep(delays.get(offset, 0) + delays.get(query["startdate"], 0))
+
+        records = [
+            {
+                "date": f"{start + timedelta(days=day)}T00:00:00",
+                "datatype": "PRCP",
+                "station": station,
+                "attributes": ",,7,",
+                "value": float(day),
+            }
+            for day in range((end - start).days + 1)
+            for station in STATIONS
+        ]
+        body = {
+            "metadata": {"resultset": {"offset": offset + 1, "count": len(records), "limit": limit}},
+            "results": records[offset:offset + limit],
+        }
+        return 200, {}, json.dumps(body)
+
+    return callback
+
+
+def _requested(key):
+    """Values of a query parameter across the mocked requests, in request order."""
+    return [call.request.params[key] for call in responses.calls]
+
+
+class TestNOAAClimateGetData:
+    """Tests for NOAAClimate.get_data and get_data_iter."""
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_fetches_offsets_within_window(self, client):
+        """A window holding several pages is fetched at every offset, in offset order."""
+        responses.add_callback(
+            responses.GET,
+            DATA_URL,
+            # The last page answers before the one ahead of it
+            callback=_data_callback(delays={10: 0.1}),
+        )
+
+        pages = list(client.get_data_iter(
+            data_type_ids=["PRCP"],
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 15),
+            page_size=10,
+        ))
+        result = pd.concat(pages, ignore_index=True)
+
+        assert sorted(int(o) for o in _requested("offset")) == [0, 10, 20]
+        assert [len(page) for page in pages] == [10, 10, 10]
+        assert result["value"].tolist() == [float(day) for day in range(15) for _ in STATIONS]
+        assert result["station"].astype(str).tolist() == list(STATIONS) * 15
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_splits_range_into_date_windows(self, client):
+        """Requests cover the range in consecutive WINDOW_DAYS windows without overlap."""
+        responses.add_callback(responses.GET, DATA_URL, callback=_data_callback())
+
+        client.get_data(
+            data_type_ids=["PRCP"],
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 3, 5),
+        )
+
+        windows = sorted(zip(_requested("startdate"), _requested("enddate")))
+        assert windows == [
+            ("2024-01-01", "2024-01-31"),
+            ("2024-02-01", "2024-03-02"),
+            ("2024-03-03", "2024-03-05"),
+        ]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_single_day_range(self, client):
+        """A range of one day is a single window."""
+        responses.add_callback(responses.GET, DATA_URL, callback=_data_callback())
+
+        result = client.get_data(
+            start_date=datetime(2024, 2, 29),
+            end_date=datetime(2024, 2, 29),
+        )
+
+        assert _requested("startdate") == _requested("enddate") == ["2024-02-29"]
+        assert len(result) == len(STATIONS)
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_rows_in_date_order_across_windows(self, client):
+        """Rows come back in date order even when later windows answer first."""
+        responses.add_callback(
+            responses.GET,
+            DATA_URL,
+            # The first window answers last
+            callback=_data_callback(delays={"2024-01-01": 0.1}),
+        )
+
+        result = client.get_data(
+            data_type_ids=["PRCP"],
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 4, 30),
+        )
+
+        expected_dates = pd.date_range("2024-01-01", "2024-04-30").repeat(len(STATIONS))
+        assert len(result) == len(expected_dates)
+        assert (result["date"].to_numpy() == expected_dates.to_numpy()).all()
+        assert result["station"].dtype == "category"
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_iter_stops_fetching_on_early_exit(self):
+        """Closing the iterator early leaves the rest of the range unfetched."""
+        responses.add_callback(responses.GET, DATA_URL, callback=_data_callback())
+        client = NOAAClimate(api_token="test-token", max_workers=2)
+        client._rate_limiter = RateLimiter(0)
+
+        pages = client.get_data_iter(
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 12, 31),
+        )
+        assert len(responses.calls) == 0
+
+        first = next(pages)
+        pages.close()
+        # Let requests already in flight finish while the mock is active
+        for thread in threading.enumerate():
+            if thread.name.startswith("ThreadPoolExecutor"):
+                thread.join(timeout=5)
+
+        assert first["date"].min() == pd.Timestamp("2024-01-01")
+        # At most the prefetched first pages of the next windows; a full
+        # read needs one request per window
+        assert len(responses.calls) <= 3
+        assert len(client._date_windows(datetime(2024, 1, 1), datetime(2024, 12, 31))) == 12
+
+
+    @pytest.mark.integration
+    def test_rate_limit_stays_under_quota(self, monkeypatch):
+        """No one-second window admits more than REQUESTS_PER_SECOND requests."""
+        clock = {"now": 100.0}
+        monkeypatch.setattr(http_utils.time, "monotonic", lambda: clock["now"])
+        monkeypatch.setattr(http_utils.time, "sleep", lambda s: clock.update(now=clock["now"] + s))
+        client = NOAAClimate(api_token="test-token")
+
+        times = []
+        for _ in range(12):
+            client._rate_limiter.acquire()
+            times.append(clock["now"])
+
+        for start in times:
+            in_window = [t for t in times if start <= t < start + 1.0]
+            assert len(in_window) <= NOAAClimate.REQUESTS_PER_SECOND
+
+class TestNOAAClimateColoradoBasin:
+    """Tests for NOAAClimate.get_colorado_basin_precipitation."""
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_long_range_requires_station_ids(self, client):
+        """Ranges over MAX_UNFILTERED_DAYS need a station list for every state."""
+        station_ids = {
+            state: list(STATIONS)
+            for state in ("Arizona", "California", "Colorado", "Nevada", "New Mexico", "Utah")
+        }
+
+        with pytest.raises(ValueError, match="station_ids for: Wyoming$"):
+            client.get_colorado_basin_precipitation(
+                start_date=datetime(2022, 1, 1),
+                end_date=datetime(2023, 6, 30),
+                station_ids=station_ids,
+            )
+        assert len(responses.calls) == 0
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_one_year_range_without_station_ids(self, client):
+        """Ranges within MAX_UNFILTERED_DAYS are fetched statewide."""
+        responses.add_callback(responses.GET, DATA_URL, callback=_data_callback())
+
+        result = client.get_colorado_basin_precipitation(
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 10),
+        )
+
+        assert len(result) == 7 * 10 * len(STATIONS)
+        assert "stationid" not in responses.calls[0].request.params
+
+
+class TestNOAAClimateMetadata:
+    """Tests for memoized metadata lookups."""
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_stations_fetched_once(self, client):
+        """Repeated identical metadata queries reuse the first response."""
+        responses.add(
+            responses.GET,
+            f"{NOAAClimate.BASE_URL}/stations",
+            json={"results": [{"id": STATIONS[0], "name": "BOULDER"}]},
+            status=200,
+        )
+
+        first = client.get_stations(location_id="FIPS:08")
+        first["name"] = "changed"
+        second = client.get_stations(location_id="FIPS:08")
+
+        assert len(responses.calls) == 1
+        assert second["name"].tolist() == ["BOULDER"]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_distinct_queries_and_clear_cache(self, client):
+        """Different parameters are separate entries; clear_cache forgets them all."""
+        responses.add(
+            responses.GET,
+            f"{NOAAClimate.BASE_URL}/stations",
+            json={"results": [{"id": STATIONS[0]}]},
+            status=200,
+        )
+
+        client.get_stations(location_id="FIPS:08")
+        client.get_stations(location_id="FIPS:49")
+        client.get_stations(location_id="FIPS:08")
+        assert len(responses.calls) == 2
+
+        client.clear_cache()
+        client.get_stations(location_id="FIPS:08")
+        assert len(responses.calls) == 3
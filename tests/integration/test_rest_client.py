@@ -0,0 +1,321 @@
+"""
+Integration tests for the generic REST client.
+
+Uses HTTP response mocking to test pagination behavior.
+"""
+
+import json
+import time
+import warnings
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+import pytest
+import responses
+
+from scripts.data_retrieval.generic_rest import CSVEndpointClient, RESTClient
+
+
+BASE_URL = "https://api.example.com/v1"
+
+
+def _paged_callback(records, page_size, total_key=None, delays=None):
+    """Serve `records` in pages of `page_size`, selected by the 'page' query parameter."""
+    def callback(request):
+        page = int(parse_qs(urlsplit(request.url).query).get("page", ["1"])[0])
+        if delays:
+            time.sleep(delays.get(page, 0))
+        body = {"results": records[(page - 1) * page_size:page * page_size]}
+        if total_key:
+            body[total_key] = len(records)
+        return 200, {}, json.dumps(body)
+
+    return callback
+
+
+def _requested_pages():
+    """Page numbers of the mocked requests, in the order they were sent."""
+    return [int(call.request.params.get("page", 1)) for call in responses.calls]
+
+
+class TestRESTClientGetPaginated:
+    """Tests for RESTClient.get_paginated method."""
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_keeps_fields_missing_from_first_record(self):
+        """Columns are the union of keys across records, not the first record's."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/items",
+            json={"results": [
+                {"id": 1, "name": "a"},
+                {"id": 2, "name": "b", "depth_ft": 12.5},
+                {"id": 3, "status": "active"},
+            ]},
+            status=200,
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items", limit=100)
+
+        assert list(result.columns) == ["id", "name", "depth_ft", "status"]
+        assert result["depth_ft"].tolist()[1] == 12.5
+        assert result["status"].tolist()[2] == "active"
+        assert result["name"].isna().tolist() == [False, False, True]
+
+    @pytest.mark.integration
+    @responses.activate
+    @pytest.mark.parametrize("records, expected", [
+        (["abc", "def"], [["abc"], ["def"]]),
+        ([[1, 2], [3, 4]], [[1, 2], [3, 4]]),
+        ([{"id": 2**64}, {"id": 1}], [[2**64], [1]]),
+    ])
+    def test_pages_arrow_cannot_convert(self, records, expected):
+        """Pages of scalars, lists or out-of-range integers fall back to pandas."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/items",
+            json={"results": records},
+            status=200,
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items", limit=100)
+
+        assert result.values.tolist() == expected
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_concurrent_pages_keep_page_order(self):
+        """Pages fetched concurrently after the first are combined in page order."""
+        records = [{"id": i} for i in range(10)]
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/items",
+            # Earlier pages answer last
+            callback=_paged_callback(records, 3, total_key="count", delays={2: 0.1, 3: 0.05}),
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items", limit=3, total_key="count", max_workers=4)
+
+        assert result["id"].tolist() == list(range(10))
+        assert sorted(_requested_pages()) == [1, 2, 3, 4]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_concurrent_pages_respect_max_pages(self):
+        """Stops at max_pages even when the total reports more data."""
+        records = [{"id": i} for i in range(10)]
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/items",
+            callback=_paged_callback(records, 3, total_key="count"),
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items", limit=3, total_key="count", max_pages=2)
+
+        assert result["id"].tolist() == list(range(6))
+        assert sorted(_requested_pages()) == [1, 2]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_stops_on_short_page(self):
+        """A page shorter than the limit ends pagination."""
+        records = [{"id": i} for i in range(4)]
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/items",
+            callback=_paged_callback(records, 3),
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items", limit=3)
+
+        assert result["id"].tolist() == list(range(4))
+        assert _requested_pages() == [1, 2]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_stops_on_empty_page(self):
+        """An empty page ends pagination."""
+        records = [{"id": i} for i in range(6)]
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/items",
+            callback=_paged_callback(records, 3),
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items", limit=3)
+
+        assert result["id"].tolist() == list(range(6))
+        assert _requested_pages() == [1, 2, 3]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_detects_server_page_size_cap(self):
+        """Keeps paginating with the server's page size when it caps below the limit."""
+        records = [{"id": i} for i in range(5)]
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/items",
+            callback=_paged_callback(records, 2),
+        )
+
+        client = RESTClient(BASE_URL)
+        with pytest.warns(UserWarning, match="page size of 2"):
+            result = client.get_paginated("/items", limit=100)
+
+        assert result["id"].tolist() == list(range(5))
+        assert _requested_pages() == [1, 2, 3]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_server_ignoring_page_param(self):
+        """Stops after the probe when every page repeats the first one."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/items",
+            json={"results": [{"id": 0}, {"id": 1}]},
+            status=200,
+        )
+
+        client = RESTClient(BASE_URL)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = client.get_paginated("/items", limit=100)
+
+        assert result["id"].tolist() == [0, 1]
+        assert _requested_pages() == [1, 2]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_probe_error_means_no_more_data(self):
+        """A server that rejects the page-2 probe still returns the first page."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/items",
+            json={"results": [{"id": 0}, {"id": 1}]},
+            status=200,
+            match=[responses.matchers.query_param_matcher({"limit": "100", "page": "1"})],
+        )
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/items",
+            json={"error": "page out of range"},
+            status=404,
+            match=[responses.matchers.query_param_matcher({"limit": "100", "page": "2"})],
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items", limit=100)
+
+        assert result["id"].tolist() == [0, 1]
+        assert _requested_pages() == [1, 2]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_short_first_page_without_more_data(self):
+        """A short first page followed by an empty probe is the whole result."""
+        records = [{"id": i} for i in range(3)]
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/items",
+            callback=_paged_callback(records, 3),
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items", limit=100)
+
+        assert result["id"].tolist() == [0, 1, 2]
+        assert _requested_pages() == [1, 2]
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_every_page_request_carries_params_and_headers(self):
+        """Each page request keeps the query, page size and auth header, with its own page number."""
+        records = [{"id": i} for i in range(7)]
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/items",
+            callback=_paged_callback(records, 3),
+        )
+
+        client = RESTClient(BASE_URL, api_key="secret")
+        client.get_paginated("/items", params={"state": "MT", "page": 9}, limit=3)
+
+        assert _requested_pages() == [1, 2, 3]
+        for call in responses.calls:
+            assert call.request.params["state"] == "MT"
+            assert call.request.params["limit"] == "3"
+            assert call.request.headers["Authorization"] == "Bearer secret"
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_page_number_appended_to_existing_query(self):
+        """The page number is appended to an endpoint that already has a query string."""
+        records = [{"id": i} for i in range(4)]
+        responses.add_callback(
+            responses.GET,
+            f"{BASE_URL}/items",
+            callback=_paged_callback(records, 3),
+        )
+
+        client = RESTClient(BASE_URL)
+        result = client.get_paginated("/items?format=json", limit=3)
+
+        assert result["id"].tolist() == list(range(4))
+        assert _requested_pages() == [1, 2]
+        assert all(call.request.params["format"] == "json" for call in responses.calls)
+
+
+class TestCSVEndpointClient:
+    """Tests for CSVEndpointClient.get_csv method."""
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_csv_chunked(self):
+        """Chunked reads keep the response open until every chunk is parsed."""
+        body = "id,name\n" + "".join(f"{i},site-{i}\n" for i in range(10))
+        responses.add(responses.GET, f"{BASE_URL}/sites.csv", body=body, status=200)
+
+        client = CSVEndpointClient(BASE_URL)
+        chunks = client.get_csv("/sites.csv", chunksize=4)
+        assert len(responses.calls) == 0
+
+        chunks = list(chunks)
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert pd.concat(chunks)["id"].tolist() == list(range(10))
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_csv(self):
+        """Without chunksize the whole body is returned as one DataFrame."""
+        responses.add(
+            responses.GET, f"{BASE_URL}/sites.csv", body="id,name\n1,a\n2,b\n", status=200
+        )
+
+        client = CSVEndpointClient(BASE_URL)
+        result = client.get_csv("/sites.csv")
+
+        assert result["id"].tolist() == [1, 2]
+
+    @pytest.mark.integration
+    @responses.activate
+    @pytest.mark.parametrize("read_csv_kwargs, expected_ids", [
+        ({"nrows": 2}, [0, 1]),
+        ({"skipfooter": 1}, [0, 1, 2]),
+        ({"skiprows": lambda i: i == 2}, [0, 2, 3]),
+    ])
+    def test_get_csv_options_unsupported_by_pyarrow(self, read_csv_kwargs, expected_ids):
+        """Options the pyarrow engine rejects fall back to pandas' own engine choice."""
+        body = "id,name\n" + "".join(f"{i},site-{i}\n" for i in range(4))
+        responses.add(responses.GET, f"{BASE_URL}/sites.csv", body=body, status=200)
+
+        client = CSVEndpointClient(BASE_URL)
+        result = client.get_csv("/sites.csv", **read_csv_kwargs)
+
+        assert result["id"].tolist() == expected_ids
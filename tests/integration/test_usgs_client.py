@@ -4,8 +4,12 @@ Integration tests for USGS Water Services client.
 Uses HTTP response mocking to test API client behavior.
 """
 
+import copy
+import json
+
 import pytest
 import responses
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
@@ -201,6 +205,93 @@ class TestUSGSWaterServicesTimeSeries:
 
         assert 'qualifiers' in result.columns
 
+    @pytest.mark.integration
+    @responses.activate
+    def test_get_instantaneous_values_batch(self, mock_usgs_json_response):
+        """Splits batched retrievals into one request per parameter and site group."""
+        responses.add(
+            responses.GET,
+            "https://waterservices.usgs.gov/nwis/iv/",
+            json=mock_usgs_json_response,
+            status=200,
+        )
+
+        client = USGSWaterServices(max_workers=4)
+        single = client.get_instantaneous_values(
+            sites=["09380000"],
+            parameter_codes=["00060"],
+            period="P1D",
+        )
+        result = client.get_instantaneous_values_batch(
+            sites=["09380000", "09380001", "09380002"],
+            parameter_codes=["00060", "00065"],
+            period="P1D",
+            sites_per_request=2,
+        )
+
+        # 1 single request + 2 parameters x 2 site groups
+        assert len(responses.calls) == 5
+        assert len(result) == 4 * len(single)
+        params = [call.request.params for call in responses.calls[1:]]
+        assert sorted(p['sites'] for p in params) == [
+            "09380000,09380001", "09380000,09380001", "09380002", "09380002",
+        ]
+        assert all(p['parameterCd'] in ("00060", "00065") for p in params)
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_batch_keeps_dtypes_across_responses(self, mock_usgs_json_response):
+        """Responses with different offsets and codes still concatenate to UTC and categories."""
+        gage = copy.deepcopy(mock_usgs_json_response)
+        series = gage["value"]["timeSeries"][0]
+        series["variable"]["variableCode"][0]["value"] = "00065"
+        series["variable"]["unit"]["unitCode"] = "ft"
+        series["values"][0]["value"] = [
+            {"dateTime": "2024-01-01T00:00:00.000-06:00", "value": "3.1", "qualifiers": ["P"]},
+        ]
+        bodies = {"00060": mock_usgs_json_response, "00065": gage}
+        responses.add_callback(
+            responses.GET,
+            "https://waterservices.usgs.gov/nwis/iv/",
+            callback=lambda request: (200, {}, json.dumps(bodies[request.params["parameterCd"]])),
+        )
+
+        client = USGSWaterServices(max_workers=2)
+        result = client.get_instantaneous_values_batch(
+            sites=["09380000"],
+            parameter_codes=["00060", "00065"],
+            period="P1D",
+        )
+
+        assert str(result['datetime'].dt.tz) == "UTC"
+        assert result['datetime'].iloc[-1] == pd.Timestamp("2024-01-01T06:00:00", tz="UTC")
+        for col in (*USGSWaterServices.CATEGORICAL_COLUMNS, 'qualifiers'):
+            assert isinstance(result[col].dtype, pd.CategoricalDtype)
+        assert set(result['unit']) == {"ft3/s", "ft"}
+        assert set(result['qualifiers']) == {"A", "P"}
+
+    @pytest.mark.integration
+    @responses.activate
+    def test_numeric_columns_are_float32(self, mock_usgs_json_response):
+        """Values and coordinates are stored as float32."""
+        responses.add(
+            responses.GET,
+            "https://waterservices.usgs.gov/nwis/iv/",
+            json=mock_usgs_json_response,
+            status=200,
+        )
+
+        client = USGSWaterServices()
+        result = client.get_instantaneous_values(
+            sites=["09380000"],
+            parameter_codes=["00060"],
+            period="P1D",
+        )
+
+        for col in ('value', 'latitude', 'longitude'):
+            assert result[col].dtype == np.float32
+        assert result['value'].tolist() == [500.0, 520.0, 510.0]
+
 
 class TestUSGSWaterServicesConvenienceMethods:
     """Tests for convenience methods."""
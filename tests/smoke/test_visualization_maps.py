@@ -102,6 +102,26 @@ class TestPointMap:
         m = point_map(df)
         assert m is not None
 
+    @pytest.mark.smoke
+    def test_point_map_max_points(self, sample_water_data):
+        """Subsamples markers beyond max_points."""
+        m = point_map(sample_water_data, color_col='category', max_points=10)
+        kept, total = m._sampled
+        assert kept <= 10 + sample_water_data['category'].nunique()
+        assert total == len(sample_water_data.dropna(subset=['latitude', 'longitude']))
+        assert f"<!-- sampled {kept}/{total} -->" in m.get_root().render()
+
+    @pytest.mark.smoke
+    def test_point_map_bounds(self, sample_water_data):
+        """Drops points outside the given bounds."""
+        bounds = [[37.0, -113.0], [39.0, -109.0]]
+        inside = sample_water_data[
+            sample_water_data['latitude'].between(37.0, 39.0)
+            & sample_water_data['longitude'].between(-113.0, -109.0)
+        ]
+        m = point_map(sample_water_data, bounds=bounds)
+        assert m._sampled == (len(inside), len(inside))
+
 
 class TestChoroplethMap:
     """Smoke tests for choropleth_map function."""
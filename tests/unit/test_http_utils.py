@@ -0,0 +1,73 @@
+"""
+Unit tests for HTTP session utilities.
+
+Tests request rate limiting.
+"""
+
+import pytest
+
+from scripts.data_retrieval import http_utils
+from scripts.data_retrieval.http_utils import RateLimiter
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the limiter's clock with one that only advances while sleeping."""
+    clock = {"now": 100.0}
+
+    def sleep(seconds):
+        clock["now"] += seconds
+
+    monkeypatch.setattr(http_utils.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(http_utils.time, "sleep", sleep)
+    return clock
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter token bucket."""
+
+    @pytest.mark.unit
+    def test_burst_then_spaced(self, fake_clock):
+        """Allows `burst` requests back to back, then one per interval."""
+        limiter = RateLimiter(min_interval=1.0, burst=3)
+
+        times = []
+        for _ in range(6):
+            limiter.acquire()
+            times.append(fake_clock["now"] - 100.0)
+
+        assert times == [0.0, 0.0, 0.0, 1.0, 2.0, 3.0]
+
+    @pytest.mark.unit
+    def test_burst_refills_after_idle(self, fake_clock):
+        """An idle period lets a new burst through without waiting."""
+        limiter = RateLimiter(min_interval=1.0, burst=2)
+        for _ in range(3):
+            limiter.acquire()
+        assert fake_clock["now"] == 101.0
+
+        fake_clock["now"] += 10.0
+        limiter.acquire()
+        limiter.acquire()
+        assert fake_clock["now"] == 111.0
+
+    @pytest.mark.unit
+    def test_default_burst_spaces_every_request(self, fake_clock):
+        """With burst=1 every request after the first waits a full interval."""
+        limiter = RateLimiter(min_interval=0.5)
+
+        times = []
+        for _ in range(3):
+            limiter.acquire()
+            times.append(fake_clock["now"] - 100.0)
+
+        assert times == [0.0, 0.5, 1.0]
+
+    @pytest.mark.unit
+    def test_zero_interval_never_sleeps(self, fake_clock):
+        """min_interval=0 disables limiting."""
+        limiter = RateLimiter(min_interval=0.0, burst=1)
+        for _ in range(5):
+            limiter.acquire()
+
+        assert fake_clock["now"] == 100.0
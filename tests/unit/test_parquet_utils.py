@@ -109,6 +109,78 @@ class TestSaveLoadParquet:
         loaded = load_parquet('gzip_test', data_dir=temp_data_dir)
         assert len(loaded) == len(sample_water_data)
 
+    @pytest.mark.unit
+    def test_recreates_deleted_output_dir(self, sample_water_data, sample_geodataframe, temp_data_dir):
+        """Saving into an output directory removed since the last save recreates it."""
+        import shutil
+
+        out_dir = temp_data_dir / 'run_output'
+        save_parquet(sample_water_data, 'flat', data_dir=out_dir)
+        shutil.rmtree(out_dir)
+        assert save_parquet(sample_water_data, 'flat', data_dir=out_dir).exists()
+
+        shutil.rmtree(out_dir)
+        partitioned = save_parquet(
+            sample_water_data, 'parts', data_dir=out_dir, partition_cols=['category']
+        )
+        assert partitioned.is_dir()
+
+        shutil.rmtree(out_dir)
+        assert save_geoparquet(sample_geodataframe, 'geo', data_dir=out_dir).exists()
+
+    @pytest.mark.unit
+    def test_default_compression_zstd(self, sample_water_data, temp_data_dir):
+        """Files are zstd-compressed by default."""
+        import pyarrow.parquet as pq
+
+        path = save_parquet(sample_water_data, 'zstd_test', data_dir=temp_data_dir)
+        column = pq.ParquetFile(path).metadata.row_group(0).column(0)
+        assert column.compression == 'ZSTD'
+
+    @pytest.mark.unit
+    def test_column_encoding(self, temp_data_dir):
+        """Per-column encodings are applied and roundtrip."""
+        import pyarrow.parquet as pq
+
+        df = pd.DataFrame({
+            'datetime': pd.date_range('2024-01-01', periods=100, freq='h'),
+            'value': np.linspace(0.0, 1.0, 100),
+            'site_id': ['SITE001'] * 100,
+        })
+        path = save_parquet(
+            df, 'encoding_test', data_dir=temp_data_dir,
+            column_encoding={'value': 'BYTE_STREAM_SPLIT'},
+        )
+        encodings = pq.ParquetFile(path).metadata.row_group(0).column(1).encodings
+        assert 'BYTE_STREAM_SPLIT' in encodings
+
+        loaded = load_parquet('encoding_test', data_dir=temp_data_dir)
+        pd.testing.assert_frame_equal(loaded, df)
+
+    @pytest.mark.unit
+    def test_auto_downcast(self, temp_data_dir):
+        """auto_downcast stores float64 columns as float32."""
+        df = pd.DataFrame({
+            'value': [1.5, 2.25, np.nan],
+            'precise': [0.1, 123456.789, np.inf],
+            'count': [1, 2, 3],
+        })
+        save_parquet(df, 'downcast_test', data_dir=temp_data_dir, auto_downcast=True)
+        loaded = load_parquet('downcast_test', data_dir=temp_data_dir)
+
+        assert loaded['value'].dtype == np.float32
+        assert loaded['precise'].dtype == np.float32
+        assert loaded['count'].dtype == np.int64
+        assert df['value'].dtype == np.float64
+
+    @pytest.mark.unit
+    def test_auto_downcast_rejects_overflow(self, temp_data_dir):
+        """Values beyond float32's range raise instead of silently changing the schema."""
+        df = pd.DataFrame({'value': [1.0, 2.0], 'huge': [1e300, 1.0]})
+        with pytest.raises(ValueError, match="huge"):
+            save_parquet(df, 'overflow_test', data_dir=temp_data_dir, auto_downcast=True)
+        assert not (temp_data_dir / 'overflow_test.parquet').exists()
+
     @pytest.mark.unit
     def test_timestamp_in_filename(self, sample_water_data, temp_data_dir):
         """Timestamp can be added to filename."""
@@ -152,6 +224,19 @@ class TestSaveLoadParquet:
         # With year partitions
         assert (path / 'year=2023').exists() or list(path.glob('**/year=2023'))
 
+    @pytest.mark.unit
+    def test_partitioned_resave_replaces_partitions(self, temp_data_dir):
+        """Saving a partitioned dataset again replaces rather than appends."""
+        df = pd.DataFrame({
+            'value': [1, 2, 3, 4],
+            'year': [2023, 2023, 2024, 2024],
+        })
+        save_parquet(df, 'resave_test', data_dir=temp_data_dir, partition_cols=['year'])
+        save_parquet(df, 'resave_test', data_dir=temp_data_dir, partition_cols=['year'])
+
+        loaded = load_parquet('resave_test', data_dir=temp_data_dir)
+        assert len(loaded) == len(df)
+
     @pytest.mark.unit
     def test_creates_parent_directories(self, temp_data_dir):
         """Creates parent directories if they don't exist."""
@@ -238,6 +323,20 @@ class TestListDatasets:
         assert 'modified' in datasets[0]
         assert isinstance(datasets[0]['modified'], datetime)
 
+    @pytest.mark.unit
+    def test_lists_partitioned_datasets(self, temp_data_dir):
+        """Partitioned directories are listed with their total size."""
+        df = pd.DataFrame({'value': [1, 2, 3, 4], 'year': [2023, 2023, 2024, 2024]})
+        path = save_parquet(df, 'partitioned', data_dir=temp_data_dir, partition_cols=['year'])
+        (temp_data_dir / 'empty_dir').mkdir()
+
+        datasets = {d['name']: d for d in list_datasets(data_dir=temp_data_dir)}
+
+        assert 'empty_dir' not in datasets
+        assert datasets['partitioned']['partitioned'] is True
+        expected_size = sum(f.stat().st_size for f in path.glob('**/*.parquet'))
+        assert datasets['partitioned']['size_mb'] == expected_size / (1024 * 1024)
+
 
 class TestParquetInfo:
     """Tests for parquet_info function."""
@@ -0,0 +1,147 @@
+"""
+Unit tests for the sample data cache.
+
+Tests cache hits, invalidation and the on-disk layout of get_or_generate.
+"""
+
+import json
+
+import pytest
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from scripts.data_retrieval import sample_data
+from scripts.data_retrieval.sample_data import get_or_generate
+
+
+@pytest.fixture
+def sample_dir(temp_data_dir, monkeypatch):
+    """Point the sample cache at a temporary directory."""
+    monkeypatch.setattr(sample_data, "SAMPLE_DATA_DIR", temp_data_dir / "sample")
+    return temp_data_dir / "sample"
+
+
+@pytest.fixture
+def counting_generator():
+    """Generator that records every call it receives."""
+    calls = []
+
+    def generate(n: int = 3, state_cd: str = "CO", transform=None):
+        calls.append({"n": n, "state_cd": state_cd})
+        return pd.DataFrame({
+            "site_no": [f"{i:08d}" for i in range(n)],
+            "state_cd": [state_cd] * n,
+            "value": [float(i) for i in range(n)],
+        })
+
+    generate.calls = calls
+    return generate
+
+
+class TestGetOrGenerateCache:
+    """Tests for get_or_generate cache keys."""
+
+    @pytest.mark.unit
+    def test_cache_hit(self, sample_dir, counting_generator):
+        """A second call with the same kwargs reads the cache instead of generating."""
+        first = get_or_generate("sites", counting_generator, n=4)
+        second = get_or_generate("sites", counting_generator, n=4)
+
+        assert len(counting_generator.calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    @pytest.mark.unit
+    def test_changed_kwargs_invalidate(self, sample_dir, counting_generator):
+        """Different kwargs are cached separately."""
+        get_or_generate("sites", counting_generator, n=4)
+        other = get_or_generate("sites", counting_generator, n=5)
+        get_or_generate("sites", counting_generator, n=4)
+
+        assert len(counting_generator.calls) == 2
+        assert len(other) == 5
+        assert len(list((sample_dir / "sites").glob("part_*.parquet"))) == 2
+
+    @pytest.mark.unit
+    def test_force_regenerate(self, sample_dir, counting_generator):
+        """force_regenerate bypasses a cached part."""
+        get_or_generate("sites", counting_generator, n=4)
+        get_or_generate("sites", counting_generator, force_regenerate=True, n=4)
+
+        assert len(counting_generator.calls) == 2
+
+    @pytest.mark.unit
+    def test_unpicklable_kwargs(self, sample_dir, counting_generator):
+        """Kwargs that cannot be pickled still produce a cache key."""
+        transform = lambda df: df  # noqa: E731
+
+        first = get_or_generate("sites", counting_generator, n=2, transform=transform)
+        get_or_generate("sites", counting_generator, n=2, transform=transform)
+
+        assert len(first) == 2
+        assert len(counting_generator.calls) == 1
+
+    @pytest.mark.unit
+    def test_cached_part_is_zstd_with_categoricals(self, sample_dir, counting_generator):
+        """Parts are zstd-compressed and repeated code columns come back as categoricals."""
+        get_or_generate("sites", counting_generator, n=4)
+        cached = get_or_generate("sites", counting_generator, n=4)
+
+        part = next((sample_dir / "sites").glob("part_*.parquet"))
+        column = pq.ParquetFile(part).metadata.row_group(0).column(1)
+        assert column.compression == "ZSTD"
+        assert isinstance(cached["state_cd"].dtype, pd.CategoricalDtype)
+        assert not isinstance(cached["site_no"].dtype, pd.CategoricalDtype)
+
+
+class TestGetOrGenerateLayout:
+    """Tests for the per-dataset part files and read-back options."""
+
+    @pytest.mark.unit
+    def test_parts_and_manifest(self, sample_dir, counting_generator):
+        """Each kwargs combination is one part file recorded in _manifest.json."""
+        get_or_generate("sites", counting_generator, n=2, state_cd="CO")
+        get_or_generate("sites", counting_generator, n=3, state_cd="UT")
+
+        dataset_dir = sample_dir / "sites"
+        parts = sorted(p.name for p in dataset_dir.glob("part_*.parquet"))
+        manifest = json.loads((dataset_dir / "_manifest.json").read_text())
+
+        assert len(parts) == 2
+        assert sorted(manifest) == parts
+        assert sorted(entry["state_cd"] for entry in manifest.values()) == ["CO", "UT"]
+        assert {entry["n"] for entry in manifest.values()} == {"2", "3"}
+
+    @pytest.mark.unit
+    def test_columns_and_filters(self, sample_dir, counting_generator):
+        """columns and filters select from the part, on generation and on a cache hit."""
+        options = {"columns": ["site_no", "value"], "filters": pc.field("value") >= 2}
+        generated = get_or_generate("sites", counting_generator, n=4, **options)
+        cached = get_or_generate("sites", counting_generator, n=4, **options)
+
+        for result in (generated, cached):
+            assert list(result.columns) == ["site_no", "value"]
+            assert result["value"].tolist() == [2.0, 3.0]
+        assert len(counting_generator.calls) == 1
+
+    @pytest.mark.unit
+    def test_reserved_names_not_passed_to_generator(self, sample_dir, counting_generator):
+        """columns and filters do not take part in the cache key or reach the generator."""
+        get_or_generate("sites", counting_generator, n=4)
+        subset = get_or_generate("sites", counting_generator, n=4, columns=["site_no"])
+
+        assert len(counting_generator.calls) == 1
+        assert list(subset.columns) == ["site_no"]
+
+    @pytest.mark.unit
+    def test_load_sample_data_reads_all_parts(self, sample_dir, counting_generator):
+        """load_sample_data combines every cached variant of a dataset."""
+        get_or_generate("sites", counting_generator, n=2, state_cd="CO")
+        get_or_generate("sites", counting_generator, n=3, state_cd="UT")
+
+        everything = sample_data.load_sample_data("sites")
+        utah = sample_data.load_sample_data("sites", filters=pc.field("state_cd") == "UT")
+
+        assert len(everything) == 5
+        assert len(utah) == 3
+        assert sample_data.load_sample_data("missing").empty
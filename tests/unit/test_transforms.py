@@ -124,6 +124,19 @@ class TestStandardizeDates:
         assert pd.api.types.is_datetime64_any_dtype(result['datetime'])
         assert pd.api.types.is_datetime64_any_dtype(result['created_at'])
 
+    @pytest.mark.unit
+    def test_auto_detect_matches_whole_words(self):
+        """Auto-detection matches date words, not substrings of other words."""
+        df = pd.DataFrame({
+            'ActivityStartDate': ['2024-01-01'],
+            'channel_width': [12.5],
+            'runtime_minutes': [30],
+        })
+        result = standardize_dates(df)
+        assert pd.api.types.is_datetime64_any_dtype(result['ActivityStartDate'])
+        assert result['channel_width'].iloc[0] == 12.5
+        assert result['runtime_minutes'].iloc[0] == 30
+
     @pytest.mark.unit
     def test_explicit_date_columns(self):
         """Processes explicitly specified date columns."""
@@ -148,6 +161,16 @@ class TestStandardizeDates:
         for col in ['date1', 'date2', 'date3', 'date4']:
             assert pd.api.types.is_datetime64_any_dtype(result[col])
 
+    @pytest.mark.unit
+    def test_mixed_formats_in_one_column(self):
+        """Values not matching the first value's format are still parsed, with a warning."""
+        df = pd.DataFrame({'date': ['2024-01-01', '01/15/2024', 'January 20, 2024']})
+        with pytest.warns(UserWarning, match="2 values in column 'date' do not match"):
+            result = standardize_dates(df, date_columns=['date'])
+        assert result['date'].tolist() == [
+            pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-15'), pd.Timestamp('2024-01-20')
+        ]
+
     @pytest.mark.unit
     def test_output_format_string(self):
         """Converts to specified output format."""
@@ -257,6 +280,16 @@ class TestStandardizeCoordinates:
         assert pd.isna(result['latitude'].iloc[1])
         assert pd.isna(result['longitude'].iloc[2])
 
+    @pytest.mark.unit
+    def test_does_not_modify_original(self, capsys):
+        """Invalid coordinates are masked in the result only."""
+        df = pd.DataFrame({'latitude': [39.5, 95.0], 'longitude': [-105.0, -200.0]})
+        result = standardize_coordinates(df)
+        assert pd.isna(result['latitude'].iloc[1])
+        assert pd.isna(result['longitude'].iloc[1])
+        assert df['latitude'].iloc[1] == 95.0
+        assert df['longitude'].iloc[1] == -200.0
+
 
 class TestConvertUnits:
     """Tests for convert_units function."""
@@ -375,6 +408,14 @@ class TestHandleMissingValues:
         result = handle_missing_values(df, strategy='fill')
         assert result['name'].iloc[1] == 'Unknown'
 
+    @pytest.mark.unit
+    def test_fill_categorical_with_unknown(self):
+        """Fill categorical columns with 'Unknown', adding the category."""
+        df = pd.DataFrame({'site_code': pd.Series(['a', None, 'a'], dtype='category')})
+        result = handle_missing_values(df, strategy='fill')
+        assert result['site_code'].iloc[1] == 'Unknown'
+        assert isinstance(result['site_code'].dtype, pd.CategoricalDtype)
+
     @pytest.mark.unit
     def test_interpolate_strategy(self):
         """Interpolate strategy for time series."""
@@ -393,6 +434,14 @@ class TestHandleMissingValues:
         assert pd.isna(result['keep_missing'].iloc[1])
         assert result['process_this'].iloc[1] == 0
 
+    @pytest.mark.unit
+    def test_does_not_modify_original(self):
+        """Original DataFrame keeps its missing values."""
+        df = pd.DataFrame({'value': [1.0, None, 3.0], 'name': ['a', None, 'c']})
+        handle_missing_values(df, strategy='fill')
+        assert pd.isna(df['value'].iloc[1])
+        assert pd.isna(df['name'].iloc[1])
+
 
 class TestNormalizeWaterData:
     """Tests for normalize_water_data convenience function."""